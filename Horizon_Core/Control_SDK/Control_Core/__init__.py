@@ -38,12 +38,13 @@ ZDTMotorController.y42_sync_position(controllers, targets, speed=500)
 
 import logging
 
+from ._lazy import make_getattr
+
 __version__ = "2.0.0"  # UCP硬件保护版本
 __author__ = "Horizon Arm Team"
 
 # ==================== 向后兼容层（旧API） ====================
-# 保留现有的ZDTMotorController，确保旧代码仍然可用
-from .motor_controller_ucp_simple import ZDTMotorController
+# 保留现有的ZDTMotorController，确保旧代码仍然可用（按需导入，见文件末尾 _LAZY_EXPORTS）
 
 # 导入命令构建器（供Embodied_SDK等高层SDK使用）
 from .command_builder_compat import ZDTCommandBuilder
@@ -52,29 +53,19 @@ from .command_builder_compat import ZDTCommandBuilder
 # 导入接口定义
 from .interfaces import MotorControllerInterface, ProtocolInterface
 
-# 导入协议实现
-from .protocols import UcpProtocol
-
-# 导入驱动适配器
-from .drivers import ZDTDriverAdapter
+# 协议实现（UcpProtocol）与驱动适配器（ZDTDriverAdapter）按需导入，见文件末尾 __getattr__
 
 # 导入工厂和管理器
 from .motor_factory import (
     DriverManager,
     create_motor_controller as _create_motor_controller_new,
     register_motor_driver,
+    register_protocol,
     set_default_motor_driver,
 )
 
 # ==================== UCP SDK组件 ====================
-from .ucp_sdk import (
-    UcpClient,
-    UcpResponse,
-    StandardMotorData,
-    NativeMotorData,
-    opcodes,
-    constants
-)
+# UcpClient 等同样按需导入（见文件末尾 _LAZY_EXPORTS）
 
 # ==================== 错误处理模块 ====================
 from .error_handler import MotorLogger, MotorError, analyze_serial_exception, format_error_for_ui
@@ -101,6 +92,7 @@ __all__ = [
     # 新架构（工厂和管理器）
     "DriverManager",
     "register_motor_driver",
+    "register_protocol",
     "set_default_motor_driver",
     
     # UCP SDK组件
@@ -177,6 +169,7 @@ def create_motor_controller(motor_id: int, port: str = "COM31", baudrate: int =
         )
     
     # 否则使用旧模式（向后兼容）
+    from .motor_controller_ucp_simple import ZDTMotorController
     kwargs.pop('interface_type', None)  # 忽略旧的SLCAN参数
     kwargs.pop('shared_interface', None)
     return ZDTMotorController(motor_id=motor_id, port=port, baudrate=baudrate, **kwargs)
@@ -243,3 +236,20 @@ def check_dependencies():
     
     print("\n✓ UCP模式不需要python-can库")
     print("✓ 所有依赖检查完成")
+
+# ==================== 按需导入的导出项（PEP 562） ====================
+# 控制器与 UCP SDK 会连带导入 pyserial/numpy，只有首次访问时才加载，
+# 仅使用工厂/接口/错误处理等的调用方（如 gateway）不再为此付出启动开销
+_LAZY_EXPORTS = {
+    "ZDTMotorController": ".motor_controller_ucp_simple",
+    "UcpClient": ".ucp_sdk",
+    "UcpResponse": ".ucp_sdk",
+    "StandardMotorData": ".ucp_sdk",
+    "NativeMotorData": ".ucp_sdk",
+    "opcodes": ".ucp_sdk",
+    "constants": ".ucp_sdk",
+    "UcpProtocol": ".protocols",
+    "ZDTDriverAdapter": ".drivers",
+}
+
+__getattr__ = make_getattr(_LAZY_EXPORTS, __name__)
@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+"""
+包级按需导入（PEP 562）的公共实现
+
+各包在 __init__ 中声明 {导出名: 相对模块} 表，再用 make_getattr 生成模块级 __getattr__：
+导出项在首次访问时才导入对应模块，之后缓存到包的命名空间，不再经过 __getattr__。
+"""
+
+import importlib
+import sys
+from typing import Callable, Dict
+
+
+def make_getattr(exports: Dict[str, str], package: str) -> Callable[[str], object]:
+    """
+    生成包的模块级 __getattr__
+
+    Args:
+        exports: {导出名: 相对模块名}，如 {'UcpProtocol': '.ucp_protocol'}
+        package: 包名（传入包的 __name__）
+
+    Returns:
+        可直接赋值给包 __getattr__ 的函数
+    """
+    def __getattr__(name):
+        module_name = exports.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module_name, package), name)
+        setattr(sys.modules[package], name, value)
+        return value
+
+    return __getattr__
@@ -6,9 +6,16 @@
 每个适配器实现MotorControllerInterface接口，提供统一的API。
 """
 
-from .zdt_driver import ZDTDriverAdapter
+from .._lazy import make_getattr
+
+# 驱动适配器按需导入（PEP 562）：只加载实际使用的驱动
+_LAZY_EXPORTS = {
+    'ZDTDriverAdapter': '.zdt_driver',
+}
 
 __all__ = [
     'ZDTDriverAdapter',
 ]
 
+__getattr__ = make_getattr(_LAZY_EXPORTS, __name__)
+
@@ -30,7 +30,7 @@ class ModbusProtocol(ProtocolInterface):
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Optional
+from typing import Any, List, Optional, Sequence
 
 
 class ProtocolInterface(ABC):
@@ -72,4 +72,21 @@ class ProtocolInterface(ABC):
             响应对象（具体类型由协议决定）
         """
         pass
+    
+    def request_batch(self, motor_id: int, commands: Sequence[Any],
+                      timeout_ms: int = 1500) -> List[Any]:
+        """
+        对同一电机依次发送一组无参数请求（如状态刷新时的多项读取）
+        
+        默认实现逐个调用 request()；协议支持批量收发时可覆盖以减少往返次数。
+        
+        Args:
+            motor_id: 电机ID
+            commands: 命令码列表
+            timeout_ms: 单个请求的超时时间（毫秒）
+            
+        Returns:
+            与 commands 一一对应的响应对象列表
+        """
+        return [self.request(motor_id, command, b"", timeout_ms) for command in commands]
 
@@ -7,19 +7,165 @@ ZDT电机控制器 - UCP
 import struct
 import time
 import os
+import threading
 import logging
 import traceback
 import json
-from collections import Counter
-from dataclasses import dataclass
-from typing import Optional, Any, List, Tuple
+import copy
+from collections import Counter, namedtuple
+from contextlib import contextmanager
+from dataclasses import dataclass, fields
+from functools import lru_cache
+from typing import Optional, Any, List, Sequence, Tuple, Union
 from types import SimpleNamespace
 
+import numpy as np
+
 # 导入内部UCP SDK
-from .ucp_sdk import UcpClient, UcpResponse, NativeMotorData, opcodes
+from .ucp_sdk import UcpClient, UcpResponse, get_native_parser, opcodes
 from .ucp_connection_pool import UcpConnectionPool
 
 
+# UCP 运动/控制命令 args（小端）。多机 Pre-load 同步已禁用，入口处 multi_sync 为真会直接抛错，
+# 因此各命令末尾的 multi_sync 字节恒为 0。
+_S_POS_DIRECT = struct.Struct("<iHBB")        # 位置×10, 速度×10, is_absolute, multi_sync
+_S_POS_TRAPEZOID = struct.Struct("<iHHHBB")   # 位置×10, 速度×10, 加速度, 减速度, is_absolute, multi_sync
+_S_SPEED = struct.Struct("<hHB")              # 速度×10, 加速度, multi_sync
+_S_TORQUE = struct.Struct("<hHB")             # 电流, 斜率, multi_sync
+_S_HOMING = struct.Struct("<BB")              # 回零模式, multi_sync
+_ARGS_ENABLE = b"\x01\x00"                    # enabled=1, multi_sync=0
+_ARGS_DISABLE = b"\x00\x00"                   # enabled=0, multi_sync=0
+_ARGS_STOP = b"\x00"                          # multi_sync=0
+
+# Y42 位置子命令（大端序）：motor_id(1B) + FB + Dir(1B) + Speed(2B) + Position(4B) + Abs/Rel(1B) + Sync(1B) + 6B
+# 模板预填常量字节（FB / Sync=0 / 6B），逐电机只需 pack_into 前 10 字节的可变字段
+_Y42_POS_TEMPLATE = b"\x00\xFB" + bytes(8) + b"\x00\x6B"
+_Y42_POS_PATCH = struct.Struct(">BBBHIB")     # motor_id, FB, Dir, Speed, Position, Abs/Rel
+# Y42 位置子命令的 numpy 结构化布局（与 _Y42_POS_TEMPLATE 逐字节一致，无对齐填充）：
+# 目标为 ndarray 时整批字段向量化赋值，再 tobytes() 一次得到全部子命令
+_Y42_POS_DTYPE = np.dtype([
+    ("motor_id", "u1"), ("func", "u1"), ("dir", "u1"), ("speed", ">u2"),
+    ("pos", ">u4"), ("abs", "u1"), ("sync", "u1"), ("tail", "u1"),
+])
+# Y42 速度子命令（大端序）：motor_id(1B) + F6 + Dir(1B) + Accel(2B) + Speed(2B) + Sync(1B) + 6B
+_Y42_SPEED_SUB = struct.Struct(">BBBHHBB")
+# Y42 使能子命令（大端序）：motor_id(1B) + F3 + Enabled(1B) + Sync(1B) + 6B
+_Y42_ENABLE_SUB = struct.Struct(">BBBBB")
+# Y42 帧头（UCP args 开头）：expected_response_motor_id(1B) + AA + 长度(2B BE)
+_Y42_HEAD = struct.Struct(">BBH")
+
+# ZDT 命令体（不含 motor_id，供 command_builder 兼容层使用，大端序）
+_ZDT_POS_BODY = struct.Struct(">BBHIBBB")     # FB + Dir + Speed + Position + Abs/Rel + Sync + 6B
+_ZDT_SPEED_BODY = struct.Struct(">BBHHBB")    # F6 + Dir + Accel + Speed + Sync + 6B
+_ZDT_HOMING_BODY = struct.Struct(">BBBB")     # 9A + Mode + Sync + 6B
+
+
+# 命令体按量化后的整数参数缓存：UI/流式控制常反复下发相同设定值（0.1° / 0.1RPM 精度），直接复用字节串
+@lru_cache(maxsize=256)
+def _zdt_pos_body(direction: int, spd_val: int, pos_val: int, abs_flag: int) -> bytes:
+    return _ZDT_POS_BODY.pack(0xFB, direction, spd_val, pos_val, abs_flag, 0, 0x6B)
+
+
+@lru_cache(maxsize=256)
+def _zdt_speed_body(direction: int, acc_val: int, spd_val: int) -> bytes:
+    return _ZDT_SPEED_BODY.pack(0xF6, direction, acc_val, spd_val, 0, 0x6B)
+
+
+# 回零参数回包：15B 为 ZDT 原始字段（大端），8B 为旧实现兼容格式（小端；修改参数的旧格式兜底也复用它）
+_S_HOMING_PARAMS_15 = struct.Struct(">BBHIHHHB")   # mode, direction, speed, timeout_ms, coll_speed, coll_current, coll_time, auto
+_S_HOMING_PARAMS_LEGACY = struct.Struct("<BBHHh")  # mode, direction, speed×10, timeout, current_threshold
+# 修改回零参数（0x50）16B 固件格式（小端）：save + 上述 8 个字段
+_S_HOMING_WRITE16 = struct.Struct("<BBBHIHHHB")
+
+# 回零参数读取失败时的回退值（模块级模板，对外返回时一律 copy.copy，避免调用方改写共享默认值）
+_DEFAULT_HOMING_PARAMS = SimpleNamespace(
+    mode=4,
+    direction=0,
+    speed=50.0,
+    timeout=30,
+    current_threshold=1000,
+    collision_detection_speed=50,
+    collision_detection_current=500,
+    collision_detection_time=100,
+    auto_homing_enabled=False
+)
+_DEFAULT_HOMING_PARAMS_RAW = _S_HOMING_PARAMS_LEGACY.pack(4, 0, 500, 30, 1000)
+
+# Y42 批量合帧的暂存区（按线程隔离）：y42_batch_begin() 后 staged=[(ctrl, 子命令payload), ...]
+_Y42_BATCH_LOCAL = threading.local()
+# 合帧后整条 UCP args 的上限（与轨迹批量上传的 args<=492B 经验上限一致）
+_Y42_BATCH_MAX_ARGS = 492
+
+# Y42 多机聚合命令 opcode（模块级常量：热路径上省去 opcodes 模块属性查找）
+_Y42_OP = opcodes.Y42_MULTI_MOTOR
+
+# 需要在下发前做关节限位检查的 opcode（位置类命令）
+_LIMIT_CHECKED_OPCODES = frozenset({opcodes.POSITION_DIRECT, opcodes.POSITION_TRAPEZOID, _Y42_OP})
+# 关节限位检查从该角度数起改用 numpy 向量化；更少时逐个比较（建数组的固定开销高于比较本身）
+_LIMIT_CHECK_NUMPY_MIN = 16
+# 只读类操作码：不会改变电机状态，下发时无需让状态快照失效（其余操作码一律视为可能改变状态）
+_READ_ONLY_OPCODES = frozenset(
+    [v for k, v in vars(opcodes).items() if k.startswith("READ_") and isinstance(v, int)]
+    + [opcodes.TRAJECTORY_STATUS]
+)
+
+# 读取类回包中的定宽整数（小端），unpack_from 直接按偏移读，无需切片
+_S_U16_LE = struct.Struct("<H")
+_S_I32_LE = struct.Struct("<i")
+_S_U32_BE = struct.Struct(">I")
+_S_PID_I32X4 = struct.Struct("<iiii")          # trapezoid_kp, direct_kp, speed_kp, speed_ki
+_S_PID_F32X3 = struct.Struct("<fff")           # 旧占位：kp, ki, kd
+_S_RES_IND = struct.Struct("<ff")              # resistance, inductance
+
+# 轨迹点（对齐固件 TrajectoryPoint，38B，小端）：interval_ms(u16) + 6×(位置×100 i32, 速度×10 u16)
+# 结构化 dtype 无对齐填充；6 组 (pos, spd) 用子数组字段表示，整条轨迹只需 3 次整块赋值，
+# 由 NumPy 在 C 层完成类型收窄与交错写入，tobytes() 一次得到全部点的线上字节
+_TRAJ_POINT_DTYPE = np.dtype([
+    ("interval", "<u2"),
+    ("axes", [("pos", "<i4"), ("spd", "<u2")], (6,)),
+])
+
+# upload_trajectory 入口把 dict 轨迹点统一转成该元组：抽稀/折叠/编码按属性访问，不再反复做字符串键查找
+_TrajPoint = namedtuple("_TrajPoint", ("interval_ms", "positions", "speeds"))
+
+# 读取类命令的“可恢复”失败（TIMEOUT / 总线忙 / 瞬态CAN错误），命中时静默重试
+_RECOVERABLE_STATUSES = frozenset({3, 4})
+_RECOVERABLE_ERRCODES = frozenset({0x0101, 0x4034})
+
+
+def _is_recoverable(status: int, err_code: int) -> bool:
+    """判断 UCP 失败是否可重试"""
+    return status in _RECOVERABLE_STATUSES or err_code in _RECOVERABLE_ERRCODES
+
+
+@lru_cache(maxsize=128)
+def _y42_ack_order(motor_ids: tuple, expected_ack_motor_id: int, max_ack_candidates: int) -> tuple:
+    """Y42 期望响应电机的尝试顺序：expected_ack_motor_id 在子命令集合内则优先，其余按 ID 升序，最多 N 个
+
+    稳态控制下参与的电机集合基本不变，按 (电机ID序列, 期望ID, N) 缓存，省去每次去重排序
+    """
+    cand_ids = sorted(set(motor_ids))
+    if not cand_ids:
+        cand_ids = [expected_ack_motor_id] if expected_ack_motor_id else [1]
+    # 若 expected_ack_motor_id 不在本次子命令集合内，则自动回退到集合内的升序
+    if expected_ack_motor_id in cand_ids:
+        cand_ids.remove(expected_ack_motor_id)
+        cand_ids.insert(0, expected_ack_motor_id)
+    return tuple(cand_ids[:max_ack_candidates])
+
+
+class _LazyHex:
+    """日志参数用：仅在日志记录真正被格式化输出时才把 bytes 转成十六进制串"""
+
+    __slots__ = ("b",)
+
+    def __init__(self, b: bytes):
+        self.b = b
+
+    def __str__(self) -> str:
+        return self.b.hex() if self.b else ""
+
+
 @dataclass
 class DriveParameters:
     """
@@ -150,6 +296,39 @@ class DriveParameters:
         return bytes(args)
 
 
+# DriveParameters 字段名（模块加载时计算一次，modify_drive_parameters 按此拷贝 dict/对象）
+_DRIVE_PARAM_FIELDS = tuple(f.name for f in fields(DriveParameters))
+_DRIVE_PARAM_COMPAT_FIELDS = ("raw_data", "parsed_ok")
+
+
+class MotorStatus:
+    """
+    电机状态标志（get_motor_status 的返回值）
+
+    使用 __slots__ 的轻量对象：高频轮询时每次只分配一个紧凑实例。
+    支持属性访问（status.enabled）与旧脚本的下标访问（status['enabled']）。
+    """
+
+    __slots__ = ("enabled", "in_position", "stalled", "stall_protection")
+
+    def __init__(self, enabled: bool, in_position: bool, stalled: bool, stall_protection: bool):
+        self.enabled = enabled
+        self.in_position = in_position
+        self.stalled = stalled
+        self.stall_protection = stall_protection
+
+    def __getitem__(self, key: str) -> bool:
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __repr__(self) -> str:
+        return (
+            f"MotorStatus(enabled={self.enabled}, in_position={self.in_position}, "
+            f"stalled={self.stalled}, stall_protection={self.stall_protection})"
+        )
+
+
 class ZDTMotorController:
     """
     ZDT电机控制器 - UCP硬件保护模式
@@ -169,6 +348,38 @@ class ZDTMotorController:
         position = motor.get_position()
         motor.disconnect()
     """
+
+    # 实例属性全部声明为 slots：Y42 场景下同时存在多台电机实例，去掉每实例 __dict__，
+    # 同时让轮询热路径上的 self.xxx 走 slot 描述符。
+    # 注意：_joint_limits_cache/_motor_config_cache/_drv_dir_* 为类级共享缓存，不属于实例 slot；
+    # _can_interface_compat/_command_builder_compat 为按需创建的兼容字段（未赋值前 getattr/hasattr 照常回退）。
+    __slots__ = (
+        "motor_id",
+        "port",
+        "baudrate",
+        "_auto_connect",
+        "_connected",
+        "_use_connection_pool",
+        "client",
+        "parser",
+        "logger",
+        "_traj_last_status",
+        "_traj_logged_completed",
+        "_traj_logged_error",
+        "_last_ucp_err_signature",
+        "_trace_pos_raw",
+        "_trace_pos_raw_last_ts",
+        "_drive_params_cache",
+        "_drive_params_cache_ts",
+        "_drive_params_cache_ttl_s",
+        "_can_interface_compat",
+        "_command_builder_compat",
+        "_wait_abort",
+        "_status_cache",
+        "_status_cache_ts",
+        "_traj_batch_n",
+        "_traj_good_streak",
+    )
     
     def __init__(self, motor_id: int, port: str = 'COM5', baudrate: int = 115200, 
                  auto_connect: bool = True, **kwargs):
@@ -199,7 +410,7 @@ class ZDTMotorController:
         self._use_connection_pool = kwargs.get('shared_interface', True)  # 默认使用连接池
         
         self.client: Optional[UcpClient] = None
-        self.parser = NativeMotorData(driver_type='ZDT')
+        self.parser = get_native_parser('ZDT')  # 无状态解析器，各实例共享
         self.logger = logging.getLogger(f"ZDTMotorController[ID:{motor_id}]")
 
         # 轨迹状态日志抑制：避免轮询时刷屏，只在状态变更时记录一次
@@ -209,7 +420,28 @@ class ZDTMotorController:
 
         # UCP 错误日志节流：避免在控制回路中对于同一 status/err_code/diag 刷屏
         # 仅在错误签名发生变化时输出一次 warning
-        self._last_ucp_err_signature: Optional[Tuple[int, int, str]] = None
+        # 签名为单个 int：diag 哈希(64bit) << 24 | status(8bit) << 16 | err_code(16bit)
+        self._last_ucp_err_signature: Optional[int] = None
+
+        # 位置原始回包诊断开关（HORIZON_TRACE_POS_RAW）：构造时解析一次，避免每次读位置都查环境变量
+        self._trace_pos_raw: bool = (os.environ.get("HORIZON_TRACE_POS_RAW") or "0").strip().lower() in (
+            "1", "true", "yes"
+        )
+        self._trace_pos_raw_last_ts: float = 0.0
+
+        # wait_for_* 的中止信号：stop()/emergency_stop()/force_stop_homing() 置位后，
+        # 正在等待的线程立即返回 False，而不是继续轮询直到超时。
+        # 注：UCP 为请求/应答协议，固件不会主动推送到位/回零完成，因此等待本身仍需轮询。
+        self._wait_abort = threading.Event()
+
+        # 电机状态快照：is_enabled()/is_in_position() 在极短时间内连续调用时（UI 常见）复用同一次读取，
+        # 避免重复的 UCP 往返；任何非只读命令下发后立即失效，保证“命令后读状态”拿到新值。
+        self._status_cache: Optional[MotorStatus] = None
+        self._status_cache_ts: float = 0.0
+
+        # 轨迹批量包大小（点数）的 AIMD 自适应：连续成功若干包后 +1，超时减半；跨多次上传保留（热启动）
+        self._traj_batch_n: int = 5
+        self._traj_good_streak: int = 0
 
         # === 驱动参数缓存（用于修正反馈符号） ===
         # 固件侧存在 DriveParameters.motor_direction（0/1，电机旋转正方向设置）。
@@ -387,6 +619,44 @@ class ZDTMotorController:
     _joint_limits_cache: Optional[List[Tuple[float, float]]] = None
     _joint_limits_cache_src: str = ""
     _motor_config_cache: Optional[dict] = None
+    _motor_config_cache_src: str = ""
+
+    # 配置文件热更新：缓存命中时最多每秒 stat 一次来源文件，mtime 变化才重新加载
+    # {path: [mtime, 上次检查的 monotonic 时间]}
+    _config_file_state: dict = {}
+    _CONFIG_RECHECK_INTERVAL_S = 1.0
+
+    @staticmethod
+    def _remember_config_mtime(path: str) -> None:
+        """记录配置文件当前 mtime（在读取文件前调用）"""
+        try:
+            mtime = os.stat(path).st_mtime
+        except OSError:
+            mtime = 0.0
+        ZDTMotorController._config_file_state[path] = [mtime, time.monotonic()]
+
+    @staticmethod
+    def _config_file_changed(path: str) -> bool:
+        """配置文件自上次加载后是否被修改（按 _CONFIG_RECHECK_INTERVAL_S 节流）"""
+        state = ZDTMotorController._config_file_state.get(path)
+        if state is None:
+            return False
+        now = time.monotonic()
+        if now - state[1] < ZDTMotorController._CONFIG_RECHECK_INTERVAL_S:
+            return False
+        state[1] = now
+        try:
+            return os.stat(path).st_mtime != state[0]
+        except OSError:
+            return False
+
+    @staticmethod
+    def invalidate_joint_limits() -> None:
+        """清空关节限位与电机配置缓存，下次使用时从配置文件重新加载"""
+        ZDTMotorController._joint_limits_cache = None
+        ZDTMotorController._joint_limits_arr_cache = None
+        ZDTMotorController._motor_config_cache = None
+        ZDTMotorController._config_file_state.clear()
     
     @staticmethod
     def _load_joint_limits(force_reload: bool = False) -> Optional[List[Tuple[float, float]]]:
@@ -397,8 +667,12 @@ class ZDTMotorController:
             关节限位列表 [(min1, max1), (min2, max2), ...]，共6个关节
             如果加载失败返回 None
         """
-        if (not force_reload) and ZDTMotorController._joint_limits_cache is not None:
-            return ZDTMotorController._joint_limits_cache
+        cached = ZDTMotorController._joint_limits_cache
+        if (not force_reload) and cached is not None:
+            if not ZDTMotorController._config_file_changed(ZDTMotorController._joint_limits_cache_src):
+                return cached
+            # 配置文件已修改：重新加载；若文件正在写入等原因解析失败，则继续使用旧限位
+            return ZDTMotorController._load_joint_limits(force_reload=True) or cached
         
         # 尝试从多个可能的路径查找配置文件
         possible_config_dirs = []
@@ -452,6 +726,7 @@ class ZDTMotorController:
         # 优先读取 dh_parameters_config.json
         if dh_config_path and os.path.exists(dh_config_path):
             try:
+                ZDTMotorController._remember_config_mtime(dh_config_path)
                 with open(dh_config_path, "r", encoding="utf-8") as f:
                     config = json.load(f)
                     jl = config.get("joint_limits", {})
@@ -474,6 +749,7 @@ class ZDTMotorController:
         # 回退到 all_parameter_config.json
         if all_config_path:
             try:
+                ZDTMotorController._remember_config_mtime(all_config_path)
                 with open(all_config_path, "r", encoding="utf-8") as f:
                     config = json.load(f)
                     # 递归查找 joint_limits
@@ -519,8 +795,11 @@ class ZDTMotorController:
             电机配置字典，包含 motor_reducer_ratios 和 motor_directions
             如果加载失败返回 None
         """
-        if (not force_reload) and ZDTMotorController._motor_config_cache is not None:
-            return ZDTMotorController._motor_config_cache
+        cached = ZDTMotorController._motor_config_cache
+        if (not force_reload) and cached is not None:
+            if not ZDTMotorController._config_file_changed(ZDTMotorController._motor_config_cache_src):
+                return cached
+            force_reload = True
         
         # 尝试从多个可能的路径查找配置文件
         possible_config_dirs = []
@@ -578,6 +857,7 @@ class ZDTMotorController:
         
         if motor_config_path:
             try:
+                ZDTMotorController._remember_config_mtime(motor_config_path)
                 with open(motor_config_path, "r", encoding="utf-8") as f:
                     loaded = json.load(f)
                     if "motor_reducer_ratios" in loaded:
@@ -585,11 +865,28 @@ class ZDTMotorController:
                     if "motor_directions" in loaded:
                         config["motor_directions"].update(loaded["motor_directions"])
             except Exception:
-                pass
+                # 热更新时文件可能正在写入：已有缓存则继续使用旧配置，避免悄悄退回默认减速比/方向
+                if cached is not None:
+                    return cached
         
         ZDTMotorController._motor_config_cache = config
+        ZDTMotorController._motor_config_cache_src = motor_config_path or ""
         return config
     
+    # 关节限位 (6, 2) 数组：(来源 limits 列表, ndarray)，限位列表被重新加载后按对象身份自动重建
+    _joint_limits_arr_cache: Optional[tuple] = None
+
+    @staticmethod
+    def _joint_limits_array(limits: List[Tuple[float, float]]) -> np.ndarray:
+        """返回 limits 前 6 个关节对应的 (6, 2) float64 数组（[:, 0]=min, [:, 1]=max），调用方只读使用"""
+        cache = ZDTMotorController._joint_limits_arr_cache
+        if cache is not None and cache[0] is limits:
+            return cache[1]
+        arr = np.asarray(limits[:6], dtype=np.float64)
+        arr.flags.writeable = False
+        ZDTMotorController._joint_limits_arr_cache = (limits, arr)
+        return arr
+
     def _motor_angle_to_joint_angle(self, motor_angle: float, motor_id: int) -> float:
         """
         将电机角度转换为关节角度（输出端角度）
@@ -605,19 +902,47 @@ class ZDTMotorController:
         Returns:
             关节角度（度）
         """
-        motor_config = self._load_motor_config()
-        if motor_config is None:
+        table = self._motor_scale_table()
+        if table is None:
             # 如果无法加载配置，假设减速比为1，方向为1
             return motor_angle
         
-        reducer_ratio = float(motor_config.get("motor_reducer_ratios", {}).get(str(motor_id), 1.0))
-        direction = int(motor_config.get("motor_directions", {}).get(str(motor_id), 1))
+        scales = table[0]
+        if 0 <= motor_id < len(scales):
+            scale = scales[motor_id]
+        else:
+            motor_config = self._load_motor_config()
+            reducer_ratio = float(motor_config.get("motor_reducer_ratios", {}).get(str(motor_id), 1.0))
+            direction = int(motor_config.get("motor_directions", {}).get(str(motor_id), 1))
+            scale = reducer_ratio * direction
         
         # 关节角度 = 电机角度 / (减速比 * 方向)
         # 这是 motor_angle = joint_angle * reducer_ratio * direction 的逆运算
-        joint_angle = motor_angle / (reducer_ratio * direction)
-        
-        return joint_angle
+        return motor_angle / scale
+
+    # 电机ID(0..255) → 减速比×方向 查表：(来源 config 对象, list, ndarray)
+    # 配置对象被重新加载（热更新）后按对象身份自动重建
+    _motor_scale_cache: Optional[tuple] = None
+
+    @staticmethod
+    def _motor_scale_table() -> Optional[Tuple[List[float], np.ndarray]]:
+        """返回 (scales_list, scales_array)，下标为电机ID；未加载到配置时返回 None"""
+        motor_config = ZDTMotorController._load_motor_config()
+        if motor_config is None:
+            return None
+        cache = ZDTMotorController._motor_scale_cache
+        if cache is not None and cache[0] is motor_config:
+            return cache[1], cache[2]
+        
+        ratios = motor_config.get("motor_reducer_ratios", {})
+        directions = motor_config.get("motor_directions", {})
+        scales = [
+            float(ratios.get(str(m), 1.0)) * int(directions.get(str(m), 1))
+            for m in range(256)
+        ]
+        arr = np.asarray(scales, dtype=np.float64)
+        ZDTMotorController._motor_scale_cache = (motor_config, scales, arr)
+        return scales, arr
     
     def _parse_angles_from_args(self, opcode: int, args: bytes) -> List[Tuple[int, float]]:
         """
@@ -636,13 +961,13 @@ class ZDTMotorController:
         try:
             # POSITION_DIRECT (0x12): <iHBB = 位置×10(4B), 速度×10(2B), is_absolute(1B), multi_sync(1B)
             if opcode == opcodes.POSITION_DIRECT and len(args) >= 8:
-                pos_x10 = struct.unpack("<i", args[0:4])[0]
+                pos_x10 = _S_I32_LE.unpack_from(args)[0]
                 angle_deg = pos_x10 / 10.0
                 angles.append((self.motor_id, angle_deg))
             
             # POSITION_TRAPEZOID (0x13): <iHHHBB = 位置×10(4B), 速度×10(2B), 加速度(2B), 减速度(2B), is_absolute(1B), multi_sync(1B)
             elif opcode == opcodes.POSITION_TRAPEZOID and len(args) >= 10:
-                pos_x10 = struct.unpack("<i", args[0:4])[0]
+                pos_x10 = _S_I32_LE.unpack_from(args)[0]
                 angle_deg = pos_x10 / 10.0
                 angles.append((self.motor_id, angle_deg))
             
@@ -651,12 +976,9 @@ class ZDTMotorController:
             # payload 中每个子命令: motor_id(1B) + ZDT命令
             # ZDT 0xFB位置命令: FB(1B) + Dir(1B) + Speed(2B BE) + Position(4B BE) + Abs/Rel(1B) + Sync(1B) + 6B(1B)
             elif opcode == opcodes.Y42_MULTI_MOTOR and len(args) >= 5:
-                # 跳过 expected_motor_id(1B)
-                y42_frame = args[1:]
-                if len(y42_frame) >= 4 and y42_frame[0] == 0xAA:
-                    # 解析长度
-                    total_len = struct.unpack(">H", y42_frame[1:3])[0]
-                    payload = y42_frame[3:-1]  # 去掉末尾的 0x6B
+                # 跳过 expected_motor_id(1B) + AA + 长度(2B)，帧头与组帧共用 _Y42_HEAD 布局
+                if len(args) >= _Y42_HEAD.size + 1 and args[1] == 0xAA:
+                    payload = args[_Y42_HEAD.size:-1]  # 去掉末尾的 0x6B
                     
                     # 解析子命令
                     idx = 0
@@ -672,7 +994,7 @@ class ZDTMotorController:
                             # 字节布局: [FB] [Dir] [Speed_H] [Speed_L] [Pos_B3] [Pos_B2] [Pos_B1] [Pos_B0] [Abs/Rel] [Sync] [6B]
                             if idx + 11 <= len(payload):
                                 # Position在ZDT命令中的位置：FB(0) + Dir(1) + Speed(2-3) + Position(4-7)
-                                pos_val = struct.unpack(">I", payload[idx+4:idx+8])[0]
+                                pos_val = _S_U32_BE.unpack_from(payload, idx + 4)[0]
                                 motor_angle_deg = pos_val / 10.0
                                 angles.append((motor_id, motor_angle_deg))
                                 idx += 11  # 跳过整个ZDT命令（11字节）
@@ -703,7 +1025,7 @@ class ZDTMotorController:
             RuntimeError: 如果角度超出限位
         """
         # 只检查位置控制相关的 opcode
-        if opcode not in (opcodes.POSITION_DIRECT, opcodes.POSITION_TRAPEZOID, opcodes.Y42_MULTI_MOTOR):
+        if opcode not in _LIMIT_CHECKED_OPCODES:
             return
         
         # 加载关节限位
@@ -718,30 +1040,105 @@ class ZDTMotorController:
             # 无法解析角度，跳过检查（可能是其他类型的命令）
             return
         
-        # 检查每个角度（需要将电机角度转换为关节角度）
-        violations = []
-        for motor_id, motor_angle_deg in angles:
-            # 将电机角度转换为关节角度
-            joint_angle_deg = self._motor_angle_to_joint_angle(motor_angle_deg, motor_id)
-            
-            # motor_id 从1开始，转换为索引（0-5）
+        # 检查每个角度（需要将电机角度转换为关节角度）；这里通常只有 1~2 个角度，直接传列表走标量比较
+        self._raise_if_joint_limits_violated(
+            [m for m, _ in angles], [a for _, a in angles], limits, "⛔ 关节限位检查失败，拒绝下发命令："
+        )
+
+    def _motor_angles_to_joint_angles_vec(self, motor_angles: np.ndarray, motor_ids: np.ndarray) -> np.ndarray:
+        """_motor_angle_to_joint_angle 的批量版本：按电机ID取减速比×方向，一次完成换算"""
+        table = self._motor_scale_table()
+        if table is None:
+            # 如果无法加载配置，假设减速比为1，方向为1
+            return motor_angles
+        
+        # 超出 0..255 的ID按边界取值：这类ID不参与限位判断，仅需保证不越界
+        scale = table[1][np.clip(motor_ids, 0, 255)]
+        return motor_angles / scale
+
+    def _joint_limit_violations_py(
+        self,
+        motor_ids: Sequence[int],
+        motor_angles: Sequence[float],
+        limits: List[Tuple[float, float]],
+    ) -> list:
+        """少量角度的逐个比较：返回越限行 [(motor_id, joint_no, joint_angle, min, max), ...]"""
+        table = self._motor_scale_table()
+        scales = table[0] if table is not None else None
+        bad = []
+        for motor_id, motor_angle in zip(motor_ids, motor_angles):
+            motor_id = int(motor_id)
+            # motor_id 从1开始，转换为索引（0-5）；超出 1..6 的电机不参与检查
             joint_idx = motor_id - 1
-            if 0 <= joint_idx < 6:
-                min_limit, max_limit = limits[joint_idx]
-                if joint_angle_deg < min_limit or joint_angle_deg > max_limit:
-                    # 保存电机角度（目标角度）和关节角度，错误信息中显示电机角度
-                    violations.append((motor_id, joint_idx + 1, motor_angle_deg, joint_angle_deg, min_limit, max_limit))
-        
-        if violations:
-            # 构建错误消息（显示关节角度）
-            msg_parts = ["⛔ 关节限位检查失败，拒绝下发命令："]
-            for motor_id, joint_num, motor_angle, joint_angle, min_lim, max_lim in violations:
-                msg_parts.append(
-                    f"  电机{motor_id}(关节{joint_num}): 关节角度 {joint_angle:.2f}° 超出限位 [{min_lim:.2f}°, {max_lim:.2f}°]"
-                )
-            error_msg = "\n".join(msg_parts)
-            self.logger.error(error_msg)
-            raise RuntimeError(error_msg)
+            if not 0 <= joint_idx < 6:
+                continue
+            joint = motor_angle / scales[motor_id] if scales is not None else motor_angle
+            lo, hi = limits[joint_idx]
+            if joint < lo or joint > hi:
+                bad.append((motor_id, joint_idx + 1, joint, lo, hi))
+        return bad
+
+    def _joint_limit_violations_np(
+        self,
+        motor_ids: np.ndarray,
+        motor_angles: np.ndarray,
+        limits: List[Tuple[float, float]],
+    ) -> list:
+        """大批量角度的向量化比较，返回值同 _joint_limit_violations_py"""
+        joints = self._motor_angles_to_joint_angles_vec(motor_angles, motor_ids)
+
+        # motor_id 从1开始，转换为索引（0-5）
+        joint_idx = motor_ids - 1
+        valid = (joint_idx >= 0) & (joint_idx < 6)
+        lim = self._joint_limits_array(limits)[np.where(valid, joint_idx, 0)]
+        mins, maxs = lim[:, 0], lim[:, 1]
+        bad = np.flatnonzero(valid & ((joints < mins) | (joints > maxs)))
+        return [
+            (int(motor_ids[i]), int(joint_idx[i]) + 1, float(joints[i]), float(mins[i]), float(maxs[i]))
+            for i in bad
+        ]
+
+    def _raise_if_joint_limits_violated(
+        self,
+        motor_ids: Union[Sequence[int], np.ndarray],
+        motor_angles: Union[Sequence[float], np.ndarray],
+        limits: List[Tuple[float, float]],
+        title: str,
+    ) -> None:
+        """
+        关节限位检查（电机角度 → 关节角度 → 与限位比较）
+        
+        少于 _LIMIT_CHECK_NUMPY_MIN 个角度时逐个比较（单电机/6 轴手臂的常见情况，
+        numpy 建数组的固定开销反而更大）；更多时整批向量化比较。
+        
+        Args:
+            motor_ids: 电机ID序列或数组（从1开始，超出 1..6 的电机不参与检查）
+            motor_angles: 对应的电机角度（度）
+            limits: 6个关节的 (min, max) 限位
+            title: 错误消息首行
+        
+        Raises:
+            RuntimeError: 如果有角度超出限位
+        """
+        if len(motor_ids) < _LIMIT_CHECK_NUMPY_MIN:
+            bad = self._joint_limit_violations_py(motor_ids, motor_angles, limits)
+        else:
+            bad = self._joint_limit_violations_np(
+                np.asarray(motor_ids, dtype=np.int64), np.asarray(motor_angles, dtype=np.float64), limits
+            )
+        if not bad:
+            return
+
+        # 构建错误消息（只格式化越限的行，显示关节角度）
+        msg_parts = [title]
+        msg_parts.extend(
+            f"  电机{motor_id}(关节{joint_no}): 关节角度 {joint:.2f}° "
+            f"超出限位 [{lo:.2f}°, {hi:.2f}°]"
+            for motor_id, joint_no, joint, lo, hi in bad
+        )
+        error_msg = "\n".join(msg_parts)
+        self.logger.error(error_msg)
+        raise RuntimeError(error_msg)
     
     def _request(
         self,
@@ -754,74 +1151,112 @@ class ZDTMotorController:
         suppress_err_log: bool = False,
     ) -> UcpResponse:
         """发送UCP请求"""
-        if not self.client:
+        client = self.client
+        if not client:
             raise RuntimeError("未连接，请先调用 connect()")
         
-        # 在下发前检查关节限位
-        try:
-            self._check_joint_limits_before_send(opcode, args)
-        except RuntimeError:
-            # 限位检查失败，直接抛出异常，阻止下发
-            raise
-        except Exception as e:
-            # 限位检查过程中出现其他异常，记录但不阻止下发（避免限位检查本身的问题影响功能）
-            self.logger.warning(f"关节限位检查异常（已放行）: {e}")
+        # 在下发前检查关节限位（仅位置类命令；读取/状态轮询直接跳过，不进入检查函数）
+        if opcode not in _READ_ONLY_OPCODES:
+            self._status_cache = None
+        if opcode in _LIMIT_CHECKED_OPCODES:
+            try:
+                self._check_joint_limits_before_send(opcode, args)
+            except RuntimeError:
+                # 限位检查失败，直接抛出异常，阻止下发
+                raise
+            except Exception as e:
+                # 限位检查过程中出现其他异常，记录但不阻止下发（避免限位检查本身的问题影响功能）
+                self.logger.warning(f"关节限位检查异常（已放行）: {e}")
         
         try:
-            resp = self.client.request(self.motor_id, opcode, args, timeout_ms)
+            resp = client.request(self.motor_id, opcode, args, timeout_ms)
         except TimeoutError as e:
             # 轮询/控制回路里“偶发丢包/总线瞬态”很常见：
             # - 让上层的重试逻辑基于 resp.status/err_code 生效（否则会被异常直接打断）
             # - 避免 logger.exception 打印 traceback 造成刷屏
-            if not suppress_err_log:
+            # 日志按级别门控，并使用 %-style 延迟格式化 + _LazyHex：记录被级别/过滤器丢弃时不做 hex 转换。
+            if (not suppress_err_log) and self.logger.isEnabledFor(logging.WARNING):
                 try:
-                    msg = (
-                        f"[UCP][TIMEOUT] id={self.motor_id} opcode=0x{opcode:02X} "
-                        f"args={args.hex()} timeout_ms={timeout_ms} err={e}"
+                    self.logger.warning(
+                        "[UCP][TIMEOUT] id=%s opcode=0x%02X args=%s timeout_ms=%s err=%s",
+                        self.motor_id, opcode, _LazyHex(args), timeout_ms, e,
                     )
-                    self.logger.warning(msg)
                 except Exception:
                     pass
             # 约定：用 status=3 + err_code=0x4034 表示“等待ACK/响应超时”（与固件侧超时语义对齐）
             return UcpResponse(status=3, err_code=0x4034, data=b"", diag=b"")
         except Exception as e:
             try:
-                msg = f"[UCP][EXC] id={self.motor_id} opcode=0x{opcode:02X} args={args.hex()} timeout_ms={timeout_ms} err={e}"
-                if suppress_err_log:
-                    self.logger.debug(msg)
-                else:
-                    self.logger.exception(msg)
+                if self.logger.isEnabledFor(logging.DEBUG if suppress_err_log else logging.ERROR):
+                    fmt = "[UCP][EXC] id=%s opcode=0x%02X args=%s timeout_ms=%s err=%s"
+                    if suppress_err_log:
+                        self.logger.debug(fmt, self.motor_id, opcode, _LazyHex(args), timeout_ms, e)
+                    else:
+                        self.logger.exception(fmt, self.motor_id, opcode, _LazyHex(args), timeout_ms, e)
             except Exception:
                 pass
             raise
 
-        # 关键：UCP 返回非 0 时，默认在终端输出一条“同款错误”方便诊断。
-        # 但对“可恢复错误/会自动重试”的场景，应避免刷屏。
-        status = int(getattr(resp, "status", 0) or 0)
-        err_code = int(getattr(resp, "err_code", 0) or 0) & 0xFFFF
-        recoverable_noisy = (status == 4 and err_code == 0x0101)
-
-        # 正常返回时，重置错误签名，确保后续新的错误还能再次打印
+        # 正常返回（绝大多数情况）直接返回；同时重置错误签名，确保后续新的错误还能再次打印
+        status = resp.status
         if status == 0:
-            self._last_ucp_err_signature = None
+            if self._last_ucp_err_signature is not None:
+                self._last_ucp_err_signature = None
+            return resp
 
-        if (not suppress_err_log) and status != 0 and (not recoverable_noisy):
+        # 关键：UCP 返回非 0 时，默认在终端输出一条“同款错误”方便诊断。
+        # 但对“可恢复错误/会自动重试”的场景（总线忙 status=4/0x0101），应避免刷屏。
+        err_code = resp.err_code & 0xFFFF
+        if not suppress_err_log and not (status == 4 and err_code == 0x0101):
             try:
-                diag_hex = resp.diag.hex() if getattr(resp, "diag", None) else ""
-                signature = (status, err_code, diag_hex)
+                diag = resp.diag
+                signature = ((hash(diag) & 0xFFFFFFFFFFFFFFFF) << 24) | ((status & 0xFF) << 16) | err_code
                 # 仅在错误签名变化时输出一条 warning，避免同一错误在轮询中持续刷屏
+                # args/diag 的十六进制串只在真正要输出时才生成
                 if signature != self._last_ucp_err_signature:
-                    msg = (
-                        f"[UCP][ERR] id={self.motor_id} opcode=0x{opcode:02X} args={args.hex()} "
-                        f"status={status} err_code=0x{err_code:04X} diag={diag_hex}"
-                    )
-                    self.logger.warning(msg)
+                    if self.logger.isEnabledFor(logging.WARNING):
+                        self.logger.warning(
+                            "[UCP][ERR] id=%s opcode=0x%02X args=%s status=%s err_code=0x%04X diag=%s",
+                            self.motor_id, opcode, _LazyHex(args), status, err_code, _LazyHex(diag),
+                        )
                     self._last_ucp_err_signature = signature
             except Exception:
                 pass
 
         return resp
 
+    def _poll_request(
+        self,
+        opcode: int,
+        *,
+        timeout_ms: int = 300,
+        attempts: int = 3,
+        delay: float = 0.03,
+        fail_msg: str = "读取失败",
+        quiet: bool = False,
+    ) -> UcpResponse:
+        """
+        带静默重试的读取请求：仅对可恢复失败重试，成功返回 resp，否则抛出 RuntimeError(fail_msg: ...)
+
+        前几次失败不打印 [UCP][ERR]，最后一次失败再输出（避免刷屏）；quiet=True 时全程不打印。
+        """
+        for attempt in range(1, attempts + 1):
+            last = attempt == attempts
+            resp = self._request(opcode, timeout_ms=timeout_ms, suppress_err_log=quiet or not last)
+            status = resp.status
+            if status == 0:
+                return resp
+
+            err_code = resp.err_code
+            if not last and _is_recoverable(status, err_code):
+                time.sleep(delay)
+                continue
+
+            # 不可恢复或已到最后一次
+            raise RuntimeError(f"{fail_msg}: status={status} err_code=0x{err_code:04X} diag={resp.diag.hex()}")
+
+        raise RuntimeError(f"{fail_msg}: unknown")
+
     # ==================== 旧SLCAN兼容字段（占位） ====================
 
     @property
@@ -847,8 +1282,7 @@ class ZDTMotorController:
         """
         if bool(multi_sync):
             raise RuntimeError("multi_sync 同步预加载已被禁用：本项目多机同步仅允许 Y42。")
-        args = struct.pack("<BB", 1, int(bool(multi_sync)))  # enabled=1
-        resp = self._request(opcodes.ENABLE, args)
+        resp = self._request(opcodes.ENABLE, _ARGS_ENABLE)
         if resp.status != 0:
             err_msg = f"使能失败: status={resp.status}, err_code=0x{resp.err_code:04X}"
             if resp.diag:
@@ -864,8 +1298,7 @@ class ZDTMotorController:
         """
         if bool(multi_sync):
             raise RuntimeError("multi_sync 同步预加载已被禁用：本项目多机同步仅允许 Y42。")
-        args = struct.pack("<BB", 0, int(bool(multi_sync)))  # enabled=0
-        resp = self._request(opcodes.ENABLE, args)
+        resp = self._request(opcodes.ENABLE, _ARGS_DISABLE)
         if resp.status != 0:
             raise RuntimeError(f"失能失败: status={resp.status}")
         self.logger.info("电机已失能")
@@ -874,8 +1307,8 @@ class ZDTMotorController:
         """立即停止"""
         if bool(multi_sync):
             raise RuntimeError("multi_sync 同步预加载已被禁用：本项目多机同步仅允许 Y42。")
-        args = struct.pack("<B", int(bool(multi_sync)))
-        resp = self._request(opcodes.STOP, args)
+        self._wait_abort.set()
+        resp = self._request(opcodes.STOP, _ARGS_STOP)
         if resp.status != 0:
             raise RuntimeError(f"停止失败: status={resp.status}")
 
@@ -953,7 +1386,7 @@ class ZDTMotorController:
             )
         pos_x10 = int(position * 10)
         speed_x10 = int(speed * 10)
-        args = struct.pack("<iHBB", pos_x10, speed_x10, int(is_absolute), int(bool(multi_sync)))
+        args = _S_POS_DIRECT.pack(pos_x10, speed_x10, 1 if is_absolute else 0, 0)
         
         resp = self._request(opcodes.POSITION_DIRECT, args, timeout_ms)
         if resp.status != 0:
@@ -979,8 +1412,7 @@ class ZDTMotorController:
             raise RuntimeError("multi_sync 同步预加载已被禁用：请使用 Y42 多机同步接口。")
         pos_x10 = int(position * 10)
         vmax_x10 = int(max_speed * 10)
-        args = struct.pack("<iHHHBB", pos_x10, vmax_x10, acceleration, deceleration, 
-                          int(is_absolute), int(multi_sync))
+        args = _S_POS_TRAPEZOID.pack(pos_x10, vmax_x10, acceleration, deceleration, 1 if is_absolute else 0, 0)
         
         resp = self._request(opcodes.POSITION_TRAPEZOID, args, timeout_ms)
         if resp.status != 0:
@@ -999,13 +1431,13 @@ class ZDTMotorController:
         if rpm_x10 < -32768 or rpm_x10 > 32767:
             raise ValueError(f"速度超出范围: {speed} RPM")
         
-        args = struct.pack("<hHB", rpm_x10, acceleration, int(multi_sync))
+        args = _S_SPEED.pack(rpm_x10, acceleration, 0)
         # 对实时速度控制：0x0101 常见为“设备忙/瞬态不可用”，在高频下发时出现较多。
         # 这里抑制 [UCP][ERR] 刷屏，并将 0x0101 视为可恢复（直接返回，让上层下一周期再发）。
         resp = self._request(opcodes.SPEED_MODE, args, timeout_ms=200, suppress_err_log=True)
         if resp.status != 0:
             try:
-                ec = int(getattr(resp, "err_code", 0) or 0) & 0xFFFF
+                ec = resp.err_code & 0xFFFF
             except Exception:
                 ec = 0
             if ec == 0x0101:
@@ -1016,7 +1448,7 @@ class ZDTMotorController:
         """力矩/电流控制"""
         if bool(multi_sync):
             raise RuntimeError("multi_sync 同步预加载已被禁用：请使用 Y42 多机同步接口。")
-        args = struct.pack("<hHB", int(current), int(slope), int(multi_sync))
+        args = _S_TORQUE.pack(int(current), int(slope), 0)
         resp = self._request(opcodes.TORQUE_MODE, args)
         if resp.status != 0:
             raise RuntimeError(f"力矩控制失败: status={resp.status}")
@@ -1026,67 +1458,27 @@ class ZDTMotorController:
     def get_position(self) -> float:
         """读取当前位置（度）"""
         # 偶发读失败（例如总线瞬态/超时）应自动重试，避免上层 UI/轨迹验证被打断。
-        max_attempts = 3
-        retry_delay_s = 0.03
-        last_resp: Optional[UcpResponse] = None
-
-        for attempt in range(1, max_attempts + 1):
-            # 前几次失败不打印 [UCP][ERR]，最后一次失败再输出（避免刷屏）
-            last = attempt == max_attempts
-            resp = self._request(opcodes.READ_REALTIME_POSITION, timeout_ms=300, suppress_err_log=not last)
-            last_resp = resp
+        resp = self._poll_request(opcodes.READ_REALTIME_POSITION, fail_msg="读取位置失败")
 
-            if getattr(resp, "status", 0) == 0:
-                # 诊断输出（默认关闭，避免刷屏）：仅在显式开启时输出 J4 的“原始回包字节 + sign/pos_raw”
-                # 注意：这里不做任何符号修正；符号修正应由上层 motor_config_manager.motor_directions(±1) 统一处理。
-                try:
-                    import os as _os
-                    if str(_os.environ.get("HORIZON_TRACE_POS_RAW", "0")).strip() in ("1", "true", "True", "YES", "yes"):
-                        if int(getattr(self, "motor_id", 0) or 0) == 4:
-                            now = time.time()
-                            last_ts = float(getattr(self, "_trace_pos_raw_last_ts", 0.0) or 0.0)
-                            if now - last_ts >= 0.5:
-                                setattr(self, "_trace_pos_raw_last_ts", now)
-                                data = resp.data or b""
-                                sign = int(data[0]) if len(data) >= 1 else None
-                                pos_raw = struct.unpack(">I", data[1:5])[0] if len(data) >= 5 else None
-                                hx = ""
-                                try:
-                                    hx = data.hex()
-                                except Exception:
-                                    hx = "<hex_fail>"
-                                print(
-                                    f"[TRACE][POS_RAW] id={self.motor_id} opcode=0x{opcodes.READ_REALTIME_POSITION:02X} "
-                                    f"data={hx} sign={sign} pos_raw={pos_raw}"
-                                )
-                except Exception:
-                    pass
-                pos = self.parser.parse_position(resp.data)
-                # 这里返回“电机原生坐标”的位置，方向修正由上层 motor_config_manager.motor_directions(±1) 统一处理。
-                return float(pos or 0.0)
-
-            # 仅对“可恢复”的失败做重试（常见：TIMEOUT/瞬态CAN错误）
-            status = int(getattr(resp, "status", 0) or 0)
-            err_code = int(getattr(resp, "err_code", 0) or 0)
-            recoverable = (status in (3, 4)) or (err_code in (0x0101, 0x4034))
-            if recoverable and attempt < max_attempts:
-                time.sleep(retry_delay_s)
-                continue
-
-            # 不可恢复或已到最后一次
-            diag_hex = ""
+        # 诊断输出（默认关闭，避免刷屏）：仅在显式开启时输出 J4 的“原始回包字节 + sign/pos_raw”
+        # 注意：这里不做任何符号修正；符号修正应由上层 motor_config_manager.motor_directions(±1) 统一处理。
+        if self._trace_pos_raw and self.motor_id == 4:
             try:
-                diag_hex = resp.diag.hex() if getattr(resp, "diag", None) else ""
+                now = time.time()
+                if now - self._trace_pos_raw_last_ts >= 0.5:
+                    self._trace_pos_raw_last_ts = now
+                    data = resp.data or b""
+                    sign = int(data[0]) if len(data) >= 1 else None
+                    pos_raw = struct.unpack(">I", data[1:5])[0] if len(data) >= 5 else None
+                    print(
+                        f"[TRACE][POS_RAW] id={self.motor_id} opcode=0x{opcodes.READ_REALTIME_POSITION:02X} "
+                        f"data={data.hex()} sign={sign} pos_raw={pos_raw}"
+                    )
             except Exception:
-                diag_hex = ""
-            raise RuntimeError(f"读取位置失败: status={status} err_code=0x{err_code:04X} diag={diag_hex}")
-
-        # 理论不可达：兜底
-        if last_resp is not None:
-            status = int(getattr(last_resp, "status", 0) or 0)
-            err_code = int(getattr(last_resp, "err_code", 0) or 0)
-            raise RuntimeError(f"读取位置失败: status={status} err_code=0x{err_code:04X}")
-        raise RuntimeError("读取位置失败: unknown")
+                pass
+        pos = self.parser.parse_position(resp.data)
+        # 这里返回“电机原生坐标”的位置，方向修正由上层 motor_config_manager.motor_directions(±1) 统一处理。
+        return float(pos or 0.0)
     
     def get_speed(self) -> float:
         """读取当前转速（RPM）"""
@@ -1102,51 +1494,29 @@ class ZDTMotorController:
         读取电机状态（返回具有属性的对象，兼容GUI）
         
         Returns:
-            SimpleNamespace对象，包含以下属性：
+            MotorStatus对象，包含以下属性：
             - enabled: 使能状态
             - in_position: 到位状态
             - stalled: 堵转状态
             - stall_protection: 堵转保护状态
         """
         # 与 get_position 一致：对偶发 TIMEOUT/CAN_ERROR 做静默重试，避免高频轮询时刷屏
-        max_attempts = 3
-        retry_delay_s = 0.03
-        last_resp: Optional[UcpResponse] = None
-
-        for attempt in range(1, max_attempts + 1):
-            last = attempt == max_attempts
-            resp = self._request(opcodes.READ_MOTOR_STATUS, timeout_ms=300, suppress_err_log=not last)
-            last_resp = resp
-            if getattr(resp, "status", 0) == 0:
-                break
-
-            status = int(getattr(resp, "status", 0) or 0)
-            err_code = int(getattr(resp, "err_code", 0) or 0)
-            recoverable = (status in (3, 4)) or (err_code in (0x0101, 0x4034))
-            if recoverable and attempt < max_attempts:
-                time.sleep(retry_delay_s)
-                continue
-
-            diag_hex = ""
-            try:
-                diag_hex = resp.diag.hex() if getattr(resp, "diag", None) else ""
-            except Exception:
-                diag_hex = ""
-            raise RuntimeError(f"读取状态失败: status={status} err_code=0x{err_code:04X} diag={diag_hex}")
-
-        if last_resp is None:
-            raise RuntimeError("读取状态失败: unknown")
+        resp = self._poll_request(opcodes.READ_MOTOR_STATUS, fail_msg="读取状态失败")
         if resp.data and len(resp.data) >= 1:
             b = resp.data[0]
-            status_dict = {
-                'enabled': bool(b & 0x01),
-                'in_position': bool(b & 0x02),
-                'stalled': bool(b & 0x04),
-                'stall_protection': bool(b & 0x08)
-            }
-            # 转换为对象，支持 .enabled 和 .in_position 等属性访问
-            return SimpleNamespace(**status_dict)
-        return SimpleNamespace(enabled=False, in_position=False, stalled=False, stall_protection=False)
+            status = MotorStatus(bool(b & 0x01), bool(b & 0x02), bool(b & 0x04), bool(b & 0x08))
+        else:
+            status = MotorStatus(False, False, False, False)
+        self._status_cache = status
+        self._status_cache_ts = time.monotonic()
+        return status
+
+    def _get_status_cached(self, ttl: float = 0.01) -> MotorStatus:
+        """获取电机状态；ttl 秒内复用上一次 get_motor_status() 的结果，过期或已失效时重新读取"""
+        status = self._status_cache
+        if status is not None and time.monotonic() - self._status_cache_ts < ttl:
+            return status
+        return self.get_motor_status()
     
     def get_temperature(self) -> float:
         """读取温度（°C）"""
@@ -1203,7 +1573,7 @@ class ZDTMotorController:
         if resp.status != 0:
             raise RuntimeError(f"读取编码器原始值失败: status={resp.status}")
         if len(resp.data) >= 2:
-            return struct.unpack("<H", resp.data[:2])[0]
+            return _S_U16_LE.unpack_from(resp.data)[0]
         return 0
     
     def get_encoder_calibrated(self) -> int:
@@ -1212,7 +1582,7 @@ class ZDTMotorController:
         if resp.status != 0:
             raise RuntimeError(f"读取编码器校准值失败: status={resp.status}")
         if len(resp.data) >= 2:
-            return struct.unpack("<H", resp.data[:2])[0]
+            return _S_U16_LE.unpack_from(resp.data)[0]
         return 0
     
     def get_pulse_count(self) -> int:
@@ -1221,7 +1591,7 @@ class ZDTMotorController:
         if resp.status != 0:
             raise RuntimeError(f"读取脉冲计数失败: status={resp.status}")
         if len(resp.data) >= 4:
-            return struct.unpack("<i", resp.data[:4])[0]
+            return _S_I32_LE.unpack_from(resp.data)[0]
         return 0
     
     def get_input_pulse(self) -> int:
@@ -1230,7 +1600,7 @@ class ZDTMotorController:
         if resp.status != 0:
             raise RuntimeError(f"读取输入脉冲失败: status={resp.status}")
         if len(resp.data) >= 4:
-            return struct.unpack("<i", resp.data[:4])[0]
+            return _S_I32_LE.unpack_from(resp.data)[0]
         return 0
     
     def get_pid_parameters(self) -> dict:
@@ -1243,7 +1613,7 @@ class ZDTMotorController:
         # trapezoid_position_kp / direct_position_kp / speed_kp / speed_ki
         if len(resp.data) >= 16:
             try:
-                t_kp, d_kp, s_kp, s_ki = struct.unpack("<iiii", resp.data[:16])
+                t_kp, d_kp, s_kp, s_ki = _S_PID_I32X4.unpack_from(resp.data)
                 return {
                     "trapezoid_position_kp": t_kp,
                     "direct_position_kp": d_kp,
@@ -1257,7 +1627,7 @@ class ZDTMotorController:
         # 兼容旧占位：12B float32*3
         if len(resp.data) >= 12:
             try:
-                kp, ki, kd = struct.unpack("<fff", resp.data[:12])
+                kp, ki, kd = _S_PID_F32X3.unpack_from(resp.data)
                 return {"kp": kp, "ki": ki, "kd": kd, "raw_data": resp.data}
             except Exception:
                 pass
@@ -1298,7 +1668,7 @@ class ZDTMotorController:
             resp = self._request(opcodes.READ_RESISTANCE_INDUCTANCE)
             if resp.status == 0 and len(resp.data) >= 8:
                 # 返回格式：resistance(float32) + inductance(float32)
-                resistance, inductance = struct.unpack("<ff", resp.data[:8])
+                resistance, inductance = _S_RES_IND.unpack_from(resp.data)
                 return {
                     'resistance': resistance,
                     'inductance': inductance
@@ -1321,11 +1691,10 @@ class ZDTMotorController:
         fw = (resp.data[0] << 8) | resp.data[1]
         hw = (resp.data[2] << 8) | resp.data[3]
         
-        fw_major = fw // 100
-        fw_minor = (fw % 100) // 10
-        fw_patch = fw % 10
-        hw_major = hw // 100
-        hw_minor = (hw % 100) // 10
+        # 十进制拆位：fw=123 -> V1.2.3；hw 只取百位/十位
+        fw_q, fw_patch = divmod(fw, 10)
+        fw_major, fw_minor = divmod(fw_q, 10)
+        hw_major, hw_minor = divmod(hw // 10, 10)
         
         return {
             'firmware': f"ZDT_X57_V{fw_major}.{fw_minor}.{fw_patch}",
@@ -1355,12 +1724,13 @@ class ZDTMotorController:
         # 兼容旧参数名
         actual_mode = mode if mode is not None else (homing_mode if homing_mode is not None else 4)
         
-        args = struct.pack("<BB", actual_mode, int(multi_sync))
+        # 注意：trigger_homing 未禁用 multi_sync（仅标记弃用），因此这里保留调用方传入的值
+        args = _S_HOMING.pack(actual_mode, int(bool(multi_sync)))
         resp = self._request(opcodes.TRIGGER_HOMING, args, timeout_ms=300, suppress_err_log=True)
-        if getattr(resp, "status", 0) == 0:
+        if resp.status == 0:
             return
-        status = int(getattr(resp, "status", 0) or 0)
-        err_code = int(getattr(resp, "err_code", 0) or 0)
+        status = resp.status
+        err_code = resp.err_code
         if status == 4 and err_code == 0x0101:
             return
         if status == 3 and err_code == 0x4034:
@@ -1373,8 +1743,7 @@ class ZDTMotorController:
             self.logger.info(f"SET_ZERO_POSITION(id={self.motor_id}, save_to_chip={save_to_chip})")
         except Exception:
             pass
-        args = struct.pack("<B", int(save_to_chip))
-        resp = self._request(opcodes.SET_ZERO_POSITION, args)
+        resp = self._request(opcodes.SET_ZERO_POSITION, bytes((int(save_to_chip),)))
         if resp.status != 0:
             raise RuntimeError(f"设置零点失败: status={resp.status}")
     
@@ -1394,16 +1763,25 @@ class ZDTMotorController:
             return False
     
     def wait_for_homing_complete(self, timeout: float = 30.0) -> bool:
-        """等待回零完成"""
-        start = time.time()
-        while time.time() - start < timeout:
+        """等待回零完成（stop()/force_stop_homing() 会中止等待并返回 False）"""
+        # 单调时钟截止时间（不受系统校时影响）；轮询间隔从 50ms 指数退避到 500ms，
+        # 回零很快完成时不必白等半秒。
+        deadline = time.monotonic() + timeout
+        interval = 0.05
+        self._wait_abort.clear()
+        while True:
             if self.is_homing_complete():
                 return True
-            time.sleep(0.5)
-        return False
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            if self._wait_abort.wait(min(interval, remaining)):
+                return False
+            interval = min(0.5, interval * 1.5)
     
     def force_stop_homing(self) -> None:
         """强制停止回零"""
+        self._wait_abort.set()
         try:
             resp = self._request(opcodes.FORCE_STOP_HOMING)
             if resp.status != 0:
@@ -1435,85 +1813,66 @@ class ZDTMotorController:
                 - collision_detection_current: 碰撞检测电流
                 - collision_detection_time: 碰撞检测时间
                 - auto_homing_enabled: 自动回零使能
+            读取/解析失败时返回默认参数的副本（调用方可自由修改，不影响其他控制器）。
         """
-        from types import SimpleNamespace
-        
         try:
             # 该接口常在 UI 初始化/轮询时被调用；失败属于“可降级”，避免 warning 刷屏。
-            resp = self._request(opcodes.READ_HOMING_PARAMS, suppress_err_log=True)
-            if getattr(resp, "status", 0) == 0:
-                data_len = len(resp.data)
-                
-                # 15B（ZDT原始字段序列，按 ESP_can_firmware/test_motor.py 的 fallback 解析：大端）
-                # [0]mode(u8) [1]direction(u8)
-                # [2..3]speed(u16,BE) [4..7]timeout_ms(u32,BE)
-                # [8..9]collision_speed(u16,BE) [10..11]collision_current(u16,BE)
-                # [12..13]collision_time(u16,BE) [14]auto_homing(u8)
-                if data_len == 15:
-                    try:
-                        mode = resp.data[0]
-                        direction = resp.data[1]
-                        speed = int.from_bytes(resp.data[2:4], byteorder="big", signed=False)
-                        timeout_ms = int.from_bytes(resp.data[4:8], byteorder="big", signed=False)
-                        coll_speed = int.from_bytes(resp.data[8:10], byteorder="big", signed=False)
-                        coll_current = int.from_bytes(resp.data[10:12], byteorder="big", signed=False)
-                        coll_time = int.from_bytes(resp.data[12:14], byteorder="big", signed=False)
-                        auto_homing = bool(resp.data[14])
-                        return SimpleNamespace(
-                            mode=mode,
-                            direction=direction,
-                            speed=speed,
-                            timeout=timeout_ms,
-                            current_threshold=1000,  # 旧字段仅保留兼容
-                            collision_detection_speed=coll_speed,
-                            collision_detection_current=coll_current,
-                            collision_detection_time=coll_time,
-                            auto_homing_enabled=auto_homing
-                        )
-                    except Exception as e:
-                        self.logger.debug(f"回零参数解析失败(15B): {e}")
-                
-                # 兼容：8B（旧实现里用到的 <BBHHh>，需要 8 字节）
-                if data_len >= 8:
-                    try:
-                        mode, direction, speed_x10, timeout, current = struct.unpack("<BBHHh", resp.data[:8])
-                        return SimpleNamespace(
-                            mode=mode,
-                            direction=direction,
-                            speed=speed_x10 / 10.0,
-                            timeout=timeout,
-                            current_threshold=current,
-                            collision_detection_speed=50,  # 默认值
-                            collision_detection_current=500,
-                            collision_detection_time=100,
-                            auto_homing_enabled=False
-                        )
-                    except Exception as e:
-                        self.logger.debug(f"回零参数解析失败(>=8B兼容): {e}")
-                
-                # 长度异常：直接回退默认值（不刷 warning）
-                self.logger.debug(f"回零参数数据长度异常: {data_len}字节")
-            else:
-                status = int(getattr(resp, "status", 0) or 0)
-                err_code = int(getattr(resp, "err_code", 0) or 0)
-                self.logger.debug(f"读取回零参数失败: status={status} err_code=0x{err_code:04X}")
-                
+            resp = self._poll_request(
+                opcodes.READ_HOMING_PARAMS, timeout_ms=500, attempts=1,
+                fail_msg="读取回零参数失败", quiet=True,
+            )
         except Exception as e:
-            # 读取异常：回退默认值（不刷 warning）
-            self.logger.debug(f"读取回零参数异常: {e}")
+            # 读取失败/异常：回退默认值（不刷 warning）
+            self.logger.debug(f"{e}")
+        else:
+            data_len = len(resp.data)
+            
+            # 15B（ZDT原始字段序列，按 ESP_can_firmware/test_motor.py 的 fallback 解析：大端）
+            # [0]mode(u8) [1]direction(u8)
+            # [2..3]speed(u16,BE) [4..7]timeout_ms(u32,BE)
+            # [8..9]collision_speed(u16,BE) [10..11]collision_current(u16,BE)
+            # [12..13]collision_time(u16,BE) [14]auto_homing(u8)
+            if data_len == 15:
+                try:
+                    (mode, direction, speed, timeout_ms,
+                     coll_speed, coll_current, coll_time, auto_homing) = _S_HOMING_PARAMS_15.unpack_from(resp.data)
+                    return SimpleNamespace(
+                        mode=mode,
+                        direction=direction,
+                        speed=speed,
+                        timeout=timeout_ms,
+                        current_threshold=1000,  # 旧字段仅保留兼容
+                        collision_detection_speed=coll_speed,
+                        collision_detection_current=coll_current,
+                        collision_detection_time=coll_time,
+                        auto_homing_enabled=bool(auto_homing)
+                    )
+                except Exception as e:
+                    self.logger.debug(f"回零参数解析失败(15B): {e}")
+            
+            # 兼容：8B（旧实现里用到的 <BBHHh>，需要 8 字节）
+            if data_len >= 8:
+                try:
+                    mode, direction, speed_x10, timeout, current = _S_HOMING_PARAMS_LEGACY.unpack_from(resp.data)
+                    return SimpleNamespace(
+                        mode=mode,
+                        direction=direction,
+                        speed=speed_x10 / 10.0,
+                        timeout=timeout,
+                        current_threshold=current,
+                        collision_detection_speed=50,  # 默认值
+                        collision_detection_current=500,
+                        collision_detection_time=100,
+                        auto_homing_enabled=False
+                    )
+                except Exception as e:
+                    self.logger.debug(f"回零参数解析失败(>=8B兼容): {e}")
+            
+            # 长度异常：直接回退默认值（不刷 warning）
+            self.logger.debug(f"回零参数数据长度异常: {data_len}字节")
         
-        # 返回默认值
-        return SimpleNamespace(
-            mode=4,
-            direction=0,
-            speed=50.0,
-            timeout=30,
-            current_threshold=1000,
-            collision_detection_speed=50,
-            collision_detection_current=500,
-            collision_detection_time=100,
-            auto_homing_enabled=False
-        )
+        # 返回默认值（副本）
+        return copy.copy(_DEFAULT_HOMING_PARAMS)
     
     def get_homing_parameters_raw(self) -> bytes:
         """
@@ -1524,13 +1883,13 @@ class ZDTMotorController:
         """
         try:
             resp = self._request(opcodes.READ_HOMING_PARAMS, suppress_err_log=True)
-            if getattr(resp, "status", 0) == 0:
+            if resp.status == 0:
                 return resp.data
         except Exception as e:
             self.logger.debug(f"读取回零参数（原始）异常: {e}")
         
         # 返回默认值的字节表示
-        return struct.pack("<BBHHh", 4, 0, 500, 30, 1000)
+        return _DEFAULT_HOMING_PARAMS_RAW
     
     def modify_homing_parameters(self, 
                                 mode: int = None, 
@@ -1542,7 +1901,8 @@ class ZDTMotorController:
                                 collision_detection_current: int = None,
                                 collision_detection_time: int = None,
                                 auto_homing_enabled: bool = None,
-                                save_to_chip: bool = False) -> None:
+                                save_to_chip: bool = False,
+                                preserve_unspecified: bool = True) -> None:
         """
         修改回零参数（优先16B固件格式；保留旧格式兜底）
         
@@ -1557,9 +1917,17 @@ class ZDTMotorController:
             collision_detection_time: 碰撞检测时间，None表示不修改
             auto_homing_enabled: 自动回零使能，None表示不修改
             save_to_chip: 是否保存到芯片（默认False）
-        """
-        # 先读取当前参数
-        current_params = self.get_homing_parameters()
+            preserve_unspecified: 未指定字段是否保留设备当前值（默认True，需先读取一次参数）；
+                False 时未指定字段直接取默认值，省去读取往返
+        """
+        # 16B 格式的字段全部给定时无需预读；否则按 preserve_unspecified 决定读设备当前值还是用默认值
+        if None not in (mode, direction, speed, timeout, collision_detection_speed,
+                        collision_detection_current, collision_detection_time, auto_homing_enabled):
+            current_params = None
+        elif preserve_unspecified:
+            current_params = self.get_homing_parameters()
+        else:
+            current_params = copy.copy(_DEFAULT_HOMING_PARAMS)
         
         # 使用提供的值或当前值
         mode = mode if mode is not None else current_params.mode
@@ -1578,8 +1946,7 @@ class ZDTMotorController:
         # save(u8), mode(u8), direction(u8), speed_rpm(u16), timeout_ms(u32),
         # collision_speed(u16), collision_current(u16), collision_time(u16), auto(u8)
         try:
-            args = struct.pack(
-                "<BBBHIHHHB",
+            args = _S_HOMING_WRITE16.pack(
                 int(bool(save_to_chip)),
                 int(mode),
                 int(direction),
@@ -1603,8 +1970,11 @@ class ZDTMotorController:
         # 兼容：旧格式（部分老固件可能接受更短参数）
         try:
             speed_x10 = int(speed * 10)
+            if current_threshold is None and current_params is None:
+                # 快路径跳过了预读，旧格式仍需要 current_threshold：此时再补读一次
+                current_params = self.get_homing_parameters()
             current_threshold_val = current_threshold if current_threshold is not None else current_params.current_threshold
-            args = struct.pack("<BBHHh", int(mode), int(direction), int(speed_x10), int(timeout), int(current_threshold_val))
+            args = _S_HOMING_PARAMS_LEGACY.pack(int(mode), int(direction), int(speed_x10), int(timeout), int(current_threshold_val))
             
             resp = self._request(opcodes.MODIFY_HOMING_PARAMS, args)
             if resp.status != 0:
@@ -1620,36 +1990,40 @@ class ZDTMotorController:
     def is_enabled(self) -> bool:
         """检查是否使能"""
         try:
-            status = self.get_motor_status()
-            return status.enabled  # SimpleNamespace对象，使用属性访问
+            status = self._get_status_cached()
+            return status.enabled  # MotorStatus对象，使用属性访问
         except:
             return False
     
     def is_in_position(self) -> bool:
         """检查是否到位"""
         try:
-            status = self.get_motor_status()
-            return status.in_position  # SimpleNamespace对象，使用属性访问
+            status = self._get_status_cached()
+            return status.in_position  # MotorStatus对象，使用属性访问
         except:
             return False
     
     def wait_for_position(self, timeout: float = 10.0, interval: float = 0.2) -> bool:
-        """等待到位"""
-        start = time.time()
-        while time.time() - start < timeout:
+        """等待到位（stop()/emergency_stop() 会中止等待并返回 False）"""
+        deadline = time.monotonic() + timeout
+        self._wait_abort.clear()
+        while time.monotonic() < deadline:
             if self.is_in_position():
                 return True
-            time.sleep(interval)
+            if self._wait_abort.wait(interval):
+                return False
         return False
     
     def wait_for_homing(self, timeout: float = 30.0, interval: float = 0.5) -> bool:
-        """等待回零完成"""
-        start = time.time()
-        while time.time() - start < timeout:
+        """等待回零完成（stop()/force_stop_homing() 会中止等待并返回 False）"""
+        deadline = time.monotonic() + timeout
+        self._wait_abort.clear()
+        while time.monotonic() < deadline:
             status = self.get_homing_status()
             if not status.get('homing_in_progress', False):
                 return not status.get('homing_failed', True)
-            time.sleep(interval)
+            if self._wait_abort.wait(interval):
+                return False
         return False
     
     # ==================== 工具功能 ====================
@@ -1691,10 +2065,143 @@ class ZDTMotorController:
     # - 硬件层面保证同步性
     # ================================================================
     
+    def y42_request_batch(
+        self,
+        targets: Sequence[Tuple[int, float, float]],
+        is_absolute: bool = True,
+        timeout_ms: int = 2000,
+    ) -> Optional[UcpResponse]:
+        """
+        Y42批量位置下发：多台电机的目标打包进同一帧，一次UCP往返完成
+        
+        与逐台调用 move_to_position() 相比，总线字节相同，但只有一次往返延迟和一个超时窗口。
+        
+        Args:
+            targets: [(motor_id, position, speed), ...]，position 为电机端角度（度），speed 为 RPM
+            is_absolute: 是否绝对位置
+            timeout_ms: 超时时间（毫秒）
+        
+        Returns:
+            UcpResponse: UCP响应对象（status 由调用方判断）；
+            当前线程处于批量合帧模式（y42_batch_begin/y42_batch）时只暂存不下发，返回 None，
+            真实结果由 y42_batch_flush() 给出
+        """
+        if not targets:
+            raise ValueError("targets不能为空")
+
+        # 检查关节限位
+        # 注意：targets 中是电机角度（通过 get_actual_angle 转换后的），需要转换为关节角度后再与限位比较
+        # 电机数少于 _LIMIT_CHECK_NUMPY_MIN 时传列表逐个比较，数十台电机的机架才建 ndarray 向量化
+        limits = self._load_joint_limits()
+        if limits is not None:
+            n = len(targets)
+            if n < _LIMIT_CHECK_NUMPY_MIN:
+                motor_ids = [t[0] for t in targets]
+                motor_angles = [t[1] for t in targets]
+            else:
+                motor_ids = np.fromiter((t[0] for t in targets), dtype=np.int64, count=n)
+                motor_angles = np.fromiter((t[1] for t in targets), dtype=np.float64, count=n)
+            self._raise_if_joint_limits_violated(
+                motor_ids, motor_angles, limits, "⛔ 关节限位检查失败，拒绝下发Y42同步位置命令：",
+            )
+
+        if not self.client:
+            raise RuntimeError("未连接，请先调用 connect()")
+
+        # 一次性分配整帧（子命令常量字节由模板预填），逐个子命令 pack_into 可变字段
+        # UCP args: expected_response_motor_id(1B) + Y42帧[AA + 长度(2B BE) + payload + 6B]
+        sub_size = len(_Y42_POS_TEMPLATE)
+        payload_len = len(targets) * sub_size
+        buf = bytearray(_Y42_HEAD.size)
+        buf += _Y42_POS_TEMPLATE * len(targets)
+        buf.append(0x6B)
+        _Y42_HEAD.pack_into(buf, 0, targets[0][0], 0xAA, payload_len + 1)  # +1 for trailing 0x6B
+        offset = _Y42_HEAD.size
+        abs_flag = int(is_absolute)
+        for motor_id, target, speed in targets:
+            _Y42_POS_PATCH.pack_into(
+                buf, offset,
+                motor_id, 0xFB,
+                1 if target < 0 else 0,  # 方向
+                int(speed * 10),
+                int(abs(target) * 10),
+                abs_flag,
+            )
+            offset += sub_size
+
+        # Y42 绕过 _request()，需自行让状态快照失效
+        self._status_cache = None
+
+        # 批量合帧模式：只暂存子命令，真实下发与结果由 y42_batch_flush() 负责
+        if ZDTMotorController._y42_stage(self, buf):
+            return None
+
+        # Y42 必须广播（motor_id=0），因此不走按 self.motor_id 寻址的 _request()
+        return self.client.request(0, _Y42_OP, bytes(buf), timeout_ms)
+
+    def _y42_request_array(
+        self,
+        targets: np.ndarray,
+        speed: Union[float, np.ndarray],
+        is_absolute: bool = True,
+        timeout_ms: int = 2000,
+    ) -> Optional[UcpResponse]:
+        """
+        y42_request_batch 的 ndarray 版本：targets[i] 为电机 i+1 的电机端角度（度）
+        
+        限位检查与子命令组帧全部向量化完成，字节结果与逐条 pack_into 一致。
+        speed 可为标量或与 targets 等长的数组（RPM）。批量合帧模式下同样只暂存并返回 None。
+        """
+        angles = np.asarray(targets, dtype=np.float64).ravel()
+        n = angles.size
+        if n == 0:
+            raise ValueError("targets不能为空")
+        ids = np.arange(1, n + 1, dtype=np.int64)
+        speeds = np.asarray(speed, dtype=np.float64)
+
+        # 先于限位检查：NaN 与任何限位比较都为 False，不拦截就会被编码成 0
+        if not (np.isfinite(angles).all() and np.isfinite(speeds).all()):
+            raise ValueError("Y42目标包含 NaN/Inf")
+        # 与 int(x * 10) 一致：向零截断；越界时与标量路径 pack_into 一样拒绝，而不是静默回绕
+        spd_i = (speeds * 10).astype(np.int64)
+        pos_i = (np.abs(angles) * 10).astype(np.int64)
+        if (
+            spd_i.min(initial=0) < 0 or spd_i.max(initial=0) > 0xFFFF
+            or pos_i.max(initial=0) > 0xFFFFFFFF
+        ):
+            raise ValueError("Y42目标数值超出编码范围（speed×10 为 u16，|position|×10 为 u32）")
+
+        limits = self._load_joint_limits()
+        if limits is not None:
+            self._raise_if_joint_limits_violated(
+                ids, angles, limits, "⛔ 关节限位检查失败，拒绝下发Y42同步位置命令：",
+            )
+
+        if not self.client:
+            raise RuntimeError("未连接，请先调用 connect()")
+
+        subs = np.zeros(n, dtype=_Y42_POS_DTYPE)
+        subs["motor_id"] = ids
+        subs["func"] = 0xFB
+        subs["dir"] = angles < 0
+        subs["speed"] = spd_i
+        subs["pos"] = pos_i
+        subs["abs"] = int(is_absolute)
+        subs["tail"] = 0x6B
+        payload = subs.tobytes()
+        args = _Y42_HEAD.pack(1, 0xAA, len(payload) + 1) + payload + b"\x6B"
+
+        # Y42 绕过 _request()，需自行让状态快照失效
+        self._status_cache = None
+        if ZDTMotorController._y42_stage(self, args):
+            return None
+
+        return self.client.request(0, _Y42_OP, args, timeout_ms)
+
     @staticmethod
     def y42_sync_position(
         controllers: dict,
-        targets: dict,
+        targets: Union[dict, np.ndarray],
         speed: float = 500.0,
         is_absolute: bool = True,
         timeout_ms: int = 2000,
@@ -1705,7 +2212,8 @@ class ZDTMotorController:
         
         Args:
             controllers: {motor_id: ZDTMotorControllerUCPSimple} 字典
-            targets: {motor_id: target_position} 字典
+            targets: {motor_id: target_position} 字典；也可直接传 ndarray（targets[i] 对应电机 i+1），
+                规划器输出的数组无需再转字典，限位检查与组帧整批向量化完成
             speed: 运动速度（RPM）
             is_absolute: 是否绝对位置
             timeout_ms: 超时时间（毫秒）
@@ -1715,81 +2223,25 @@ class ZDTMotorController:
             targets = {1: 90.0, 2: 180.0}
             ZDTMotorControllerUCPSimple.y42_sync_position(controllers, targets, speed=500)
         """
-        if not controllers or not targets:
+        if not controllers or len(targets) == 0:
             raise ValueError("controllers和targets不能为空")
-        
-        # 检查关节限位
-        first_ctrl = list(controllers.values())[0]
-        limits = first_ctrl._load_joint_limits()
-        if limits is not None:
-            violations = []
-            motor_config = first_ctrl._load_motor_config()
-            for motor_id, target_motor_angle in targets.items():
-                # 注意：y42_sync_position 的 targets 参数是电机角度（通过 get_actual_angle 转换后的）
-                # 需要转换为关节角度后再与限位比较
-                joint_angle = first_ctrl._motor_angle_to_joint_angle(target_motor_angle, motor_id)
-                
-                joint_idx = motor_id - 1
-                if 0 <= joint_idx < 6:
-                    min_limit, max_limit = limits[joint_idx]
-                    if joint_angle < min_limit or joint_angle > max_limit:
-                        # 保存电机角度（目标角度）和关节角度，错误信息中显示电机角度
-                        violations.append((motor_id, joint_idx + 1, target_motor_angle, joint_angle, min_limit, max_limit))
-            if violations:
-                msg_parts = ["⛔ 关节限位检查失败，拒绝下发Y42同步位置命令："]
-                for motor_id, joint_num, motor_angle, joint_angle, min_lim, max_lim in violations:
-                    msg_parts.append(
-                        f"  电机{motor_id}(关节{joint_num}): 关节角度 {joint_angle:.2f}° 超出限位 [{min_lim:.2f}°, {max_lim:.2f}°]"
-                    )
-                error_msg = "\n".join(msg_parts)
-                first_ctrl.logger.error(error_msg)
-                raise RuntimeError(error_msg)
-        
-        # 构建Y42子命令
-        sub_commands = []
-        for motor_id, target in targets.items():
-            # 位置参数
-            direction = 1 if target < 0 else 0
-            pos_val = int(abs(target) * 10)
-            spd_val = int(speed * 10)
-            
-            # ZDT 0xFB 位置直通命令（大端序）
-            # FB + Dir(1B) + Speed(2B BE) + Position(4B BE) + Abs/Rel(1B) + Sync(1B) + 6B
-            zdt_cmd = struct.pack(">BBHI", 0xFB, direction, spd_val, pos_val) + \
-                      struct.pack(">BB", int(is_absolute), 0) + b"\x6B"
-            
-            # 子命令格式: [motor_id(1B)] + [ZDT命令]
-            sub_commands.append(bytes([motor_id]) + zdt_cmd)
-        
-        # 构建Y42帧: AA + 长度(2B BE) + payload + 6B
-        payload = b"".join(sub_commands)
-        total_len = len(payload) + 1  # +1 for trailing 0x6B
-        y42_frame = b"\xAA" + struct.pack(">H", total_len) + payload + b"\x6B"
-        
-        # UCP args: expected_response_motor_id(1B) + Y42帧
-        first_motor_id = list(targets.keys())[0]
-        args = struct.pack("<B", first_motor_id) + y42_frame
-        
-        # 使用第一个控制器的client发送（motor_id=0广播）
-        first_ctrl = list(controllers.values())[0]
-        if not first_ctrl.client:
-            raise RuntimeError("未连接，请先调用 connect()")
-        
-        resp = first_ctrl.client.request(
-            motor_id=0,  # 必须广播
-            opcode=opcodes.Y42_MULTI_MOTOR,
-            args=args,
-            timeout_ms=timeout_ms
-        )
 
-        # 打印诊断信息（便于定位“已执行但不回ACK / BUS_OFF / 总线错误”等）
-        try:
-            if getattr(resp, "diag", b""):
-                diag_hex = " ".join(f"{x:02X}" for x in resp.diag)
-                pass
-        except Exception:
-            pass
-        
+        # 使用第一个控制器的client发送（motor_id=0广播）；限位检查与组帧由 y42_request_batch 统一完成
+        first_ctrl = next(iter(controllers.values()))
+        for ctrl in controllers.values():
+            ctrl._status_cache = None
+        if isinstance(targets, np.ndarray):
+            resp = first_ctrl._y42_request_array(targets, speed, is_absolute=is_absolute, timeout_ms=timeout_ms)
+        else:
+            resp = first_ctrl.y42_request_batch(
+                [(motor_id, target, speed) for motor_id, target in targets.items()],
+                is_absolute=is_absolute,
+                timeout_ms=timeout_ms,
+            )
+        if resp is None:
+            # 批量合帧模式：已暂存，结果由 y42_batch_flush() 统一判断
+            return
+
         if resp.status != 0:
             # 在你的实际表现中：status=3/0x4034 仍可能“命令已生效但ACK缺失”。
             # 因此：仅对 0x4034 做“可选放行”，避免 UI 误报导致功能不可用。
@@ -1823,46 +2275,35 @@ class ZDTMotorController:
         if not controllers or not speeds:
             raise ValueError("controllers和speeds不能为空")
         
-        # 构建Y42子命令
-        sub_commands = []
+        # 一次性分配整帧，逐个子命令 pack_into
+        # UCP args = expected_response_motor_id + AA + 长度 + payload + 6B
+        sub_size = _Y42_SPEED_SUB.size
+        payload_len = len(speeds) * sub_size
+        buf = bytearray(_Y42_HEAD.size + payload_len + 1)
+        first_motor_id = next(iter(speeds))
+        _Y42_HEAD.pack_into(buf, 0, first_motor_id, 0xAA, payload_len + 1)
+        offset = _Y42_HEAD.size
         for motor_id, target_speed in speeds.items():
             direction = 1 if target_speed < 0 else 0
             spd_val = int(abs(target_speed) * 10)
             
             # ZDT 0xF6 速度模式（大端序）
             # F6 + Dir(1B) + Accel(2B BE) + Speed(2B BE) + Sync(1B) + 6B
-            zdt_cmd = struct.pack(">BBHH", 0xF6, direction, acceleration, spd_val) + \
-                      struct.pack(">B", 0) + b"\x6B"
-            
-            sub_commands.append(bytes([motor_id]) + zdt_cmd)
+            _Y42_SPEED_SUB.pack_into(buf, offset, motor_id, 0xF6, direction, acceleration, spd_val, 0, 0x6B)
+            offset += sub_size
+        buf[offset] = 0x6B
+        args = bytes(buf)
         
-        # 构建Y42帧
-        payload = b"".join(sub_commands)
-        total_len = len(payload) + 1
-        y42_frame = b"\xAA" + struct.pack(">H", total_len) + payload + b"\x6B"
-        
-        # 发送
-        first_motor_id = list(speeds.keys())[0]
-        args = struct.pack("<B", first_motor_id) + y42_frame
-        
-        first_ctrl = list(controllers.values())[0]
+        first_ctrl = next(iter(controllers.values()))
         if not first_ctrl.client:
             raise RuntimeError("未连接，请先调用 connect()")
+        for ctrl in controllers.values():
+            ctrl._status_cache = None
+        if ZDTMotorController._y42_stage(first_ctrl, args):
+            return
         
-        resp = first_ctrl.client.request(
-            motor_id=0,
-            opcode=opcodes.Y42_MULTI_MOTOR,
-            args=args,
-            timeout_ms=timeout_ms
-        )
+        resp = first_ctrl.client.request(0, _Y42_OP, args, timeout_ms)
 
-        try:
-            if getattr(resp, "diag", b""):
-                diag_hex = " ".join(f"{x:02X}" for x in resp.diag)
-                pass
-        except Exception:
-            pass
-        
         if resp.status != 0:
             if resp.status == 3 and resp.err_code == 0x4034 and allow_status3:
                 first_ctrl.logger.warning(
@@ -1874,6 +2315,11 @@ class ZDTMotorController:
         
         first_ctrl.logger.info(f"Y42同步速度已触发: {len(speeds)}个电机")
     
+    # Y42 同步使能帧缓存：{(motor_id 顺序元组, enabled): UCP args}
+    # 使能/失能帧只取决于电机集合（及其顺序）与 enabled，UI 反复切换力矩时直接复用。
+    _Y42_ENABLE_CACHE: dict = {}
+    _Y42_ENABLE_CACHE_MAX = 8
+
     @staticmethod
     def y42_sync_enable(
         controllers: dict,
@@ -1892,43 +2338,42 @@ class ZDTMotorController:
         if not controllers:
             raise ValueError("controllers不能为空")
         
-        # 构建Y42子命令
-        sub_commands = []
-        for motor_id in controllers.keys():
-            # ZDT 0xF3 使能命令（大端序）
-            # F3 + Enabled(1B) + Sync(1B) + 6B
-            zdt_cmd = struct.pack(">BB", 0xF3, int(enabled)) + \
-                      struct.pack(">B", 0) + b"\x6B"
-            
-            sub_commands.append(bytes([motor_id]) + zdt_cmd)
-        
-        # 构建Y42帧
-        payload = b"".join(sub_commands)
-        total_len = len(payload) + 1
-        y42_frame = b"\xAA" + struct.pack(">H", total_len) + payload + b"\x6B"
-        
-        # 发送
-        first_motor_id = list(controllers.keys())[0]
-        args = struct.pack("<B", first_motor_id) + y42_frame
-        
-        first_ctrl = list(controllers.values())[0]
+        en = int(enabled)
+        cache = ZDTMotorController._Y42_ENABLE_CACHE
+        cache_key = (tuple(controllers), en)
+        args = cache.get(cache_key)
+        if args is None:
+            # 一次性分配整帧，逐个子命令 pack_into
+            # UCP args = expected_response_motor_id + AA + 长度 + payload + 6B
+            sub_size = _Y42_ENABLE_SUB.size
+            payload_len = len(controllers) * sub_size
+            buf = bytearray(_Y42_HEAD.size + payload_len + 1)
+            first_motor_id = next(iter(controllers))
+            _Y42_HEAD.pack_into(buf, 0, first_motor_id, 0xAA, payload_len + 1)
+            offset = _Y42_HEAD.size
+            for motor_id in controllers.keys():
+                # ZDT 0xF3 使能命令（大端序）
+                # F3 + Enabled(1B) + Sync(1B) + 6B
+                _Y42_ENABLE_SUB.pack_into(buf, offset, motor_id, 0xF3, en, 0, 0x6B)
+                offset += sub_size
+            buf[offset] = 0x6B
+            args = bytes(buf)
+
+            # 简单 FIFO 淘汰：超过上限时丢弃最早加入的一项
+            if len(cache) >= ZDTMotorController._Y42_ENABLE_CACHE_MAX:
+                cache.pop(next(iter(cache)), None)
+            cache[cache_key] = args
+        
+        first_ctrl = next(iter(controllers.values()))
         if not first_ctrl.client:
             raise RuntimeError("未连接，请先调用 connect()")
+        for ctrl in controllers.values():
+            ctrl._status_cache = None
+        if ZDTMotorController._y42_stage(first_ctrl, args):
+            return
         
-        resp = first_ctrl.client.request(
-            motor_id=0,
-            opcode=opcodes.Y42_MULTI_MOTOR,
-            args=args,
-            timeout_ms=timeout_ms
-        )
+        resp = first_ctrl.client.request(0, _Y42_OP, args, timeout_ms)
 
-        try:
-            if getattr(resp, "diag", b""):
-                diag_hex = " ".join(f"{x:02X}" for x in resp.diag)
-                pass
-        except Exception:
-            pass
-        
         if resp.status != 0:
             if resp.status == 3 and resp.err_code == 0x4034 and allow_status3:
                 first_ctrl.logger.warning(
@@ -1940,6 +2385,138 @@ class ZDTMotorController:
         
         action = "使能" if enabled else "失能"
         first_ctrl.logger.info(f"Y42同步{action}已触发: {len(controllers)}个电机")
+
+    # ==================== Y42 批量合帧 ====================
+
+    @staticmethod
+    def y42_batch_begin() -> None:
+        """
+        开始 Y42 批量合帧（当前线程）
+        
+        之后调用的 y42_sync_position / y42_sync_speed / y42_sync_enable 只做限位检查与组包，
+        子命令暂存起来；y42_batch_flush() 时合并为一个 Y42 帧、一次 UCP 往返下发。
+        固件按子命令顺序依次下发到 CAN，因此同一电机的“使能 + 位置”等组合保持调用顺序。
+        
+        注意：multi_motor_command 自带 ACK 候选重试，不参与合帧；
+        合帧只能发往一条串口连接，暂存的子命令必须来自共用同一 client 的控制器。
+        begin 与 flush 之间抛出异常时必须调用 y42_batch_discard()，否则本线程之后的
+        y42_sync_* 都只会被暂存而不下发；推荐直接使用 y42_batch() 上下文管理器。
+        
+        示例：
+            ZDTMotorControllerUCPSimple.y42_batch_begin()
+            ZDTMotorControllerUCPSimple.y42_sync_enable(controllers, True)
+            ZDTMotorControllerUCPSimple.y42_sync_position(controllers, targets, speed=500)
+            ZDTMotorControllerUCPSimple.y42_batch_flush()
+        """
+        if ZDTMotorController._y42_batch_active():
+            raise RuntimeError("Y42 批量合帧已开始，请先调用 y42_batch_flush() 或 y42_batch_discard()")
+        _Y42_BATCH_LOCAL.staged = []
+
+    @staticmethod
+    @contextmanager
+    def y42_batch(timeout_ms: int = 2000, allow_status3: bool = True):
+        """
+        Y42 批量合帧上下文（当前线程）：正常退出时 flush 下发，块内抛出异常时丢弃暂存的子命令
+        
+        示例：
+            with ZDTMotorControllerUCPSimple.y42_batch():
+                ZDTMotorControllerUCPSimple.y42_sync_enable(controllers, True)
+                ZDTMotorControllerUCPSimple.y42_sync_position(controllers, targets, speed=500)
+        """
+        ZDTMotorController.y42_batch_begin()
+        try:
+            yield
+        except BaseException:
+            ZDTMotorController.y42_batch_discard()
+            raise
+        ZDTMotorController.y42_batch_flush(timeout_ms=timeout_ms, allow_status3=allow_status3)
+
+    @staticmethod
+    def y42_batch_discard() -> int:
+        """
+        放弃当前线程的批量合帧：丢弃暂存的子命令并退出合帧模式（未处于合帧模式时无操作）
+        
+        Returns:
+            被丢弃的子命令组数
+        """
+        staged = getattr(_Y42_BATCH_LOCAL, "staged", None)
+        _Y42_BATCH_LOCAL.staged = None
+        return len(staged) if staged else 0
+
+    @staticmethod
+    def y42_batch_flush(timeout_ms: int = 2000, allow_status3: bool = True) -> Optional[UcpResponse]:
+        """
+        结束批量合帧并下发暂存的全部子命令（一个 Y42 帧）
+        
+        Args:
+            timeout_ms: 超时时间（毫秒）
+            allow_status3: 是否对 ACK 超时(status=3, 0x4034)放行
+        
+        Returns:
+            UcpResponse；没有暂存任何子命令时返回 None
+        """
+        staged = getattr(_Y42_BATCH_LOCAL, "staged", None)
+        _Y42_BATCH_LOCAL.staged = None
+        if not staged:
+            return None
+
+        first_ctrl = staged[0][0]
+        if not first_ctrl.client:
+            raise RuntimeError("未连接，请先调用 connect()")
+        for ctrl, _ in staged:
+            ctrl._status_cache = None
+
+        # UCP args: expected_response_motor_id(首个子命令的电机) + AA + 长度 + payload + 6B
+        payload = b"".join(p for _, p in staged)
+        args = _Y42_HEAD.pack(payload[0], 0xAA, len(payload) + 1) + payload + b"\x6B"
+        resp = first_ctrl.client.request(0, _Y42_OP, args, timeout_ms)
+
+        if resp.status != 0:
+            if resp.status == 3 and resp.err_code == 0x4034 and allow_status3:
+                first_ctrl.logger.warning(
+                    f"Y42批量合帧 ACK 超时(0x4034) 但已放行（命令可能已执行）: "
+                    f"status=3 err_code=0x{resp.err_code:04X}"
+                )
+            else:
+                raise RuntimeError(f"Y42批量合帧失败: status={resp.status}, err_code=0x{resp.err_code:04X}")
+
+        first_ctrl.logger.debug("Y42批量合帧已发送: %d组命令, %d字节", len(staged), len(payload))
+        return resp
+
+    @staticmethod
+    def _y42_batch_active() -> bool:
+        """当前线程是否处于 Y42 批量合帧模式"""
+        return getattr(_Y42_BATCH_LOCAL, "staged", None) is not None
+
+    @staticmethod
+    def _y42_stage(ctrl: "ZDTMotorController", args) -> bool:
+        """
+        批量模式下暂存一条 Y42 UCP args 的子命令部分（去掉 ack_id + AA + 长度 头与末尾 6B）
+        
+        Returns:
+            True=已暂存（调用方不应再下发），False=非批量模式
+        
+        Raises:
+            ValueError: 与已暂存子命令不在同一串口连接（client），或合帧后超出单帧上限
+        """
+        staged = getattr(_Y42_BATCH_LOCAL, "staged", None)
+        if staged is None:
+            return False
+        # flush 只经首个控制器的 client 发送，混入其他串口的子命令会被发到错误的总线上
+        if staged and ctrl.client is not staged[0][0].client:
+            raise ValueError(
+                f"Y42 批量合帧只能发往同一串口连接：电机{ctrl.motor_id}的连接与已暂存的子命令不同，"
+                f"请分别合帧或先 y42_batch_flush()"
+            )
+        sub = bytes(args[_Y42_HEAD.size:-1])
+        total = _Y42_HEAD.size + sum(len(p) for _, p in staged) + len(sub) + 1
+        if total > _Y42_BATCH_MAX_ARGS:
+            raise ValueError(
+                f"Y42 批量合帧超出单帧上限: {total}B > {_Y42_BATCH_MAX_ARGS}B，"
+                f"请先 y42_batch_flush() 再继续暂存"
+            )
+        staged.append((ctrl, sub))
+        return True
     
     # ==================== 上下文管理器 ====================
     
@@ -2030,16 +2607,15 @@ class ZDTMotorController:
         if isinstance(params, DriveParameters):
             p = params
         elif isinstance(params, dict):
-            p = DriveParameters(**{k: params.get(k, getattr(DriveParameters(), k)) for k in DriveParameters().__dict__.keys() if k in DriveParameters().__dict__})
+            # 缺省字段使用 DriveParameters 默认值
+            p = DriveParameters(**{k: params[k] for k in _DRIVE_PARAM_FIELDS if k in params})
         else:
-            # 尝试按属性拷贝
-            base = DriveParameters()
-            for k in base.__dict__.keys():
-                if k in ("raw_data", "parsed_ok"):
-                    continue
-                if hasattr(params, k):
-                    setattr(base, k, getattr(params, k))
-            p = base
+            # 尝试按属性拷贝（兼容/调试字段不拷贝）
+            p = DriveParameters(**{
+                k: getattr(params, k)
+                for k in _DRIVE_PARAM_FIELDS
+                if k not in _DRIVE_PARAM_COMPAT_FIELDS and hasattr(params, k)
+            })
 
         args = p.to_ucp_args(save_to_chip=save_to_chip)
         resp = self._request(opcodes.MODIFY_DRIVE_PARAMETERS, args, timeout_ms=timeout_ms)
@@ -2129,150 +2705,133 @@ class ZDTMotorController:
         if max_ack_candidates < 1:
             max_ack_candidates = 1
         
-        try:
-            # 检查关节限位（在构建命令前）
-            limits = self._load_joint_limits()
-            if limits is not None:
-                violations = []
-                for i, cmd in enumerate(commands):
-                    # cmd可能是list、bytes或tuple
-                    if isinstance(cmd, (list, tuple)):
-                        cmd_bytes = bytes(cmd)
-                    elif isinstance(cmd, bytes):
-                        cmd_bytes = cmd
-                    else:
-                        continue
-                    
-                    # 解析Y42子命令中的角度：motor_id(1B) + ZDT命令
-                    # ZDT 0xFB位置命令格式: FB(1B) + Dir(1B) + Speed(2B BE) + Position(4B BE) + Abs/Rel(1B) + Sync(1B) + 6B(1B)
-                    # 子命令格式: [motor_id(1B)] + [ZDT命令(11B)] = 总共12字节
-                    # 字节布局: [motor_id] [FB] [Dir] [Speed_H] [Speed_L] [Pos_B3] [Pos_B2] [Pos_B1] [Pos_B0] [Abs/Rel] [Sync] [6B]
-                    if len(cmd_bytes) >= 12 and cmd_bytes[1] == 0xFB:
-                        motor_id = cmd_bytes[0]
-                        # Position在子命令中的位置：motor_id(0) + FB(1) + Dir(2) + Speed(3-4) + Position(5-8)
-                        pos_val = struct.unpack(">I", cmd_bytes[5:9])[0]
-                        motor_angle_deg = pos_val / 10.0
-                        
-                        # 将电机角度转换为关节角度
-                        joint_angle_deg = self._motor_angle_to_joint_angle(motor_angle_deg, motor_id)
-                        
-                        joint_idx = motor_id - 1
-                        if 0 <= joint_idx < 6:
-                            min_limit, max_limit = limits[joint_idx]
-                            if joint_angle_deg < min_limit or joint_angle_deg > max_limit:
-                                # 保存电机角度（目标角度）和关节角度，错误信息中显示电机角度
-                                violations.append((motor_id, joint_idx + 1, motor_angle_deg, joint_angle_deg, min_limit, max_limit))
-                
-                if violations:
-                    msg_parts = ["⛔ 关节限位检查失败，拒绝下发Y42多机聚合命令："]
-                    for motor_id, joint_num, motor_angle, joint_angle, min_lim, max_lim in violations:
-                        msg_parts.append(
-                            f"  电机{motor_id}(关节{joint_num}): 关节角度 {joint_angle:.2f}° 超出限位 [{min_lim:.2f}°, {max_lim:.2f}°]"
-                        )
-                    error_msg = "\n".join(msg_parts)
-                    self.logger.error(error_msg)
-                    raise RuntimeError(error_msg)
-            
-            # 将命令列表转换为字节串
-            sub_commands = []
-            for i, cmd in enumerate(commands):
-                # cmd可能是list、bytes或tuple
-                if isinstance(cmd, (list, tuple)):
-                    cmd_bytes = bytes(cmd)
-                elif isinstance(cmd, bytes):
-                    cmd_bytes = cmd
-                else:
-                    error_msg = f"子命令 {i+1} 类型错误: {type(cmd)}"
-                    raise TypeError(error_msg)
-                
-                sub_commands.append(cmd_bytes)
-                # no stdout
-            
-            # 构建Y42帧: AA + 长度(2B BE) + payload + 0x6B
-            payload = b"".join(sub_commands)
-            total_len = len(payload) + 1  # +1 for trailing 0x6B
-            y42_frame = struct.pack('>BH', 0xAA, total_len) + payload + b'\x6B'
+        # 将命令列表转换为字节串（只转换一次，限位检查与组帧共用）
+        sub_commands = []
+        for i, cmd in enumerate(commands):
+            # cmd可能是list、bytes或tuple
+            if isinstance(cmd, (list, tuple)):
+                cmd_bytes = bytes(cmd)
+            elif isinstance(cmd, bytes):
+                cmd_bytes = cmd
+            else:
+                error_msg = f"子命令 {i+1} 类型错误: {type(cmd)}"
+                raise TypeError(error_msg)
             
+            sub_commands.append(cmd_bytes)
             # no stdout
-            
-            # 选择“期望响应电机ID”（很关键）：
-            # 固件侧会“广播发送”，但只从 expected_ack_motor_id 等待 ACK。
-            # 如果固定等 1 号，而 1 号电机不在线/ID不对/不回包，则整次Y42都会以 0x4034 超时失败。
-            cand_ids = []
-            try:
-                cand_ids = sorted({b[0] for b in sub_commands if b})
-            except Exception:
-                cand_ids = []
-            if not cand_ids:
-                cand_ids = [expected_ack_motor_id] if expected_ack_motor_id else [1]
-
-            # 将用户传入的 expected_ack_motor_id 放到首选；若不在本次子命令集合内，则自动回退
-            if expected_ack_motor_id in cand_ids:
-                ordered_ack_ids = [expected_ack_motor_id] + [i for i in cand_ids if i != expected_ack_motor_id]
-            else:
-                ordered_ack_ids = cand_ids
-            # 主观逻辑约束：最多尝试 N 个候选（默认 2）
-            ordered_ack_ids = ordered_ack_ids[:max_ack_candidates]
-
-            last_resp = None
-            last_error = None
-            for ack_id in ordered_ack_ids:
-                # UCP args: expected_response_motor_id(1B) + Y42帧
-                args = bytes([ack_id]) + y42_frame
-
-                # 发送UCP请求（broadcast to motor_id=0）
-                resp = self.client.request(
-                    motor_id=0,  # 广播地址
-                    opcode=opcodes.Y42_MULTI_MOTOR,
-                    args=args,
-                    timeout_ms=timeout_ms
+        
+        # 检查关节限位（在构建命令前）
+        # 解析Y42子命令中的角度：motor_id(1B) + ZDT命令
+        # ZDT 0xFB位置命令格式: FB(1B) + Dir(1B) + Speed(2B BE) + Position(4B BE) + Abs/Rel(1B) + Sync(1B) + 6B(1B)
+        # 子命令格式: [motor_id(1B)] + [ZDT命令(11B)] = 总共12字节
+        # 字节布局: [motor_id] [FB] [Dir] [Speed_H] [Speed_L] [Pos_B3] [Pos_B2] [Pos_B1] [Pos_B0] [Abs/Rel] [Sync] [6B]
+        limits = self._load_joint_limits()
+        if limits is not None:
+            pos_cmds = [c for c in sub_commands if len(c) >= 12 and c[1] == 0xFB]
+            if pos_cmds:
+                # Position在子命令中的位置：5-8（大端 u32）
+                if len(pos_cmds) < _LIMIT_CHECK_NUMPY_MIN:
+                    # 常见的单臂 1~6 条子命令：逐条 unpack_from，省去建 ndarray 的固定开销
+                    motor_ids = [c[0] for c in pos_cmds]
+                    motor_angles = [_S_U32_BE.unpack_from(c, 5)[0] / 10.0 for c in pos_cmds]
+                else:
+                    # 大批量：所有位置一次性按大端 u32 解析
+                    motor_ids = np.fromiter((c[0] for c in pos_cmds), dtype=np.int64, count=len(pos_cmds))
+                    motor_angles = np.frombuffer(b"".join(c[5:9] for c in pos_cmds), dtype=">u4") / 10.0
+                self._raise_if_joint_limits_violated(
+                    motor_ids, motor_angles, limits, "⛔ 关节限位检查失败，拒绝下发Y42多机聚合命令："
                 )
-                last_resp = resp
+        
+        # 构建Y42帧（一次性分配）：[expected_response_motor_id 占位] + AA + 长度(2B BE) + payload + 0x6B
+        # 首字节在下面按候选 ack_id 逐次填写，其余部分所有候选共用
+        payload_len = sum(map(len, sub_commands))
+        frame = bytearray(_Y42_HEAD.size + payload_len + 1)
+        _Y42_HEAD.pack_into(frame, 0, 0, 0xAA, payload_len + 1)  # +1 for trailing 0x6B
+        offset = _Y42_HEAD.size
+        for cmd_bytes in sub_commands:
+            end = offset + len(cmd_bytes)
+            frame[offset:end] = cmd_bytes
+            offset = end
+        frame[offset] = 0x6B
+        
+        # no stdout
+        
+        # 选择“期望响应电机ID”（很关键）：
+        # 固件侧会“广播发送”，但只从 expected_ack_motor_id 等待 ACK。
+        # 如果固定等 1 号，而 1 号电机不在线/ID不对/不回包，则整次Y42都会以 0x4034 超时失败。
+        # 单电机（Y42 当作单机协议复用、逐关节回退）时候选只有它自己，无需去重排序；
+        # 多电机时将用户传入的 expected_ack_motor_id 放到首选，且最多尝试 N 个候选（默认 2）
+        if len(sub_commands) == 1 and sub_commands[0]:
+            ordered_ack_ids = (sub_commands[0][0],)
+        else:
+            ordered_ack_ids = _y42_ack_order(
+                tuple(b[0] for b in sub_commands if b), expected_ack_motor_id, max_ack_candidates
+            )
 
-                # 关键诊断：打印 OmniCAN 返回的TWAI状态（便于区分“没回包”vs“总线错误/过滤/BusOff”）
-                try:
-                    if getattr(resp, "diag", b""):
-                        diag_hex = " ".join(f"{x:02X}" for x in resp.diag)
-                except Exception:
-                    pass
+        last_resp = None
+        last_error = None
+        self._status_cache = None
+        request = self.client.request
+        # 候选电机共享 timeout_ms 总预算：最坏情况（前面的候选都 ACK 超时）总耗时约 1×timeout_ms，
+        # 而不是 N×timeout_ms。电机 CAN ACK 通常在毫秒级返回，单次预算保留 200ms 下限。
+        # 注：固件只接受单个 expected_response_motor_id 且客户端为同步串口，无法并行等待多个候选的 ACK。
+        if len(ordered_ack_ids) > 1:
+            attempt_timeout_ms = max(200, timeout_ms // len(ordered_ack_ids))
+        else:
+            attempt_timeout_ms = timeout_ms
+        # UcpClient 组 TLV 时直接拼接缓冲区，传 memoryview 即可省去每次 bytes(frame) 的整帧拷贝；
+        # 请求为同步调用，返回前不会再改写 frame
+        frame_view = memoryview(frame)
+        for ack_id in ordered_ack_ids:
+            # UCP args: expected_response_motor_id(1B) + Y42帧
+            frame[0] = ack_id
+
+            # 发送UCP请求（broadcast to motor_id=0）
+            resp = request(0, _Y42_OP, frame_view, attempt_timeout_ms)
+            last_resp = resp
 
-                # 成功直接返回
-                if resp.status == 0:
-                    # 该函数可能在高频控制回路中被反复调用；INFO 会造成刷屏。
-                    # 如需排查通讯，可将对应 logger 等级调到 DEBUG 再观察。
-                    self.logger.debug(
-                        "Y42聚合命令已发送: %d个子命令 (ack_motor_id=%s)",
-                        len(commands),
-                        ack_id,
-                    )
-                    return resp
+            # 成功直接返回
+            if resp.status == 0:
+                # 该函数可能在高频控制回路中被反复调用；INFO 会造成刷屏。
+                # 如需排查通讯，可将对应 logger 等级调到 DEBUG 再观察。
+                self.logger.debug(
+                    "Y42聚合命令已发送: %d个子命令 (ack_motor_id=%s)",
+                    len(commands),
+                    ack_id,
+                )
+                return resp
+
+            # 关键诊断：打印 OmniCAN 返回的TWAI状态（便于区分“没回包”vs“总线错误/过滤/BusOff”）
+            # 只对失败响应、且 DEBUG 级别开启时才做 hex 转换；成功路径不碰 diag
+            if resp.diag and self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(
+                    "Y42聚合命令回包诊断: ack_motor_id=%s status=%s diag=%s",
+                    ack_id, resp.status, resp.diag.hex(" ").upper(),
+                )
 
-                # 如果是“CAN超时(0x4034)”且还有候选电机，则自动换一个电机ID再试
-                if resp.status == 3 and resp.err_code == 0x4034 and ack_id != ordered_ack_ids[-1]:
-                    continue
+            # 如果是“CAN超时(0x4034)”且还有候选电机，则自动换一个电机ID再试
+            if resp.status == 3 and resp.err_code == 0x4034 and ack_id != ordered_ack_ids[-1]:
+                continue
 
-                # 允许 status==3 放行（用于上位机控制场景，避免“动作已执行但 ACK 丢失”导致流程中断）
-                if resp.status == 3 and allow_status3:
-                    warn_msg = (
-                        f"Y42聚合命令收到 status=3（可能 ACK 超时），但已按 allow_status3 放行: "
-                        f"err_code=0x{resp.err_code:04X}, ack_motor_id={ack_id}, mode={mode!r}"
-                    )
-                    self.logger.warning(warn_msg)
-                    return resp
+            # 允许 status==3 放行（用于上位机控制场景，避免“动作已执行但 ACK 丢失”导致流程中断）
+            if resp.status == 3 and allow_status3:
+                self.logger.warning(
+                    "Y42聚合命令收到 status=3（可能 ACK 超时），但已按 allow_status3 放行: "
+                    "err_code=0x%04X, ack_motor_id=%s, mode=%r",
+                    resp.err_code, ack_id, mode,
+                )
+                return resp
 
-                last_error = RuntimeError(f"Y42聚合命令失败: status={resp.status}, err_code=0x{resp.err_code:04X}")
-                break
-            
-            # 所有候选都失败：抛出最后一次的错误
-            if last_error is None and last_resp is not None:
-                last_error = RuntimeError(f"Y42聚合命令失败: status={last_resp.status}, err_code=0x{last_resp.err_code:04X}")
-            if last_error is None:
-                last_error = RuntimeError("Y42聚合命令失败：未知错误（无响应对象）")
-            self.logger.error(str(last_error))
-            raise last_error
-            
-        except Exception as e:
-            raise
+            last_error = RuntimeError(f"Y42聚合命令失败: status={resp.status}, err_code=0x{resp.err_code:04X}")
+            break
+        
+        # 所有候选都失败：抛出最后一次的错误
+        if last_error is None and last_resp is not None:
+            last_error = RuntimeError(f"Y42聚合命令失败: status={last_resp.status}, err_code=0x{last_resp.err_code:04X}")
+        if last_error is None:
+            last_error = RuntimeError("Y42聚合命令失败：未知错误（无响应对象）")
+        self.logger.error(str(last_error))
+        raise last_error
     
     def send_broadcast_command(self, command_data: bytes = b"") -> None:
         """
@@ -2323,26 +2882,17 @@ class ZDTMotorController:
             - active_connections: 活跃连接数
             - connections: 每个连接的详细信息（端口、波特率、引用计数）
         """
-        pool = UcpConnectionPool.instance()
-        connections_info = {}
-        for key in pool._connections.keys():
-            port, baudrate = key.split(":")
-            ref_count = pool._ref_counts.get(key, 0)
-            connections_info[key] = {
-                "port": port,
-                "baudrate": int(baudrate),
-                "ref_count": ref_count
-            }
-        
+        # 连接池按 (port, baudrate) 元组记录连接，端口/波特率直接取自键，无需从 "port:baudrate" 字符串反解析
+        connections_info = UcpConnectionPool.instance().get_info()
         return {
             "mode": "UCP",
-            "active_connections": len(pool._connections),
+            "active_connections": len(connections_info),
             "connections": connections_info
         }
     
     # ==================== 轨迹批量执行接口 ====================
     
-    def upload_trajectory(self, trajectory_points: list, timeout_ms: int = 5000) -> bool:
+    def upload_trajectory(self, trajectory_points: list, timeout_ms: int = 5000, pipeline_depth: int = 1) -> bool:
         """
         批量上传轨迹点到 OmniCAN 缓存
         
@@ -2356,6 +2906,8 @@ class ZDTMotorController:
         Args:
             trajectory_points: 轨迹点列表
             timeout_ms: 超时时间(ms)
+            pipeline_depth: 批量包流水线深度（默认1=逐包应答）；>1 时最多同时有 N 个批量包在途，
+                需要 client 支持 request_pipelined() 且固件能缓存排队的请求帧
             
         Returns:
             bool: 上传成功返回True
@@ -2368,92 +2920,174 @@ class ZDTMotorController:
         # 这里做“上传前抽稀”，并把被删点的 interval_ms 累加到下一保留点，保证总时间尺度不变。
         MAX_TRAJECTORY_POINTS = 120  # 保守值：宁可更粗一点也避免 0x7003
 
-        def _decimate_points_keep_timing(points: list, max_points: int) -> list:
+        def _decimate_points_keep_timing(points: List[_TrajPoint], max_points: int) -> List[_TrajPoint]:
             n = len(points)
             if max_points is None or max_points <= 0 or n <= max_points:
                 return points
             if n <= 2 or max_points == 1:
                 return [points[-1]] if points else []
 
-            # 选取均匀索引（含首尾），并确保严格递增且不重复
-            keep = []
-            last = -1
-            for i in range(max_points):
-                idx = int(round(i * (n - 1) / float(max_points - 1)))
-                if idx <= last:
-                    idx = last + 1
-                if idx >= n:
-                    idx = n - 1
-                keep.append(idx)
-                last = idx
-            if keep[-1] != n - 1:
-                keep[-1] = n - 1
+            # 选取均匀索引（含首尾）：n > max_points 时步长 >= 1，取整后天然严格递增且末项为 n-1
+            keep = np.unique(np.rint(np.arange(max_points) * (n - 1) / float(max_points - 1)).astype(np.int64))
+
+            def _interval(p: _TrajPoint) -> int:
+                try:
+                    return int(p.interval_ms or 0)
+                except Exception:
+                    return 0
+
+            # 相邻保留点之间（不含前一保留点、含当前点）的 interval_ms 之和 = 前缀和之差
+            csum = np.cumsum(np.fromiter(map(_interval, points), dtype=np.int64, count=n))
+            sums = np.diff(csum[keep]).tolist()
+
+            out = [points[keep[0]]]
+            for idx, interval_sum in zip(keep[1:].tolist(), sums):
+                out.append(points[idx]._replace(interval_ms=interval_sum))
+            return out
+        
+        def _collapse_static_points(points: List[_TrajPoint], eps_deg: float = 0.05) -> List[_TrajPoint]:
+            # 静止段（驻留/末端保持）折叠：与段首点各轴偏差都 < eps_deg 的连续点只保留段尾一个，
+            # 被删点的 interval_ms 累加到段尾点，段首到位时刻与段尾（保持结束）时刻都不变
+            def _emit_tail(tail: _TrajPoint, total: int) -> None:
+                # interval 按 u16 编码：超过 0xFFFF ms 的长驻留拆成若干个同位置点均分
+                if total <= 0xFFFF:
+                    out.append(tail._replace(interval_ms=total))
+                    return
+                k = -(-total // 0xFFFF)
+                base, extra = divmod(total, k)
+                for i in range(k):
+                    out.append(tail._replace(interval_ms=base + (1 if i < extra else 0)))
 
             out = []
-            prev_idx = None
-            for idx in keep:
-                pt = dict(points[idx])
-                if prev_idx is None:
-                    out.append(pt)
-                else:
-                    interval_sum = 0
-                    for k in range(prev_idx + 1, idx + 1):
-                        try:
-                            interval_sum += int(points[k].get("interval_ms", 0) or 0)
-                        except Exception:
-                            interval_sum += 0
-                    pt["interval_ms"] = int(interval_sum)
-                    out.append(pt)
-                prev_idx = idx
+            anchor = None      # 当前静止段段首的 6 轴位置
+            pending = None     # 静止段中最近的一个点（候选段尾）
+            acc = 0            # 已丢弃点的 interval_ms 之和
+            for pt in points:
+                positions = pt.positions
+                if anchor is not None and len(positions) >= 6:
+                    try:
+                        static = max(abs(float(positions[m]) - anchor[m]) for m in range(6)) < eps_deg
+                    except (TypeError, ValueError):
+                        static = False
+                    if static:
+                        if pending is not None:
+                            acc += int(pending.interval_ms or 0)
+                        pending = pt
+                        continue
+                if pending is not None:
+                    _emit_tail(pending, acc + int(pending.interval_ms or 0))
+                    pending = None
+                    acc = 0
+                out.append(pt)
+                try:
+                    anchor = [float(positions[m]) for m in range(6)] if len(positions) >= 6 else None
+                except (TypeError, ValueError):
+                    anchor = None
+            if pending is not None:
+                _emit_tail(pending, acc + int(pending.interval_ms or 0))
             return out
         
         try:
             t_upload0 = time.perf_counter()
 
+            # 入口一次性转成 _TrajPoint（只取引用不拷贝列表）；缺失的 interval_ms 保留为 None，由编码阶段报错
+            trajectory_points = [
+                _TrajPoint(pt.get("interval_ms"), pt.get("positions", ()), pt.get("speeds", ()))
+                for pt in trajectory_points
+            ]
+
+            try:
+                trajectory_points = _collapse_static_points(trajectory_points)
+            except (TypeError, ValueError) as e:
+                # interval_ms 非法等：不折叠，按原始点继续，由编码阶段给出明确错误
+                self.logger.warning("⚠️ 静止段折叠失败，按原始轨迹点上传: %s", e)
+
             try:
-                if isinstance(trajectory_points, list) and len(trajectory_points) > MAX_TRAJECTORY_POINTS:
+                if len(trajectory_points) > MAX_TRAJECTORY_POINTS:
                     original_n = len(trajectory_points)
                     trajectory_points = _decimate_points_keep_timing(trajectory_points, MAX_TRAJECTORY_POINTS)
-                    self.logger.warning(f"⚠️ 轨迹点数过多，已自动抽稀: {original_n} -> {len(trajectory_points)}（避免 err=0x7003）")
+                    self.logger.warning("⚠️ 轨迹点数过多，已自动抽稀: %d -> %d（避免 err=0x7003）", original_n, len(trajectory_points))
             except Exception:
                 pass
 
+            # 一次遍历抽取 (N, 6) 电机角度矩阵，限位检查与编码共用（positions 不足 6 个的点不参与检查）
+            point_ids = []
+            rows = []
+            for point_idx, pt in enumerate(trajectory_points):
+                positions = pt.positions
+                if len(positions) >= 6:
+                    point_ids.append(point_idx)
+                    rows.append(positions[:6])
+            motor_angles = np.asarray(rows, dtype=np.float64).reshape(-1, 6)
+
             # 检查轨迹点中的关节限位
             limits = self._load_joint_limits()
             if limits is not None and trajectory_points:
-                violations = []
-                for point_idx, pt in enumerate(trajectory_points):
-                    positions = pt.get("positions", [])
-                    if len(positions) >= 6:
-                        for motor_idx in range(6):
-                            motor_id = motor_idx + 1
-                            motor_angle_deg = float(positions[motor_idx])
-                            # 将电机角度转换为关节角度
-                            joint_angle_deg = self._motor_angle_to_joint_angle(motor_angle_deg, motor_id)
-                            
-                            # 检查限位
-                            if 0 <= motor_idx < 6:
-                                min_limit, max_limit = limits[motor_idx]
-                                if joint_angle_deg < min_limit or joint_angle_deg > max_limit:
-                                    violations.append((point_idx, motor_id, motor_idx + 1, joint_angle_deg, min_limit, max_limit))
-                
-                if violations:
+
+                # 电机角度 → 关节角度：按列除以 减速比×方向（未加载到配置时视为 1）
+                table = self._motor_scale_table()
+                if table is not None:
+                    joint_angles = motor_angles / table[1][1:7]
+                else:
+                    joint_angles = motor_angles
+                lim = self._joint_limits_array(limits)
+                mask = (joint_angles < lim[:, 0]) | (joint_angles > lim[:, 1])
+
+                # 无越限（绝大多数情况）时 mask.any() 即可短路，不做索引提取与消息构建；
+                # 有越限时行优先扫描，顺序与逐点逐电机检查一致
+                if mask.any():
+                    bad_rows, bad_cols = np.nonzero(mask)
+                    n_violations = bad_rows.size
                     # 构建错误消息（只显示前几个超限的点，避免消息过长）
                     msg_parts = ["⛔ 关节限位检查失败，拒绝上传轨迹："]
                     # 按电机ID分组显示，每个电机只显示第一个超限的点
                     shown_motors = set()
-                    for point_idx, motor_id, joint_num, joint_angle, min_lim, max_lim in violations[:10]:  # 最多显示10个
+                    for r, motor_idx in zip(bad_rows[:10].tolist(), bad_cols[:10].tolist()):  # 最多显示10个
+                        motor_id = motor_idx + 1
                         if motor_id not in shown_motors:
+                            min_lim, max_lim = lim[motor_idx]
                             msg_parts.append(
-                                f"  轨迹点{point_idx}: 电机{motor_id}(关节{joint_num}) 关节角度 {joint_angle:.2f}° 超出限位 [{min_lim:.2f}°, {max_lim:.2f}°]"
+                                f"  轨迹点{point_ids[r]}: 电机{motor_id}(关节{motor_id}) 关节角度 {joint_angles[r, motor_idx]:.2f}° 超出限位 [{min_lim:.2f}°, {max_lim:.2f}°]"
                             )
                             shown_motors.add(motor_id)
-                    if len(violations) > 10:
-                        msg_parts.append(f"  ... 还有 {len(violations) - 10} 个超限点未显示")
+                    if n_violations > 10:
+                        msg_parts.append(f"  ... 还有 {n_violations - 10} 个超限点未显示")
                     error_msg = "\n".join(msg_parts)
                     self.logger.error(error_msg)
                     raise RuntimeError(error_msg)
 
+            # 所有点一次性向量化编码成连续缓冲区，各批次/单点直接按偏移切片（缩包重试时无需重新编码）
+            n_pts = len(trajectory_points)
+            if len(point_ids) != n_pts:
+                bad_idx = next(i for i, k in enumerate(point_ids + [n_pts]) if i != k)
+                raise ValueError(f"轨迹点{bad_idx}的 positions 不足 6 个")
+            speed_rows = [pt.speeds[:6] for pt in trajectory_points]
+            if any(len(r) != 6 for r in speed_rows):
+                raise ValueError("轨迹点的 speeds 不足 6 个")
+            speeds = np.asarray(speed_rows, dtype=np.float64).reshape(-1, 6)
+            intervals = np.fromiter((int(pt.interval_ms) for pt in trajectory_points), dtype=np.int64, count=n_pts)
+            if not (np.isfinite(motor_angles).all() and np.isfinite(speeds).all()):
+                raise ValueError("轨迹点包含 NaN/Inf")
+            # 与 int(x * 100) / int(x * 10) 一致：向零截断
+            pos_i = (motor_angles * 100).astype(np.int64)  # 0.01°
+            spd_i = (speeds * 10).astype(np.int64)         # 0.1RPM
+            if (
+                intervals.min(initial=0) < 0 or intervals.max(initial=0) > 0xFFFF
+                or spd_i.min(initial=0) < 0 or spd_i.max(initial=0) > 0xFFFF
+                or pos_i.min(initial=0) < -0x80000000 or pos_i.max(initial=0) > 0x7FFFFFFF
+            ):
+                raise ValueError("轨迹点数值超出编码范围（interval/speed 为 u16，position×100 为 i32）")
+            packed = np.empty(n_pts, dtype=_TRAJ_POINT_DTYPE)
+            packed["interval"] = intervals
+            axes = packed["axes"]
+            axes["pos"] = pos_i
+            axes["spd"] = spd_i
+
+            pt_size = _TRAJ_POINT_DTYPE.itemsize  # 38
+            encoded = packed.tobytes()
+            # 通过 memoryview 切片：组包时 join 一次性分配并拷贝，不再先切片出中间 bytes 再拼接
+            encoded_view = memoryview(encoded)
+
             # 1. 开始上传（清空缓存）
             try:
                 resp = self.client.request(
@@ -2477,72 +3111,77 @@ class ZDTMotorController:
             # args 建议控制在 <=492 字节。
             # 单点 pt_size=38B，mode=3 包格式: [3][n][n*38] => n_max=12
 
-            def _encode_one_point(pt: dict) -> bytes:
-                b = bytearray()
-                interval = int(pt["interval_ms"])
-                b.extend(struct.pack("<H", interval))
-                for motor_idx in range(6):
-                    pos_deg = float(pt["positions"][motor_idx])
-                    pos_i32 = int(pos_deg * 100)  # 0.01°
-                    b.extend(struct.pack("<i", pos_i32))
-                    spd_rpm = float(pt["speeds"][motor_idx])
-                    spd_u16 = int(spd_rpm * 10)  # 0.1RPM
-                    b.extend(struct.pack("<H", spd_u16))
-                return bytes(b)
-
             # 调试输出：对齐固件 TrajectoryPoint（interval_ms + 6×(i32 pos_x0.01deg + u16 spd_x0.1rpm)）
-            # 只打印首尾点，避免刷屏。
-            try:
-                if trajectory_points:
-                    def _fmt_pt(idx: int) -> str:
-                        pt = trajectory_points[idx]
-                        interval = int(pt.get("interval_ms", 0) or 0)
-                        pos_deg = [float(x) for x in (pt.get("positions") or [])][:6]
-                        spd_rpm = [float(x) for x in (pt.get("speeds") or [])][:6]
-                        pos_i32 = [int(x * 100) for x in pos_deg]
-                        spd_u16 = [int(x * 10) for x in spd_rpm]
-                        return (
-                            f"idx={idx} interval_ms={interval} "
-                            f"pos_deg={pos_deg} pos_i32={pos_i32} "
-                            f"spd_rpm={spd_rpm} spd_u16={spd_u16}"
-                        )
-                    # 简化日志输出，避免刷屏
-                    # self.logger.info(f"[UCP][TRAJ] upload { _fmt_pt(0) }")
-                    # if len(trajectory_points) > 1:
-                    #     self.logger.info(f"[UCP][TRAJ] upload { _fmt_pt(len(trajectory_points) - 1) }")
-            except Exception:
-                pass
+            # 只打印首尾点，避免刷屏；仅 DEBUG 级别开启时才构造（列表推导/格式化不进入常规路径）。
+            # 轨迹点此时已通过编码阶段的校验（6 轴、有限值、范围内），格式化不会抛异常，无需再包 try。
+            if trajectory_points and self.logger.isEnabledFor(logging.DEBUG):
+                def _fmt_pt(idx: int) -> str:
+                    pt = trajectory_points[idx]
+                    interval = int(pt.interval_ms or 0)
+                    pos_deg = [float(x) for x in pt.positions][:6]
+                    spd_rpm = [float(x) for x in pt.speeds][:6]
+                    pos_i32 = [int(x * 100) for x in pos_deg]
+                    spd_u16 = [int(x * 10) for x in spd_rpm]
+                    return (
+                        f"idx={idx} interval_ms={interval} "
+                        f"pos_deg={pos_deg} pos_i32={pos_i32} "
+                        f"spd_rpm={spd_rpm} spd_u16={spd_u16}"
+                    )
+                self.logger.debug("[UCP][TRAJ] upload %s", _fmt_pt(0))
+                if len(trajectory_points) > 1:
+                    self.logger.debug("[UCP][TRAJ] upload %s", _fmt_pt(len(trajectory_points) - 1))
 
-            pt_size = 2 + 6 * (4 + 2)  # 38
             # 经验值：在 Windows + USB CDC + 较多并发模块场景下，大包更容易出现“偶发无响应”
-            # 这里默认更小的批量包，换取更稳定、更低的最差延迟（避免 10~20s 卡顿）。
-            safe_max_args_bytes = 200
-            max_points_per_batch = max(2, (safe_max_args_bytes - 2) // pt_size)
+            # 因此从较小的批量包起步（200B 内 5 点），链路稳定时再逐步加大（AIMD）：
+            # 连续成功 4 包 +1 点，直到 args<=492B 的上限（12 点）；超时则减半，换取更低的最差延迟（避免 10~20s 卡顿）。
+            max_points_hard = (492 - 2) // pt_size
+            max_points_per_batch = max(2, min(self._traj_batch_n, max_points_hard))
 
             # 先尝试批量模式；若固件不支持则回退单点模式
             use_bulk = True
             idx = 0
             def _send_bulk(n: int):
-                args = bytearray()
-                args.append(3)  # mode=3: 批量追加
-                args.append(n)
-                for k in range(n):
-                    args.extend(_encode_one_point(trajectory_points[idx + k]))
-                if len(args) != 2 + n * pt_size:
-                    raise RuntimeError("批量轨迹编码长度异常")
-                return self.client.request(motor_id=0, opcode=0x70, args=bytes(args), timeout_ms=timeout_ms)
+                # mode=3: 批量追加
+                args = b"".join((bytes((3, n)), encoded_view[idx * pt_size:(idx + n) * pt_size]))
+                return self.client.request(motor_id=0, opcode=0x70, args=args, timeout_ms=timeout_ms)
 
             def _send_single(i: int):
-                args = bytearray()
-                args.append(1)
-                args.extend(_encode_one_point(trajectory_points[i]))
-                return self.client.request(motor_id=0, opcode=0x70, args=bytes(args), timeout_ms=timeout_ms)
+                args = b"".join((b"\x01", encoded_view[i * pt_size:(i + 1) * pt_size]))
+                return self.client.request(motor_id=0, opcode=0x70, args=args, timeout_ms=timeout_ms)
+
+            # 流水线批量上传：一次性提交所有批量包，最多 pipeline_depth 个在途，省去逐包等待应答的往返
+            request_pipelined = getattr(self.client, "request_pipelined", None)
+            if pipeline_depth > 1 and request_pipelined is not None and len(trajectory_points) > 1:
+                batches = []
+                start = 0
+                while start < len(trajectory_points):
+                    n = min(max_points_per_batch, len(trajectory_points) - start)
+                    batches.append((start, n))
+                    start += n
+                try:
+                    resps = request_pipelined(
+                        [(0, 0x70, b"".join((bytes((3, n)), encoded_view[s * pt_size:(s + n) * pt_size]))) for s, n in batches],
+                        timeout_ms=timeout_ms,
+                        depth=pipeline_depth,
+                    )
+                except TimeoutError as e:
+                    # 在途批量包是否已被固件追加无法确定，不能续传，只能整体重试（重新上传会先清空缓存）
+                    raise TimeoutError(f"轨迹流水线上传超时: {e}") from e
+                for k, ((start, n), resp) in enumerate(zip(batches, resps)):
+                    if resp.status == 0:
+                        idx = start + n
+                        continue
+                    # 旧固件不支持 mode=3：该包及之后的包都未被追加，从该包起回退到单点
+                    if resp.status in (1, 2) and resp.err_code in (0x7005,) and all(r.status != 0 for r in resps[k + 1:]):
+                        use_bulk = False
+                        break
+                    raise RuntimeError(f"批量上传失败: status={resp.status}, err=0x{resp.err_code:04X}")
 
             while idx < len(trajectory_points):
                 remaining = len(trajectory_points) - idx
 
                 if use_bulk and remaining > 1:
-                    n = min(max_points_per_batch, remaining)
+                    n = min(max(2, min(self._traj_batch_n, max_points_hard)), remaining)
 
                     # 如果批量上传超时，不要直接失败：自动“缩包重试”，直到退化为单点，提升稳定性
                     while n > 1:
@@ -2550,22 +3189,23 @@ class ZDTMotorController:
                             t_req0 = time.perf_counter()
                             resp = _send_bulk(n)
                         except TimeoutError:
-                            try:
-                                self.logger.warning(f"⚠️ 轨迹批量包超时，缩包重试: idx={idx} n={n}")
-                            except Exception:
-                                pass
+                            # 日志/计时调用按常规 logging 处理器不会抛异常，不再逐包包 try
+                            self.logger.warning("⚠️ 轨迹批量包超时，缩包重试: idx=%d n=%d", idx, n)
                             n = n // 2
+                            self._traj_batch_n = max(2, n)
+                            self._traj_good_streak = 0
                             continue
                         finally:
-                            try:
-                                dt_ms = (time.perf_counter() - t_req0) * 1000.0
-                                if dt_ms >= 1000.0:
-                                    self.logger.warning(f"⚠️ 轨迹批量包耗时偏长: idx={idx} n={n} {dt_ms:.0f}ms")
-                            except Exception:
-                                pass
+                            dt_ms = (time.perf_counter() - t_req0) * 1000.0
+                            if dt_ms >= 1000.0:
+                                self.logger.warning("⚠️ 轨迹批量包耗时偏长: idx=%d n=%d %.0fms", idx, n, dt_ms)
 
                         if resp.status == 0:
                             idx += n
+                            self._traj_good_streak += 1
+                            if self._traj_good_streak >= 4 and self._traj_batch_n < max_points_hard:
+                                self._traj_batch_n += 1
+                                self._traj_good_streak = 0
                             break
 
                         # 旧固件不支持 mode=3：回退到单点
@@ -2579,10 +3219,7 @@ class ZDTMotorController:
                         continue
 
                     # 退化为单点
-                    try:
-                        self.logger.warning(f"⚠️ 轨迹上传降级为单点模式: idx={idx}")
-                    except Exception:
-                        pass
+                    self.logger.warning("⚠️ 轨迹上传降级为单点模式: idx=%d", idx)
                     use_bulk = False
 
                 # mode=1: 单点追加
@@ -2794,11 +3431,7 @@ class _CommandBuilderCompat:
         spd_val = int(round(abs(speed) * 10.0))     # RPM → 0.1RPM单位
         
         # ZDT 0xFB 命令（大端序）
-        sub_body = struct.pack(">BBHI", 0xFB, direction, spd_val, pos_val) + \
-                   struct.pack(">BB", 1 if is_absolute else 0, 0) + \
-                   b"\x6B"
-        
-        return sub_body
+        return _zdt_pos_body(direction, spd_val, pos_val, 1 if is_absolute else 0)
     
     def position_mode_trapezoid(self, position: float, max_speed: float,
                                acceleration: int, deceleration: int,
@@ -2846,9 +3479,7 @@ class _CommandBuilderCompat:
         acc_val = acceleration  # 直接使用RPM/s
         
         # ZDT 0xF6 命令（大端序）⚠️ 注意：加速度在前，速度在后！
-        sub_body = struct.pack(">BBHH B", 0xF6, direction, acc_val, spd_val, 0) + b"\x6B"
-        
-        return sub_body
+        return _zdt_speed_body(direction, acc_val, spd_val)
     
     def homing_mode(self, mode: int = 4, **kwargs) -> bytes:
         """
@@ -2867,7 +3498,7 @@ class _CommandBuilderCompat:
             bytes: ZDT命令体（4字节）
         """
         # ZDT 0x9A 命令（大端序）
-        sub_body = struct.pack(">BB B", 0x9A, mode, 0) + b"\x6B"
+        sub_body = _ZDT_HOMING_BODY.pack(0x9A, mode, 0, 0x6B)
         
         return sub_body
     
@@ -11,7 +11,7 @@
 添加新驱动（如步科、汇川）只需3步：
 
 1. 创建驱动适配器（实现 MotorControllerInterface）
-2. 创建通信协议（实现 ProtocolInterface，如需要）
+2. 创建通信协议（实现 ProtocolInterface，如需要），并用 register_protocol() 注册
 3. 注册驱动：
    ```python
    from Control_Core import register_motor_driver
@@ -45,8 +45,12 @@ motor = gateway.create_motor_controller(motor_id=1, driver_type="my_driver")
 ```
 """
 
+import importlib
 import logging
-from typing import Dict, Type, Any, Optional
+import threading
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Callable, Dict, Mapping, Type, Any, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -62,7 +66,12 @@ class DriverManager:
     """
     
     # 已注册的驱动：{驱动名称: (控制器类, 协议类型)}
+    # 内置驱动以 ("相对模块:类名", 协议类型) 延迟登记，首次 get_driver() 时才导入并替换为类
+    # 写时复制：注册时在锁内复制出新字典再整体替换类属性，查询直接读当前字典、无需加锁
     _registered_drivers: Dict[str, tuple] = {}
+    _reg_lock = threading.Lock()
+    # list_drivers() 的只读快照：(来源注册表字典, 快照)；注册表写时复制会换成新字典，按对象身份判断是否需要重建
+    _drivers_snapshot: Optional[tuple] = None
     
     # 默认驱动
     _default_driver: str = "zdt"
@@ -83,9 +92,30 @@ class DriverManager:
         if not issubclass(controller_cls, MotorControllerInterface):
             raise TypeError(f"驱动 {name} 的控制器类必须实现 MotorControllerInterface 接口")
         
-        cls._registered_drivers[name] = (controller_cls, protocol_type)
+        cls._set_driver_entry(name, (controller_cls, protocol_type))
         logger.info(f"✓ 已注册驱动: {name} (协议: {protocol_type})")
     
+    @classmethod
+    def _register_lazy_driver(cls, name: str, target: str, protocol_type: str = "ucp") -> None:
+        """
+        延迟注册驱动：只记录 "相对模块路径:类名"，首次 get_driver() 时才导入
+        
+        Args:
+            name: 驱动名称
+            target: 相对本包的 "模块:类名"（如 ".drivers.zdt_driver:ZDTDriverAdapter"）
+            protocol_type: 协议类型
+        """
+        cls._set_driver_entry(name, (target, protocol_type))
+    
+    @classmethod
+    def _set_driver_entry(cls, name: str, entry: tuple) -> None:
+        """写时复制地更新注册表（类属性的重新绑定是原子的，读者看到的总是完整字典）"""
+        with DriverManager._reg_lock:
+            drivers = dict(DriverManager._registered_drivers)
+            drivers[name] = entry
+            DriverManager._registered_drivers = drivers
+        _resolve_driver.cache_clear()
+    
     @classmethod
     def get_driver(cls, name: str) -> Optional[tuple]:
         """
@@ -94,7 +124,15 @@ class DriverManager:
         Returns:
             (controller_cls, protocol_type) 或 None
         """
-        return cls._registered_drivers.get(name)
+        info = cls._registered_drivers.get(name)
+        if info is None or not isinstance(info[0], str):
+            return info
+        
+        # 延迟注册的驱动：导入并校验后写回注册表，之后的查询直接命中类
+        module_name, _, attr = info[0].partition(":")
+        controller_cls = getattr(importlib.import_module(module_name, __package__), attr)
+        cls.register_driver(name, controller_cls, info[1])
+        return cls._registered_drivers[name]
     
     @classmethod
     def set_default_driver(cls, name: str) -> None:
@@ -110,14 +148,20 @@ class DriverManager:
         return cls._default_driver
     
     @classmethod
-    def list_drivers(cls) -> Dict[str, str]:
+    def list_drivers(cls) -> Mapping[str, str]:
         """
         列出所有已注册的驱动
         
         Returns:
-            {驱动名称: 协议类型}
+            {驱动名称: 协议类型}（只读快照，注册表变更前重复调用返回同一对象）
         """
-        return {name: protocol for name, (_, protocol) in cls._registered_drivers.items()}
+        drivers = DriverManager._registered_drivers
+        cache = DriverManager._drivers_snapshot
+        if cache is not None and cache[0] is drivers:
+            return cache[1]
+        snapshot = MappingProxyType({name: protocol for name, (_, protocol) in drivers.items()})
+        DriverManager._drivers_snapshot = (drivers, snapshot)
+        return snapshot
 
     # -------------------- 向后兼容：命令构建器 --------------------
     @classmethod
@@ -137,6 +181,12 @@ class DriverManager:
             return None
 
 
+@lru_cache(maxsize=32)
+def _resolve_driver(driver_type: str) -> Optional[tuple]:
+    """按驱动名称解析 (controller_cls, protocol_type)；注册表变更时由 _set_driver_entry 清空缓存"""
+    return DriverManager.get_driver(driver_type)
+
+
 def create_motor_controller(
     motor_id: int,
     port: str = "COM31",
@@ -167,7 +217,7 @@ def create_motor_controller(
         driver_type = DriverManager.get_default_driver()
     
     # 获取驱动信息
-    driver_info = DriverManager.get_driver(driver_type)
+    driver_info = _resolve_driver(driver_type)
     if driver_info is None:
         available = ", ".join(DriverManager.list_drivers().keys())
         raise ValueError(
@@ -190,6 +240,43 @@ def create_motor_controller(
     return controller_cls(motor_id=motor_id, protocol=protocol, **kwargs)
 
 
+# 协议类型 → 工厂函数 factory(port, baudrate) -> ProtocolInterface
+_PROTOCOL_FACTORIES: Dict[str, Callable[[str, int], Any]] = {}
+
+# 预留协议：尚未实现，调用时给出明确提示
+_PLANNED_PROTOCOLS: Dict[str, str] = {
+    "modbus": "Modbus协议尚未实现，敬请期待",
+    "canopen": "CANopen协议尚未实现，敬请期待",
+}
+
+# UcpProtocol 类在首次创建UCP协议时导入并缓存，之后不再经过 import 机制
+_ucp_protocol_cls: Optional[Type] = None
+
+
+def register_protocol(name: str, factory: Callable[[str, int], Any]) -> None:
+    """
+    注册通信协议工厂
+    
+    Args:
+        name: 协议类型名称（如 "modbus"）
+        factory: 工厂函数 factory(port, baudrate)，返回 ProtocolInterface 实例
+    """
+    _PROTOCOL_FACTORIES[name] = factory
+    _PLANNED_PROTOCOLS.pop(name, None)
+
+
+def _create_ucp_protocol(port: str, baudrate: int) -> Any:
+    """UCP协议工厂"""
+    global _ucp_protocol_cls
+    if _ucp_protocol_cls is None:
+        from .protocols.ucp_protocol import UcpProtocol
+        _ucp_protocol_cls = UcpProtocol
+    return _ucp_protocol_cls(port=port, baudrate=baudrate)
+
+
+register_protocol("ucp", _create_ucp_protocol)
+
+
 def _create_protocol(protocol_type: str, port: str, baudrate: int) -> Any:
     """
     内部方法：创建协议实例
@@ -202,26 +289,19 @@ def _create_protocol(protocol_type: str, port: str, baudrate: int) -> Any:
     Returns:
         ProtocolInterface: 协议实例
     """
-    if protocol_type == "ucp":
-        from .protocols.ucp_protocol import UcpProtocol
-        return UcpProtocol(port=port, baudrate=baudrate)
+    factory = _PROTOCOL_FACTORIES.get(protocol_type)
+    if factory is not None:
+        return factory(port, baudrate)
     
-    elif protocol_type == "modbus":
-        # 预留：未来可扩展Modbus协议
-        # from .protocols.modbus_protocol import ModbusProtocol
-        # return ModbusProtocol(port=port, baudrate=baudrate)
-        raise NotImplementedError("Modbus协议尚未实现，敬请期待")
+    planned = _PLANNED_PROTOCOLS.get(protocol_type)
+    if planned is not None:
+        raise NotImplementedError(planned)
     
-    elif protocol_type == "canopen":
-        # 预留：未来可扩展CANopen协议
-        raise NotImplementedError("CANopen协议尚未实现，敬请期待")
-    
-    else:
-        raise ValueError(
-            f"不支持的协议类型: {protocol_type}\n"
-            f"当前支持: ucp\n"
-            f"即将支持: modbus, canopen"
-        )
+    raise ValueError(
+        f"不支持的协议类型: {protocol_type}\n"
+        f"当前支持: {', '.join(_PROTOCOL_FACTORIES)}\n"
+        f"即将支持: {', '.join(_PLANNED_PROTOCOLS)}"
+    )
 
 
 def register_motor_driver(name: str, controller_cls: Type, protocol_type: str = "ucp") -> None:
@@ -255,13 +335,9 @@ def set_default_motor_driver(name: str) -> None:
 # ==================== 在模块加载时注册内置驱动 ====================
 
 def _register_builtin_drivers():
-    """注册内置驱动（ZDT）"""
-    try:
-        from .drivers.zdt_driver import ZDTDriverAdapter
-        DriverManager.register_driver("zdt", ZDTDriverAdapter, "ucp")
-        logger.debug("✓ 内置驱动已注册: ZDT (UCP)")
-    except ImportError as e:
-        logger.error(f"✗ ZDT驱动注册失败: {e}")
+    """注册内置驱动（ZDT）：只登记模块路径，驱动模块在首次创建控制器时才导入"""
+    DriverManager._register_lazy_driver("zdt", ".drivers.zdt_driver:ZDTDriverAdapter", "ucp")
+    logger.debug("✓ 内置驱动已登记: ZDT (UCP，延迟导入)")
 
 
 # 自动注册内置驱动
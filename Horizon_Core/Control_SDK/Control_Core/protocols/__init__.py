@@ -5,9 +5,17 @@
 包含各种通信协议的具体实现（UCP、Modbus等）。
 """
 
-from .ucp_protocol import UcpProtocol
+from .._lazy import make_getattr
+
+# 协议实现按需导入（PEP 562）：UcpProtocol 会连带导入 ucp_sdk/pyserial，
+# 只有真正用到某个协议时才加载对应模块
+_LAZY_EXPORTS = {
+    'UcpProtocol': '.ucp_protocol',
+}
 
 __all__ = [
     'UcpProtocol',
 ]
 
+__getattr__ = make_getattr(_LAZY_EXPORTS, __name__)
+
@@ -8,12 +8,30 @@ Python端只需要通过UCP发送高层命令。
 """
 
 import logging
-from typing import Optional
+import threading
+from typing import Dict, List, Optional, Sequence, Tuple, Union
 from ..interfaces.protocol_interface import ProtocolInterface
 from ..ucp_sdk import UcpClient, UcpResponse
 from ..ucp_connection_pool import UcpConnectionPool
 
 
+# 每个串口一个 logger：同一串口上的多个电机协议对象共用，
+# 构造时直接查表，不再每次格式化名称并经过 logging.Manager 的全局锁
+_PORT_LOGGERS: Dict[str, logging.Logger] = {}
+
+
+# 线程私有的命令参数暂存区：调用方用 struct.pack_into 原地写入后传 memoryview 切片，省去逐条命令分配 bytes
+_SCRATCH = threading.local()
+_SCRATCH_SIZE = 64
+
+
+def _port_logger(port: str) -> logging.Logger:
+    logger = _PORT_LOGGERS.get(port)
+    if logger is None:
+        logger = _PORT_LOGGERS.setdefault(port, logging.getLogger(f"UcpProtocol[{port}]"))
+    return logger
+
+
 class UcpProtocol(ProtocolInterface):
     """
     UCP协议实现（通过 OmniCAN）
@@ -22,31 +40,51 @@ class UcpProtocol(ProtocolInterface):
     - 串口通信（Serial）
     - OmniCAN 作为中间层，处理CAN总线通信
     - 支持多电机共享同一个串口（通过motor_id区分）
+    - 同一 (port, baudrate) 只有一个协议实例：同一串口上的各电机共用，connect()/disconnect() 幂等
+      （驱动适配器断开时本就不断开协议，见 ZDTDriverAdapter.disconnect）
     """
     
+    # (协议类, port, baudrate) -> 实例
+    _INSTANCES: Dict[Tuple[type, str, int], "UcpProtocol"] = {}
+    _INSTANCES_LOCK = threading.Lock()
+    
+    def __new__(cls, port: str, baudrate: int = 115200):
+        key = (cls, port, int(baudrate))
+        instance = UcpProtocol._INSTANCES.get(key)
+        if instance is None:
+            with UcpProtocol._INSTANCES_LOCK:
+                instance = UcpProtocol._INSTANCES.get(key)
+                if instance is None:
+                    instance = super().__new__(cls)
+                    instance._initialized = False
+                    UcpProtocol._INSTANCES[key] = instance
+        return instance
+    
     def __init__(self, port: str, baudrate: int = 115200):
         """
-        初始化UCP协议
+        初始化UCP协议（共享实例只初始化一次）
         
         Args:
             port: 串口号（如 COM31）
             baudrate: 波特率（默认115200）
         """
+        if self._initialized:
+            return
+        self._initialized = True
         self.port = port
         self.baudrate = baudrate
+        # client 是连接状态的唯一来源：已连接时为共享的 UcpClient，未连接时为 None
         self.client: Optional[UcpClient] = None
-        self.logger = logging.getLogger(f"UcpProtocol[{port}]")
-        self._connected = False
+        self.logger = _port_logger(port)
         self._pool = UcpConnectionPool.instance()
     
     def connect(self) -> None:
         """建立连接"""
-        if self._connected and self.client is not None:
+        if self.client is not None:
             return
 
         # 关键：使用连接池，避免“每个电机对象都重复打开同一个COM口”导致冲突/不稳定
         self.client = self._pool.connect(self.port, self.baudrate)
-        self._connected = True
         try:
             ref = self._pool.get_ref_count(self.port, self.baudrate)
             self.logger.info(f"UCP连接已建立: {self.port}@{self.baudrate} (pool_ref={ref})")
@@ -55,23 +93,37 @@ class UcpProtocol(ProtocolInterface):
     
     def disconnect(self) -> None:
         """断开连接"""
-        if not self._connected:
-            self.client = None
+        if self.client is None:
             return
 
         # 使用连接池：减少引用计数，最后一个释放者会真正关闭串口
-        try:
-            self._pool.release(self.port, self.baudrate)
-        finally:
-            self.client = None
-            self._connected = False
+        # （release 内部已捕获关闭串口时的异常，这里无需再用 try/finally 兜底）
+        self._pool.release(self.port, self.baudrate)
+        self.client = None
         self.logger.info(f"UCP连接已断开: {self.port} (released)")
     
     def is_connected(self) -> bool:
         """检查是否已连接"""
-        return self._connected and self.client is not None
+        return self.client is not None
     
-    def request(self, motor_id: int, command: int, args: bytes = b"", 
+    @staticmethod
+    def scratch_buffer() -> bytearray:
+        """
+        获取当前线程的 64 字节参数暂存区（每个线程一块，反复复用）
+        
+        用法：
+            buf = proto.scratch_buffer()
+            struct.pack_into("<if", buf, 0, target_pos, speed)
+            proto.request(motor_id, opcode, memoryview(buf)[:8])
+        
+        注意：下一次在同一线程写入前，上一次 request() 必须已返回（request 为同步调用，自然满足）。
+        """
+        buf = getattr(_SCRATCH, "buf", None)
+        if buf is None:
+            buf = _SCRATCH.buf = bytearray(_SCRATCH_SIZE)
+        return buf
+    
+    def request(self, motor_id: int, command: int, args: Union[bytes, bytearray, memoryview] = b"", 
                 timeout_ms: int = 1500) -> UcpResponse:
         """
         发送UCP请求
@@ -79,19 +131,46 @@ class UcpProtocol(ProtocolInterface):
         Args:
             motor_id: 电机ID (1-255, 0为广播)
             command: UCP opcode
-            args: 参数（字节串）
+            args: 参数（bytes，或 scratch_buffer() 的 memoryview 切片）
             timeout_ms: 超时时间（毫秒）
             
         Returns:
             UcpResponse: UCP响应对象
         """
-        if not self.is_connected():
+        client = self.client
+        if client is None:
             raise RuntimeError("UCP未连接，请先调用 connect()")
         
-        return self.client.request(
+        return client.request(
             motor_id=motor_id,
             opcode=command,
             args=args,
             timeout_ms=timeout_ms
         )
-
+    
+    def request_batch(self, motor_id: int, commands: Sequence[int],
+                      timeout_ms: int = 1500, depth: int = 1) -> List[UcpResponse]:
+        """
+        对同一电机批量发送一组读取请求（如 0x60/0x61/0x62/0x64/0x69 状态刷新）
+        
+        整组请求只获取一次串口锁、复用同一个接收缓冲区；depth>1 时最多 depth 个请求同时在途，
+        省去逐个等待应答的往返（固件须能缓存排队到达的请求帧）。
+        
+        Args:
+            motor_id: 电机ID (1-255)
+            commands: UCP opcode 列表
+            timeout_ms: 单个请求的超时时间（毫秒）
+            depth: 最大在途请求数（默认1=逐个应答）
+            
+        Returns:
+            List[UcpResponse]: 与 commands 一一对应的响应
+        """
+        client = self.client
+        if client is None:
+            raise RuntimeError("UCP未连接，请先调用 connect()")
+        
+        return client.request_pipelined(
+            [(motor_id, command, b"") for command in commands],
+            timeout_ms=timeout_ms,
+            depth=depth,
+        )
@@ -6,7 +6,7 @@ UCP连接池管理模块
 """
 
 import logging
-from typing import Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 from threading import Lock
 
 
@@ -17,23 +17,26 @@ class UcpConnectionPool:
     多个电机控制器可以共享同一个UCP客户端连接
     """
     
+    # 单例在模块导入时创建（导入过程由解释器的导入锁串行化），之后的构造/instance() 无需加锁
     _instance = None
-    _lock = Lock()
     
     def __new__(cls):
-        if cls._instance is None:
-            with cls._lock:
-                if cls._instance is None:
-                    cls._instance = super().__new__(cls)
-                    cls._instance._initialized = False
-        return cls._instance
+        instance = cls._instance
+        if instance is None:
+            instance = cls._instance = super().__new__(cls)
+            instance._initialized = False
+        return instance
     
     def __init__(self):
         if self._initialized:
             return
-        
-        self._connections: Dict[str, 'UcpClient'] = {}  # key: "port:baudrate"
-        self._ref_counts: Dict[str, int] = {}  # 引用计数
+        self._init_once()
+    
+    def _init_once(self):
+        """初始化连接表（单例只执行一次）"""
+        # 键为 (port, baudrate) 元组：无需每次格式化字符串，也不必从 "port:baudrate" 反解析（端口名本身可能含冒号）
+        self._connections: Dict[Tuple[str, int], 'UcpClient'] = {}
+        self._ref_counts: Dict[Tuple[str, int], int] = {}  # 引用计数
         self._connection_lock = Lock()
         self.logger = logging.getLogger("UcpConnectionPool")
         self._initialized = True
@@ -41,11 +44,7 @@ class UcpConnectionPool:
     @classmethod
     def instance(cls):
         """获取连接池单例实例"""
-        return cls()
-    
-    def get_connection_key(self, port: str, baudrate: int) -> str:
-        """生成连接键"""
-        return f"{port}:{baudrate}"
+        return _POOL_SINGLETON
     
     def get_or_create(self, port: str, baudrate: int) -> 'UcpClient':
         """
@@ -58,24 +57,31 @@ class UcpConnectionPool:
         Returns:
             共享的UcpClient实例
         """
-        key = self.get_connection_key(port, baudrate)
+        key = (port, int(baudrate))
         
         with self._connection_lock:
-            if key not in self._connections:
-                # 导入并创建UcpClient
-                from .ucp_sdk import UcpClient
-                client = UcpClient(port=port, baud=baudrate)
-                
-                self._connections[key] = client
-                self._ref_counts[key] = 0
-                # 连接池内部细节默认不刷屏；需要排查连接复用/串口问题时再开 DEBUG。
-                self.logger.debug(f"创建新的UCP连接: {key}")
-            
-            # 增加引用计数
-            self._ref_counts[key] += 1
-            self.logger.debug(f"UCP连接引用计数 +1: {key} (当前: {self._ref_counts[key]})")
+            client = self._get_or_create_locked(key)
+            self._add_ref_locked(key)
+            return client
+    
+    def _get_or_create_locked(self, key: Tuple[str, int]) -> 'UcpClient':
+        """取出或创建 key 对应的客户端（调用方需持有 _connection_lock，不改引用计数）"""
+        client = self._connections.get(key)
+        if client is None:
+            # 导入并创建UcpClient
+            from .ucp_sdk import UcpClient
+            client = UcpClient(port=key[0], baud=key[1])
             
-            return self._connections[key]
+            self._connections[key] = client
+            self._ref_counts[key] = 0
+            # 连接池内部细节默认不刷屏；需要排查连接复用/串口问题时再开 DEBUG。
+            self.logger.debug("创建新的UCP连接: %s:%s", *key)
+        return client
+    
+    def _add_ref_locked(self, key: Tuple[str, int]) -> None:
+        """增加引用计数（调用方需持有 _connection_lock）"""
+        self._ref_counts[key] += 1
+        self.logger.debug("UCP连接引用计数 +1: %s:%s (当前: %d)", key[0], key[1], self._ref_counts[key])
     
     def connect(self, port: str, baudrate: int) -> 'UcpClient':
         """
@@ -88,16 +94,17 @@ class UcpConnectionPool:
         Returns:
             已连接的UcpClient实例
         """
-        client = self.get_or_create(port, baudrate)
+        key = (port, int(baudrate))
         
-        # 如果还未连接，则连接
-        if not hasattr(client, '_connected') or not client._connected:
-            with self._connection_lock:
-                # 双重检查
-                if not hasattr(client, '_connected') or not client._connected:
-                    client.connect()
-                    client._connected = True
-                    self.logger.debug(f"UCP连接已建立: {port}:{baudrate}")
+        # 取出/创建、按需打开串口、增加引用计数在同一个临界区内完成（只加一次锁）；
+        # 打开串口失败时不增加引用计数
+        with self._connection_lock:
+            client = self._get_or_create_locked(key)
+            if not client._connected:
+                client.connect()
+                client._connected = True
+                self.logger.debug("UCP连接已建立: %s:%s", *key)
+            self._add_ref_locked(key)
         
         return client
     
@@ -111,28 +118,30 @@ class UcpConnectionPool:
             port: 串口号
             baudrate: 波特率
         """
-        key = self.get_connection_key(port, baudrate)
+        key = (port, int(baudrate))
         
         with self._connection_lock:
-            if key not in self._connections:
+            # _ref_counts 与 _connections 的键始终一致，只查引用计数即可判断连接是否存在
+            ref = self._ref_counts.get(key)
+            if ref is None:
                 return
             
             # 减少引用计数
-            self._ref_counts[key] -= 1
-            self.logger.debug(f"UCP连接引用计数 -1: {key} (当前: {self._ref_counts[key]})")
+            ref -= 1
+            self.logger.debug("UCP连接引用计数 -1: %s:%s (当前: %d)", port, baudrate, ref)
+            if ref > 0:
+                self._ref_counts[key] = ref
+                return
             
-            # 如果引用计数为0，断开并删除连接
-            if self._ref_counts[key] <= 0:
-                try:
-                    client = self._connections[key]
-                    if hasattr(client, 'disconnect'):
-                        client.disconnect()
-                    self.logger.debug(f"UCP连接已断开并移除: {key}")
-                except Exception as e:
-                    self.logger.warning(f"断开UCP连接时出错: {e}")
-                finally:
-                    del self._connections[key]
-                    del self._ref_counts[key]
+            # 引用计数为0：先从池中移除，再断开连接
+            client = self._connections.pop(key)
+            del self._ref_counts[key]
+            try:
+                if hasattr(client, 'disconnect'):
+                    client.disconnect()
+                self.logger.debug("UCP连接已断开并移除: %s:%s", port, baudrate)
+            except Exception as e:
+                self.logger.warning(f"断开UCP连接时出错: {e}")
     
     def is_connected(self, port: str, baudrate: int) -> bool:
         """
@@ -145,12 +154,9 @@ class UcpConnectionPool:
         Returns:
             是否已连接
         """
-        key = self.get_connection_key(port, baudrate)
         with self._connection_lock:
-            if key not in self._connections:
-                return False
-            client = self._connections[key]
-            return hasattr(client, '_connected') and client._connected
+            client = self._connections.get((port, int(baudrate)))
+            return client is not None and client._connected
     
     def get_ref_count(self, port: str, baudrate: int) -> int:
         """
@@ -163,25 +169,40 @@ class UcpConnectionPool:
         Returns:
             引用计数
         """
-        key = self.get_connection_key(port, baudrate)
         with self._connection_lock:
-            return self._ref_counts.get(key, 0)
+            return self._ref_counts.get((port, int(baudrate)), 0)
     
     def disconnect_all(self):
         """断开所有连接（清理资源）"""
         with self._connection_lock:
-            for key, client in list(self._connections.items()):
+            for (port, baudrate), client in list(self._connections.items()):
                 try:
                     if hasattr(client, 'disconnect'):
                         client.disconnect()
-                    self.logger.debug(f"关闭UCP连接: {key}")
+                    self.logger.debug("关闭UCP连接: %s:%s", port, baudrate)
                 except Exception as e:
-                    self.logger.warning(f"关闭UCP连接时出错 {key}: {e}")
+                    self.logger.warning(f"关闭UCP连接时出错 {port}:{baudrate}: {e}")
             
             self._connections.clear()
             self._ref_counts.clear()
     
+    def get_info(self) -> Dict[str, Any]:
+        """
+        获取连接池状态快照
+        
+        Returns:
+            {"port:baudrate": {"port", "baudrate", "ref_count"}}
+        """
+        with self._connection_lock:
+            return {
+                f"{port}:{baudrate}": {"port": port, "baudrate": baudrate, "ref_count": ref_count}
+                for (port, baudrate), ref_count in self._ref_counts.items()
+            }
+    
     def close_all(self):
         """关闭所有连接（别名，兼容性）"""
         self.disconnect_all()
 
+
+# 模块导入时创建唯一实例
+_POOL_SINGLETON = UcpConnectionPool()
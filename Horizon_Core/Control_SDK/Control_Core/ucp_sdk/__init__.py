@@ -30,9 +30,10 @@ __version__ = '1.0.0'
 __author__ = 'Motor Control Team'
 
 from .ucp_client import UcpClient, UcpResponse
-from .motor_data import StandardMotorData, NativeMotorData, create_parser
+from .motor_data import StandardMotorData, NativeMotorData, create_parser, get_native_parser
 from . import opcodes
 from . import constants
+from .opcodes import Opcode
 
 __all__ = [
     'UcpClient',
@@ -40,6 +41,8 @@ __all__ = [
     'StandardMotorData',
     'NativeMotorData',
     'create_parser',
+    'get_native_parser',
     'opcodes',
     'constants',
+    'Opcode',
 ]
@@ -30,7 +30,17 @@ UCP 电机数据解析库（标准模式 + 原生模式）
 
 import struct
 import math
-from typing import Optional, Dict, Any, Literal
+from functools import lru_cache
+from typing import Optional, Dict, Any, Callable, Literal, Sequence
+
+import numpy as np
+
+from .opcodes import Opcode
+
+# ZDT 原生回包中的定宽大端字段：unpack_from 按偏移直接读取，不切片出中间 bytes
+_S_U16_BE = struct.Struct(">H")
+_S_U32_BE = struct.Struct(">I")
+_S_U16X2_BE = struct.Struct(">HH")
 
 
 class StandardMotorData:
@@ -59,8 +69,34 @@ class StandardMotorData:
     FLAG_ENCODER_CALIBRATED = 1 << 8
     FLAG_ERROR_STATE = 1 << 9
     
-    @staticmethod
-    def parse_float32(data: bytes) -> Optional[float]:
+    # parse_status_flags 的 (键名, 掩码) 表，顺序即返回字典的键顺序
+    _FLAG_TABLE = (
+        ('motor_enabled', FLAG_MOTOR_ENABLED),
+        ('in_position', FLAG_IN_POSITION),
+        ('stall_detected', FLAG_STALL_DETECTED),
+        ('stall_protection', FLAG_STALL_PROTECTION),
+        ('homing_in_progress', FLAG_HOMING_IN_PROGRESS),
+        ('homing_complete', FLAG_HOMING_COMPLETE),
+        ('homing_failed', FLAG_HOMING_FAILED),
+        ('encoder_ready', FLAG_ENCODER_READY),
+        ('encoder_calibrated', FLAG_ENCODER_CALIBRATED),
+        ('error_state', FLAG_ERROR_STATE),
+    )
+    
+    # format_status 的 (键名, 为真时标签, 为假时标签) 表；回零三态单独处理，错误标签固定放在最后
+    _STATUS_LABELS = (
+        ('motor_enabled', "[OK]使能", "[X]失能"),
+        ('in_position', "[OK]到位", None),
+        ('stall_detected', "[!]堵转", None),
+        ('stall_protection', "[!]堵转保护", None),
+    )
+    
+    # 预编译的定宽解析器（小端），unpack_from 直接按偏移读取，无需 data[:4] 切片
+    _F32 = struct.Struct("<f")
+    _U32 = struct.Struct("<I")
+    
+    @classmethod
+    def parse_float32(cls, data: bytes) -> Optional[float]:
         """
         解析 float32（IEEE 754 单精度，小端序）
         
@@ -73,17 +109,14 @@ class StandardMotorData:
         if not data or len(data) < 4:
             return None
         
-        try:
-            value = struct.unpack("<f", data[:4])[0]
-            # 检查是否为 NaN（表示固件解析失败）
-            if math.isnan(value):
-                return None
-            return value
-        except struct.error:
+        value = cls._F32.unpack_from(data, 0)[0]
+        # 检查是否为 NaN（表示固件解析失败）
+        if math.isnan(value):
             return None
+        return value
     
-    @staticmethod
-    def parse_uint32(data: bytes) -> Optional[int]:
+    @classmethod
+    def parse_uint32(cls, data: bytes) -> Optional[int]:
         """
         解析 uint32（小端序）
         
@@ -96,10 +129,7 @@ class StandardMotorData:
         if not data or len(data) < 4:
             return None
         
-        try:
-            return struct.unpack("<I", data[:4])[0]
-        except struct.error:
-            return None
+        return cls._U32.unpack_from(data, 0)[0]
     
     @classmethod
     def parse_status_flags(cls, data: bytes) -> Optional[Dict[str, bool]]:
@@ -130,18 +160,22 @@ class StandardMotorData:
         if flags is None:
             return None
         
-        return {
-            'motor_enabled': bool(flags & cls.FLAG_MOTOR_ENABLED),
-            'in_position': bool(flags & cls.FLAG_IN_POSITION),
-            'stall_detected': bool(flags & cls.FLAG_STALL_DETECTED),
-            'stall_protection': bool(flags & cls.FLAG_STALL_PROTECTION),
-            'homing_in_progress': bool(flags & cls.FLAG_HOMING_IN_PROGRESS),
-            'homing_complete': bool(flags & cls.FLAG_HOMING_COMPLETE),
-            'homing_failed': bool(flags & cls.FLAG_HOMING_FAILED),
-            'encoder_ready': bool(flags & cls.FLAG_ENCODER_READY),
-            'encoder_calibrated': bool(flags & cls.FLAG_ENCODER_CALIBRATED),
-            'error_state': bool(flags & cls.FLAG_ERROR_STATE),
-        }
+        return {name: bool(flags & mask) for name, mask in cls._FLAG_TABLE}
+    
+    @classmethod
+    def parse(cls, opcode: int, data: bytes) -> Any:
+        """
+        按标准化 opcode 解析响应数据（统一入口，调用方无需自行按 opcode 分支）
+        
+        Args:
+            opcode: 标准化读取 opcode（0x60-0x67 为 float32，0x69 为状态标志）
+            data: 响应数据
+        
+        Returns:
+            解析结果；opcode 不属于标准化读取或数据无效时返回 None
+        """
+        parser = _STANDARD_PARSERS.get(opcode)
+        return parser(data) if parser is not None else None
     
     @classmethod
     def format_status(cls, status: Dict[str, bool]) -> str:
@@ -157,20 +191,11 @@ class StandardMotorData:
         if not status:
             return "Unknown"
         
-        parts = []
-        if status['motor_enabled']:
-            parts.append("[OK]使能")
-        else:
-            parts.append("[X]失能")
-        
-        if status['in_position']:
-            parts.append("[OK]到位")
-        
-        if status['stall_detected']:
-            parts.append("[!]堵转")
-        
-        if status['stall_protection']:
-            parts.append("[!]堵转保护")
+        parts = [
+            on if status[key] else off
+            for key, on, off in cls._STATUS_LABELS
+            if off is not None or status[key]
+        ]
         
         if status['homing_in_progress']:
             parts.append("[~]回零中")
@@ -185,10 +210,100 @@ class StandardMotorData:
         return " | ".join(parts) if parts else "正常"
 
 
+# 标准化 opcode → 解析函数（类定义完成后一次性构建）
+_STANDARD_PARSERS = {
+    opcode: StandardMotorData.parse_float32
+    for opcode in (
+        StandardMotorData.OP_READ_POSITION_STD,
+        StandardMotorData.OP_READ_SPEED_STD,
+        StandardMotorData.OP_READ_TEMPERATURE_STD,
+        StandardMotorData.OP_READ_VOLTAGE_STD,
+        StandardMotorData.OP_READ_CURRENT_STD,
+        StandardMotorData.OP_READ_PHASE_CURRENT_STD,
+        StandardMotorData.OP_READ_POSITION_ERROR_STD,
+        StandardMotorData.OP_READ_TARGET_POSITION_STD,
+    )
+}
+_STANDARD_PARSERS[StandardMotorData.OP_READ_STATUS_FLAGS_STD] = StandardMotorData.parse_status_flags
+
+
 # ============================================================================
 # 原生数据解析类（厂商特定格式）
 # ============================================================================
 
+# ZDT 状态/回零标志只有 1 字节输入，导入时预算全部 256 种结果；
+# 解析时查表后返回副本（调用方可能修改返回的 dict，不能共享表中对象）
+_ZDT_STATUS_TABLE = tuple(
+    {
+        'enabled': bool(flags & 0x01),
+        'in_position': bool(flags & 0x02),
+        'stall_detected': bool(flags & 0x04),
+        'stall_protection': bool(flags & 0x08),
+    }
+    for flags in range(256)
+)
+_ZDT_HOMING_TABLE = tuple(
+    {
+        'encoder_ready': bool(flags & 0x01),
+        'encoder_calibrated': bool(flags & 0x02),
+        'homing_in_progress': bool(flags & 0x04),
+        'homing_failed': bool(flags & 0x08),
+        'high_precision': bool(flags & 0x80),
+    }
+    for flags in range(256)
+)
+
+
+# ZDT 带符号字段的批量解析布局：sign(1B) + 大端无符号数值，numpy 直接按大端读取
+_ZDT_POS_DT = np.dtype([('sign', 'u1'), ('raw', '>u4')])
+_ZDT_SPEED_DT = np.dtype([('sign', 'u1'), ('raw', '>u2')])
+_ZDT_TEMP_DT = np.dtype([('sign', 'u1'), ('raw', 'u1')])
+
+
+def _zdt_sign_scale(scale: float) -> np.ndarray:
+    """按 sign 字节索引的缩放系数表：sign == 1 为负，其余为正（与单帧解析的判断一致）"""
+    table = np.full(256, scale, dtype=np.float64)
+    table[1] = -scale
+    table.flags.writeable = False
+    return table
+
+
+_ZDT_SIGN_SCALE_01 = _zdt_sign_scale(0.1)
+_ZDT_SIGN_SCALE_1 = _zdt_sign_scale(1.0)
+
+
+def _parse_zdt_signed_batch(frames: Sequence[bytes], dtype: np.dtype, sign_scale: np.ndarray) -> np.ndarray:
+    """
+    批量解析 ZDT "sign + 数值" 格式（多电机轮询时一次性处理）
+
+    每帧只取前 dtype.itemsize 字节拼接后整体视为结构化数组，再按 sign 查系数表相乘，
+    缩放与取负一次完成、无分支；长度不足的帧对应结果为 NaN（与单帧解析返回 None 对应）。
+    约 32 帧以上才比逐帧解析快，电机数较少时逐帧调用即可。
+    """
+    size = dtype.itemsize
+    short = [i for i, f in enumerate(frames) if f is None or len(f) < size]
+    if short:
+        pad = bytes(size)
+        frames = [pad if f is None or len(f) < size else f for f in frames]
+    buf = b"".join([f[:size] for f in frames])
+    raw = np.frombuffer(buf, dtype=dtype)
+    values = raw['raw'] * sign_scale[raw['sign']]
+    if short:
+        values[short] = np.nan
+    return values
+
+
+@lru_cache(maxsize=32)
+def _format_zdt_version(fw_ver: int, hw_ver: int) -> tuple:
+    """
+    ZDT 版本号格式化为 'x.yy' 字符串（按数值缓存，重复查询同一块板子不再重新格式化）
+
+    以整数为键而不是原始 data：data 可能是不可哈希的 bytearray/memoryview；
+    返回不可变元组，调用方每次拿到新的 dict，缓存内容不会被外部修改。
+    """
+    return f"{fw_ver // 100}.{fw_ver % 100:02d}", f"{hw_ver // 100}.{hw_ver % 100:02d}"
+
+
 class NativeMotorData:
     """
     UCP 原生电机数据解析器（厂商特定格式）
@@ -204,6 +319,26 @@ class NativeMotorData:
         position = parser.parse_position(resp.data)
     """
     
+    # ========================================================================
+    # 通用接口（构造时按驱动板类型直接绑定到厂商实现，调用即一次实例字典查找）
+    # ========================================================================
+    
+    parse_position: Callable[[bytes], Optional[float]]                   # 实时位置（度）
+    parse_speed: Callable[[bytes], Optional[float]]                      # 实时转速（RPM）
+    parse_temperature: Callable[[bytes], Optional[float]]                # 温度（°C）
+    parse_voltage: Callable[[bytes], Optional[float]]                    # 电压（V）
+    parse_current: Callable[[bytes], Optional[float]]                    # 电流（A）
+    parse_status: Callable[[bytes], Optional[Dict[str, bool]]]           # 电机状态标志
+    parse_homing_status: Callable[[bytes], Optional[Dict[str, bool]]]    # 回零状态标志
+    parse_version: Callable[[bytes], Optional[Dict[str, str]]]           # 版本信息
+    
+    # 批量接口：多电机轮询的响应数据列表 → float64 数组，无效帧为 NaN
+    parse_positions_batch: Callable[[Sequence[bytes]], np.ndarray]       # 位置（度）
+    parse_speeds_batch: Callable[[Sequence[bytes]], np.ndarray]          # 转速（RPM）
+    parse_temperatures_batch: Callable[[Sequence[bytes]], np.ndarray]    # 温度（°C）
+    
+    _opcode_parsers: Dict[int, Callable[[bytes], Any]]                  # opcode → 解析函数
+    
     def __init__(self, driver_type: Literal['ZDT'] = 'ZDT'):
         """
         初始化原生数据解析器
@@ -211,56 +346,26 @@ class NativeMotorData:
         Args:
             driver_type: 驱动板类型，当前支持 'ZDT'
         """
-        self.driver_type = driver_type
-        
-        # 根据驱动板类型选择解析函数
-        if driver_type == 'ZDT':
-            self._parse_position_impl = self._parse_zdt_position
-            self._parse_speed_impl = self._parse_zdt_speed
-            self._parse_temperature_impl = self._parse_zdt_temperature
-            self._parse_voltage_impl = self._parse_zdt_voltage
-            self._parse_current_impl = self._parse_zdt_current
-            self._parse_status_impl = self._parse_zdt_status
-            self._parse_homing_status_impl = self._parse_zdt_homing_status
-            self._parse_version_impl = self._parse_zdt_version
-        else:
+        impls = _NATIVE_PARSERS.get(driver_type)
+        if impls is None:
             raise ValueError(f"不支持的驱动板类型: {driver_type}")
+        self.driver_type = driver_type
+        self.__dict__.update(impls)
+        self._opcode_parsers = _NATIVE_OPCODE_PARSERS[driver_type]
     
-    # ========================================================================
-    # 通用接口（自动路由到对应厂商的实现）
-    # ========================================================================
-    
-    def parse_position(self, data: bytes) -> Optional[float]:
-        """解析实时位置（度）"""
-        return self._parse_position_impl(data)
-    
-    def parse_speed(self, data: bytes) -> Optional[float]:
-        """解析实时转速（RPM）"""
-        return self._parse_speed_impl(data)
-    
-    def parse_temperature(self, data: bytes) -> Optional[float]:
-        """解析温度（°C）"""
-        return self._parse_temperature_impl(data)
-    
-    def parse_voltage(self, data: bytes) -> Optional[float]:
-        """解析电压（V）"""
-        return self._parse_voltage_impl(data)
-    
-    def parse_current(self, data: bytes) -> Optional[float]:
-        """解析电流（A）"""
-        return self._parse_current_impl(data)
-    
-    def parse_status(self, data: bytes) -> Optional[Dict[str, bool]]:
-        """解析电机状态标志"""
-        return self._parse_status_impl(data)
-    
-    def parse_homing_status(self, data: bytes) -> Optional[Dict[str, bool]]:
-        """解析回零状态标志"""
-        return self._parse_homing_status_impl(data)
-    
-    def parse_version(self, data: bytes) -> Optional[Dict[str, str]]:
-        """解析版本信息"""
-        return self._parse_version_impl(data)
+    def parse(self, opcode: int, data: bytes) -> Any:
+        """
+        按原生读取 opcode 解析响应数据（统一入口，调用方无需自行按 opcode 分支）
+        
+        Args:
+            opcode: 原生读取 opcode（如 Opcode.READ_REALTIME_POSITION）
+            data: 响应数据
+        
+        Returns:
+            解析结果；opcode 没有对应解析函数或数据无效时返回 None
+        """
+        parser = self._opcode_parsers.get(opcode)
+        return parser(data) if parser is not None else None
     
     # ========================================================================
     # ZDT 厂商特定实现
@@ -282,17 +387,14 @@ class NativeMotorData:
         if not data or len(data) < 5:
             return None
         
-        try:
-            sign = data[0]
-            pos_raw = struct.unpack(">I", data[1:5])[0]  # 大端序
-            position = pos_raw * 0.1
-            
-            if sign == 1:
-                position = -position
-            
-            return position
-        except struct.error:
-            return None
+        sign = data[0]
+        pos_raw = _S_U32_BE.unpack_from(data, 1)[0]  # 大端序
+        position = pos_raw * 0.1
+        
+        if sign == 1:
+            position = -position
+        
+        return position
     
     @staticmethod
     def _parse_zdt_speed(data: bytes) -> Optional[float]:
@@ -310,17 +412,14 @@ class NativeMotorData:
         if not data or len(data) < 3:
             return None
         
-        try:
-            sign = data[0]
-            speed_raw = struct.unpack(">H", data[1:3])[0]  # 大端序
-            speed = speed_raw * 0.1
-            
-            if sign == 1:
-                speed = -speed
-            
-            return speed
-        except struct.error:
-            return None
+        sign = data[0]
+        speed_raw = _S_U16_BE.unpack_from(data, 1)[0]  # 大端序
+        speed = speed_raw * 0.1
+        
+        if sign == 1:
+            speed = -speed
+        
+        return speed
     
     @staticmethod
     def _parse_zdt_temperature(data: bytes) -> Optional[float]:
@@ -362,11 +461,8 @@ class NativeMotorData:
         if not data or len(data) < 2:
             return None
         
-        try:
-            mv = struct.unpack(">H", data[:2])[0]  # 大端序
-            return mv / 1000.0
-        except struct.error:
-            return None
+        mv = _S_U16_BE.unpack_from(data, 0)[0]  # 大端序
+        return mv / 1000.0
     
     @staticmethod
     def _parse_zdt_current(data: bytes) -> Optional[float]:
@@ -384,11 +480,8 @@ class NativeMotorData:
         if not data or len(data) < 2:
             return None
         
-        try:
-            ma = struct.unpack(">H", data[:2])[0]  # 大端序
-            return ma / 1000.0
-        except struct.error:
-            return None
+        ma = _S_U16_BE.unpack_from(data, 0)[0]  # 大端序
+        return ma / 1000.0
     
     @staticmethod
     def _parse_zdt_status(data: bytes) -> Optional[Dict[str, bool]]:
@@ -407,16 +500,9 @@ class NativeMotorData:
         Returns:
             dict: 状态标志字典，失败返回 None
         """
-        if not data or len(data) < 1:
+        if not data:
             return None
-        
-        flags = data[0]
-        return {
-            'enabled': bool(flags & 0x01),
-            'in_position': bool(flags & 0x02),
-            'stall_detected': bool(flags & 0x04),
-            'stall_protection': bool(flags & 0x08),
-        }
+        return _ZDT_STATUS_TABLE[data[0]].copy()
     
     @staticmethod
     def _parse_zdt_homing_status(data: bytes) -> Optional[Dict[str, bool]]:
@@ -436,17 +522,9 @@ class NativeMotorData:
         Returns:
             dict: 回零状态字典，失败返回 None
         """
-        if not data or len(data) < 1:
+        if not data:
             return None
-        
-        flags = data[0]
-        return {
-            'encoder_ready': bool(flags & 0x01),
-            'encoder_calibrated': bool(flags & 0x02),
-            'homing_in_progress': bool(flags & 0x04),
-            'homing_failed': bool(flags & 0x08),
-            'high_precision': bool(flags & 0x80),
-        }
+        return _ZDT_HOMING_TABLE[data[0]].copy()
     
     @staticmethod
     def _parse_zdt_version(data: bytes) -> Optional[Dict[str, str]]:
@@ -464,16 +542,60 @@ class NativeMotorData:
         if not data or len(data) < 4:
             return None
         
-        try:
-            fw_ver = struct.unpack(">H", data[0:2])[0]
-            hw_ver = struct.unpack(">H", data[2:4])[0]
-            
-            return {
-                'firmware': f"{fw_ver // 100}.{fw_ver % 100:02d}",
-                'hardware': f"{hw_ver // 100}.{hw_ver % 100:02d}",
-            }
-        except struct.error:
-            return None
+        firmware, hardware = _format_zdt_version(*_S_U16X2_BE.unpack_from(data, 0))
+        return {'firmware': firmware, 'hardware': hardware}
+    
+    @staticmethod
+    def _parse_zdt_positions_batch(frames: Sequence[bytes]) -> np.ndarray:
+        """批量解析 ZDT 位置数据（逐项结果与 _parse_zdt_position 一致，无效帧为 NaN）"""
+        return _parse_zdt_signed_batch(frames, _ZDT_POS_DT, _ZDT_SIGN_SCALE_01)
+    
+    @staticmethod
+    def _parse_zdt_speeds_batch(frames: Sequence[bytes]) -> np.ndarray:
+        """批量解析 ZDT 速度数据（逐项结果与 _parse_zdt_speed 一致，无效帧为 NaN）"""
+        return _parse_zdt_signed_batch(frames, _ZDT_SPEED_DT, _ZDT_SIGN_SCALE_01)
+    
+    @staticmethod
+    def _parse_zdt_temperatures_batch(frames: Sequence[bytes]) -> np.ndarray:
+        """批量解析 ZDT 温度数据（逐项结果与 _parse_zdt_temperature 一致，无效帧为 NaN）"""
+        return _parse_zdt_signed_batch(frames, _ZDT_TEMP_DT, _ZDT_SIGN_SCALE_1)
+
+
+# 驱动板类型 → 通用接口名 → 厂商解析函数（均为静态函数，直接放入实例字典无需绑定）
+_NATIVE_PARSERS = {
+    'ZDT': {
+        'parse_position': NativeMotorData._parse_zdt_position,
+        'parse_speed': NativeMotorData._parse_zdt_speed,
+        'parse_temperature': NativeMotorData._parse_zdt_temperature,
+        'parse_voltage': NativeMotorData._parse_zdt_voltage,
+        'parse_current': NativeMotorData._parse_zdt_current,
+        'parse_status': NativeMotorData._parse_zdt_status,
+        'parse_homing_status': NativeMotorData._parse_zdt_homing_status,
+        'parse_version': NativeMotorData._parse_zdt_version,
+        'parse_positions_batch': NativeMotorData._parse_zdt_positions_batch,
+        'parse_speeds_batch': NativeMotorData._parse_zdt_speeds_batch,
+        'parse_temperatures_batch': NativeMotorData._parse_zdt_temperatures_batch,
+    },
+}
+
+
+# 驱动板类型 → 原生读取 opcode → 解析函数（NativeMotorData.parse 的分发表）
+_NATIVE_OPCODE_PARSERS = {
+    'ZDT': {
+        Opcode.READ_REALTIME_POSITION: NativeMotorData._parse_zdt_position,
+        Opcode.READ_REALTIME_SPEED: NativeMotorData._parse_zdt_speed,
+        Opcode.READ_TEMPERATURE: NativeMotorData._parse_zdt_temperature,
+        Opcode.READ_MOTOR_STATUS: NativeMotorData._parse_zdt_status,
+        Opcode.READ_HOMING_STATUS: NativeMotorData._parse_zdt_homing_status,
+        Opcode.READ_BUS_VOLTAGE: NativeMotorData._parse_zdt_voltage,
+        Opcode.READ_BUS_CURRENT: NativeMotorData._parse_zdt_current,
+        Opcode.READ_PHASE_CURRENT: NativeMotorData._parse_zdt_current,
+        Opcode.READ_POSITION_ERROR: NativeMotorData._parse_zdt_position,
+        Opcode.READ_TARGET_POSITION: NativeMotorData._parse_zdt_position,
+        Opcode.READ_REALTIME_TARGET_POSITION: NativeMotorData._parse_zdt_position,
+        Opcode.READ_VERSION: NativeMotorData._parse_zdt_version,
+    },
+}
 
 
 # ============================================================================
@@ -485,10 +607,30 @@ def hex_bytes(data: bytes) -> str:
     return ' '.join(f'{b:02X}' for b in data)
 
 
+# 解析器只持有构造时确定的解析函数，不保存任何可变状态，因此可以按驱动板类型共享实例
+_STANDARD_PARSER = StandardMotorData()
+
+
+@lru_cache(maxsize=8)
+def get_native_parser(driver_type: str = 'ZDT') -> NativeMotorData:
+    """
+    获取指定驱动板类型的共享原生解析器（每种类型只构造一次）
+    
+    Args:
+        driver_type: 驱动板类型，当前支持 'ZDT'
+    
+    Returns:
+        NativeMotorData 实例（只读使用）
+    """
+    return NativeMotorData(driver_type=driver_type)
+
+
 def create_parser(mode: Literal['standard', 'native'] = 'standard', 
                   driver_type: str = 'ZDT'):
     """
-    工厂函数：创建解析器实例
+    工厂函数：获取解析器实例
+    
+    解析器无内部可变状态，同一模式/驱动板类型返回共享实例（可跨线程复用）
     
     Args:
         mode: 'standard' 或 'native'
@@ -507,9 +649,9 @@ def create_parser(mode: Literal['standard', 'native'] = 'standard',
         position = parser.parse_position(resp.data)
     """
     if mode == 'standard':
-        return StandardMotorData()
+        return _STANDARD_PARSER
     elif mode == 'native':
-        return NativeMotorData(driver_type=driver_type)
+        return get_native_parser(driver_type)
     else:
         raise ValueError(f"不支持的模式: {mode}，请使用 'standard' 或 'native'")
 
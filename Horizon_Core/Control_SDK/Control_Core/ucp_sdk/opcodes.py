@@ -4,8 +4,13 @@
 UCP Opcode 定义
 
 所有 opcode 与 OmniCAN 固件对齐
+
+模块级常量保持为普通 int（下发请求、vars(opcodes) 扫描均依赖这一点）；
+文件末尾的 Opcode 枚举由这些常量生成，用于按 opcode 查表分发与调试时显示名称。
 """
 
+from enum import IntEnum, unique
+
 # ============================================================================
 # 基础控制命令 (0x01-0x0F)
 # ============================================================================
@@ -99,3 +104,14 @@ TRAJECTORY_EXECUTE = 0x71       # 执行已上传的轨迹
 TRAJECTORY_STOP = 0x72          # 停止轨迹执行
 TRAJECTORY_STATUS = 0x73        # 查询轨迹执行状态
 
+# ============================================================================
+# 枚举视图
+# ============================================================================
+
+# 由上面的常量生成；@unique 保证新增常量时不会与已有 opcode 撞值。
+# 成员与 int 等值且哈希相同，可直接作为以 int opcode 为键的分发表的键
+Opcode = unique(IntEnum("Opcode", {
+    name: value for name, value in globals().items()
+    if name.isupper() and isinstance(value, int)
+}))
+
@@ -9,8 +9,9 @@ from __future__ import annotations
 import struct
 import time
 from dataclasses import dataclass
-from typing import Optional
+from typing import List, Optional, Sequence, Tuple, Union
 
+import numpy as np
 import serial
 from serial.tools import list_ports
 from threading import Lock
@@ -26,38 +27,106 @@ from .constants import (
 
 @dataclass
 class UcpResponse:
-    """UCP 响应数据结构"""
-    status: int         # 状态码 (0=成功)
-    err_code: int       # 错误码
-    data: bytes         # 响应数据
-    diag: bytes         # 诊断信息
+    """UCP 响应数据结构（字段总是完整填充，调用方可直接属性访问）"""
+    status: int = 0         # 状态码 (0=成功)
+    err_code: int = 0       # 错误码
+    data: bytes = b""       # 响应数据
+    diag: bytes = b""       # 诊断信息
 
 
 # ============================================================================
 # UCP 协议工具函数
 # ============================================================================
 
+# 预编译的帧/TLV 定宽格式（小端），避免每次 pack/unpack 重新解析格式串
+_REQ_HDR = struct.Struct("<BBHH")    # ver | type | seq | len
+_TLV_HDR = struct.Struct("<BH")      # tag | len
+_U8 = struct.Struct("<B")
+_U16 = struct.Struct("<H")
+_U16X2 = struct.Struct("<HH")
+# 请求帧定长前缀：帧头 | ver | type | seq | len | MOTOR_ID/DRIVER/OPCODE/TIMEOUT_MS 四个 TLV | ARGS 的 TLV 头
+_REQ_PREFIX = struct.Struct("<2sBBHH" + "BHB" * 3 + "BHH" + "BH")
+_REQ_FIXED_TLV_LEN = _REQ_PREFIX.size - 8
+
+def _gen_crc16_table() -> tuple:
+    """生成 CRC16-IBM（反射多项式 0xA001）的 256 项字节查找表"""
+    table = []
+    for i in range(256):
+        crc = i
+        for _ in range(8):
+            crc = (crc >> 1) ^ 0xA001 if crc & 1 else crc >> 1
+        table.append(crc)
+    return tuple(table)
+
+
+# 模块导入时生成一次：逐字节查表代替逐位 8 次移位/异或
+_CRC16_TABLE = _gen_crc16_table()
+
+# 大负载（轨迹上传等）走 numpy 分块路径的块长与阈值
+_CRC_BLOCK = 64
+_CRC_NP_MIN_LEN = 128
+
+
+def _gen_crc16_block_tables() -> tuple:
+    """
+    生成分块 CRC 所需的 numpy 表
+
+    CRC 对数据按 GF(2) 线性，故一个 64 字节块从零状态出发的贡献等于各字节
+    贡献的异或：_CRC_POS_TABLE[i][b] 即字节 b 位于块内第 i 位时的贡献。
+    块间推进状态需要把 16 位 crc 走过 64 个零字节，拆成低/高字节两张 256 项表。
+    """
+    table = np.asarray(_CRC16_TABLE, dtype=np.uint16)
+
+    def zero_step(v):
+        return (v >> 8) ^ table[v & 0xFF]
+
+    pos = np.empty((_CRC_BLOCK, 256), dtype=np.uint16)
+    pos[-1] = table
+    for i in range(_CRC_BLOCK - 2, -1, -1):
+        pos[i] = zero_step(pos[i + 1])
+
+    lo = np.arange(256, dtype=np.uint16)
+    hi = lo << 8
+    for _ in range(_CRC_BLOCK):
+        lo = zero_step(lo)
+        hi = zero_step(hi)
+    return pos, tuple(lo.tolist()), tuple(hi.tolist())
+
+
+_CRC_POS_TABLE, _CRC_SHIFT_LO, _CRC_SHIFT_HI = _gen_crc16_block_tables()
+_CRC_POS_INDEX = np.arange(_CRC_BLOCK)
+
+
 def crc16_ibm(data: bytes) -> int:
     """
-    计算 CRC16-IBM 校验码
+    计算 CRC16-IBM 校验码（查表法，支持 bytes/bytearray/memoryview）
     
     多项式: 0xA001
     初始值: 0xFFFF
+
+    长度 >= 128 字节时整块部分由 numpy 一次查表+按块异或归约求出各块贡献，
+    Python 层只需每 64 字节推进一次状态；余下不足一块的字节仍逐字节查表。
     """
     crc = 0xFFFF
+    tbl = _CRC16_TABLE
+    n_blocks = len(data) // _CRC_BLOCK if len(data) >= _CRC_NP_MIN_LEN else 0
+    if n_blocks:
+        blocks = np.frombuffer(data, dtype=np.uint8, count=n_blocks * _CRC_BLOCK)
+        blocks = blocks.reshape(n_blocks, _CRC_BLOCK)
+        parts = np.bitwise_xor.reduce(_CRC_POS_TABLE[_CRC_POS_INDEX, blocks], axis=1)
+        shift_lo = _CRC_SHIFT_LO
+        shift_hi = _CRC_SHIFT_HI
+        for part in parts.tolist():
+            crc = shift_lo[crc & 0xFF] ^ shift_hi[crc >> 8] ^ part
+        data = memoryview(data)[n_blocks * _CRC_BLOCK:]
     for b in data:
-        crc ^= b
-        for _ in range(8):
-            lsb = crc & 1
-            crc >>= 1
-            if lsb:
-                crc ^= 0xA001
-    return crc & 0xFFFF
+        crc = (crc >> 8) ^ tbl[(crc ^ b) & 0xFF]
+    return crc
 
 
 def tlv(tag: int, value: bytes) -> bytes:
     """构建 TLV 数据块"""
-    return bytes([tag]) + struct.pack("<H", len(value)) + value
+    return _TLV_HDR.pack(tag, len(value)) + value
 
 
 def build_ucp_request(seq: int, payload_tlvs: bytes) -> bytes:
@@ -66,90 +135,115 @@ def build_ucp_request(seq: int, payload_tlvs: bytes) -> bytes:
     
     格式: 0x55 0xAA | ver | type | seq(u16) | len(u16) | payload | crc16(u16)
     """
-    header = struct.pack("<BBHH", UCP_VERSION, UCP_TYPE_REQUEST, seq, len(payload_tlvs))
+    header = _REQ_HDR.pack(UCP_VERSION, UCP_TYPE_REQUEST, seq, len(payload_tlvs))
     crc = crc16_ibm(header + payload_tlvs)
-    return b"\x55\xAA" + header + payload_tlvs + struct.pack("<H", crc)
+    return b"\x55\xAA" + header + payload_tlvs + _U16.pack(crc)
 
 
 def parse_tlvs(buf: bytes) -> dict:
-    """解析 TLV 数据块"""
+    """
+    解析 TLV 数据块
+
+    值为 buf 上的 memoryview 切片（零拷贝），buf 须在使用期间保持不变；
+    需要长期持有的值由调用方自行转成 bytes。
+    """
     out = {}
+    mv = memoryview(buf)
+    end = len(mv)
+    unpack_hdr = _TLV_HDR.unpack_from
     i = 0
-    while i + 3 <= len(buf):
-        tag = buf[i]
-        length = buf[i + 1] | (buf[i + 2] << 8)
+    while i + 3 <= end:
+        tag, length = unpack_hdr(mv, i)
         i += 3
-        if i + length > len(buf):
+        if i + length > end:
             break
-        out[tag] = buf[i:i + length]
+        out[tag] = mv[i:i + length]
         i += length
     return out
 
 
-def read_ucp_frame(ser: serial.Serial, timeout_s: float = 2.0) -> tuple:
+def read_ucp_frame(ser: serial.Serial, timeout_s: float = 2.0, buf: Optional[bytearray] = None) -> tuple:
     """
     读取 UCP 响应帧
     
+    Args:
+        buf: 可选的接收缓冲区；传入时本帧之后的剩余字节保留在其中，供下一次读取继续使用
+            （流水线请求时多个响应可能在同一次 read 中到达）
+    
     Returns:
         (type, seq, payload)
     """
     # 低延迟 + 稳定性平衡：
     # - 使用很小的 blocking timeout，避免 0.0 造成“忙等/平台差异”
     # - 优先读取 in_waiting，但在无数据时允许短暂阻塞等待数据到达
-    ser.timeout = 0.02
+    # pyserial 每次给 timeout 赋值都会重新配置端口，值未变时不重复设置
+    if ser.timeout != 0.02:
+        ser.timeout = 0.02
     start = time.time()
-    data = bytearray()
+    data = buf if buf is not None else bytearray()
 
     def try_extract():
-        # 查找帧头 0x55 0xAA
-        for j in range(len(data) - 1):
-            if data[j] == 0x55 and data[j + 1] == 0xAA:
-                if len(data) < j + 2 + 6:  # 至少需要头部
-                    return None
-                
-                frame_type = data[j + 3]
-                seq = data[j + 4] | (data[j + 5] << 8)
-                payload_len = data[j + 6] | (data[j + 7] << 8)
-                total = 2 + 6 + payload_len + 2
-                
-                if len(data) < j + total:
-                    return None
-                
-                frame = bytes(data[j:j + total])
-                header = frame[2:2 + 6]
-                payload = frame[2 + 6:2 + 6 + payload_len]
-                got_crc = frame[-2] | (frame[-1] << 8)
-                calc_crc = crc16_ibm(header + payload)
-                
-                if got_crc != calc_crc:
-                    # CRC 错误，跳过这个字节继续查找
-                    del data[:j + 1]
-                    return None
-                
-                # 成功提取帧
-                del data[:j + total]
-                return frame_type, seq, payload
+        # 查找帧头 0x55 0xAA（bytearray.find 在 C 层扫描）
+        j = data.find(b"\x55\xAA")
+        if j < 0:
+            # 没有帧头：其余字节都是噪声，只保留末尾可能是半个帧头的 0x55
+            if data and data[-1] == 0x55:
+                del data[:-1]
+            else:
+                data.clear()
+            return None
+
+        if len(data) < j + 2 + 6:  # 至少需要头部
+            return None
+        
+        frame_type = data[j + 3]
+        seq, payload_len = _U16X2.unpack_from(data, j + 4)
+        total = 2 + 6 + payload_len + 2
         
-        # 防止缓冲区无限增长
-        if len(data) > 2048:
-            del data[:-2]
-        return None
+        if len(data) < j + total:
+            return None
+        
+        # 在接收缓冲区上直接校验（零拷贝），只有校验通过才拷出 payload；
+        # memoryview 存在期间 bytearray 不能改变大小，须在 del 之前退出 with 释放
+        body_end = j + 2 + 6 + payload_len
+        with memoryview(data) as mv:
+            got_crc = _U16.unpack_from(mv, body_end)[0]
+            calc_crc = crc16_ibm(mv[j + 2:body_end])
+            payload = bytes(mv[j + 2 + 6:body_end]) if got_crc == calc_crc else None
+        
+        if payload is None:
+            # CRC 错误，跳过这个字节继续查找
+            del data[:j + 1]
+            return None
+        
+        # 成功提取帧
+        del data[:j + total]
+        return frame_type, seq, payload
 
-    while time.time() - start < timeout_s:
+    if data:
+        result = try_extract()
+        if result:
+            return result
+
+    while True:
+        remaining = timeout_s - (time.time() - start)
+        if remaining <= 0:
+            break
+        if remaining < ser.timeout:
+            # 临近截止时缩短阻塞时间，避免超出调用方给定的超时
+            ser.timeout = max(0.001, remaining)
         n = 0
         try:
             n = int(getattr(ser, "in_waiting", 0) or 0)
         except Exception:
             n = 0
-        # 有多少读多少；没有数据时读 1 个字节以触发底层轮询，但不阻塞
+        # 有多少读多少；没有数据时阻塞读 1 个字节，首字节到达即由内核唤醒返回，无需额外 sleep
         chunk = ser.read(min(512, n) if n > 0 else 1)
         if chunk:
             data.extend(chunk)
             result = try_extract()
             if result:
                 return result
-        else:
-            time.sleep(0.001)
     
     raise TimeoutError("等待 UCP 响应超时")
 
@@ -181,6 +275,9 @@ class UcpClient:
         client.disconnect()
     """
     
+    # 实例属性固定，声明为 slots：连接池/热路径上的属性读取走 slot 描述符，且不再为每个客户端分配 __dict__
+    __slots__ = ("port", "baud", "driver_type", "ser", "seq", "_connected", "_io_lock")
+    
     def __init__(self, port: str = 'COM13', baud: int = 115200, driver_type: int = DriverType.ZDT):
         """
         初始化 UCP 客户端
@@ -195,6 +292,8 @@ class UcpClient:
         self.driver_type = driver_type
         self.ser: Optional[serial.Serial] = None
         self.seq: int = 1
+        # 由 UcpConnectionPool 维护的“已打开”标记（共享连接只打开一次）
+        self._connected: bool = False
         # 关键：共享串口连接池下必须串行化 request/response，防止多线程/多对象并发导致响应串扰与超时
         self._io_lock = Lock()
     
@@ -242,7 +341,7 @@ class UcpClient:
         self, 
         motor_id: int, 
         opcode: int, 
-        args: bytes = b"", 
+        args: Union[bytes, bytearray, memoryview] = b"", 
         timeout_ms: int = 1000,
         driver_type: Optional[int] = None
     ) -> UcpResponse:
@@ -252,7 +351,8 @@ class UcpClient:
         Args:
             motor_id: 电机 ID (0-255, 0为广播)
             opcode: 操作码
-            args: 参数字节 (小端序)
+            args: 参数字节 (小端序)；也可传 bytearray/memoryview（如线程私有暂存区的切片），
+                组帧时直接拷入请求帧，调用返回后不再引用
             timeout_ms: 超时时间 (毫秒)
             driver_type: 驱动板类型 (不指定则使用默认值)
         
@@ -278,18 +378,11 @@ class UcpClient:
             except Exception:
                 pass
 
-            # 构建 TLV 载荷
+            # 构建请求帧
             driver = driver_type if driver_type is not None else self.driver_type
-            payload = b"".join([
-                tlv(TlvTags.MOTOR_ID, struct.pack("<B", motor_id)),
-                tlv(TlvTags.DRIVER, struct.pack("<B", driver)),
-                tlv(TlvTags.OPCODE, struct.pack("<B", opcode)),
-                tlv(TlvTags.TIMEOUT_MS, struct.pack("<H", timeout_ms)),
-                tlv(TlvTags.ARGS, args),
-            ])
+            frame = self._build_frame(self.seq, motor_id, opcode, args, timeout_ms, driver)
             
             # 发送请求
-            frame = build_ucp_request(self.seq, payload)
             self.ser.write(frame)
             self.ser.flush()
             
@@ -305,20 +398,121 @@ class UcpClient:
                 f"(期望 type=0x{UCP_TYPE_RESPONSE:02X} seq={self.seq})"
             )
         
-        # 解析 TLV
+        # 更新请求序号
+        self._advance_seq()
+        
+        return self._parse_response(rpayload)
+
+    def request_pipelined(
+        self,
+        requests: Sequence[Tuple[int, int, bytes]],
+        timeout_ms: int = 1000,
+        depth: int = 2,
+    ) -> List[UcpResponse]:
+        """
+        流水线发送一组请求：最多 depth 个请求在途，按序号顺序收取响应
+        
+        与逐个调用 request() 相比，省去 (depth-1) 个往返等待；固件须能缓存排队到达的请求帧。
+        任一响应超时/序号不匹配时抛出异常，此时在途请求的执行情况未知，调用方应整体重试。
+        
+        Args:
+            requests: [(motor_id, opcode, args), ...]
+            timeout_ms: 单个请求的超时时间 (毫秒)
+            depth: 最大在途请求数 (>=1)
+        
+        Returns:
+            List[UcpResponse]: 与 requests 一一对应的响应
+        
+        Raises:
+            RuntimeError: 未连接或通信错误
+            TimeoutError: 超时
+        """
+        if not self.ser:
+            raise RuntimeError("未连接串口，请先调用 connect()")
+        depth = max(1, int(depth))
+        read_timeout = max(0.6, timeout_ms / 1000.0 + 0.5)
+        responses: List[UcpResponse] = []
+        
+        with self._io_lock:
+            try:
+                n0 = int(getattr(self.ser, "in_waiting", 0) or 0)
+                if n0 > 0:
+                    _ = self.ser.read(n0)
+            except Exception:
+                pass
+            
+            rx = bytearray()
+            pending: List[int] = []  # 在途请求的序号（按发送顺序）
+            it = iter(requests)
+            exhausted = False
+            while True:
+                # 补满发送窗口
+                while not exhausted and len(pending) < depth:
+                    req = next(it, None)
+                    if req is None:
+                        exhausted = True
+                        break
+                    motor_id, opcode, args = req
+                    self.ser.write(self._build_frame(self.seq, motor_id, opcode, args,
+                                                     timeout_ms, self.driver_type))
+                    pending.append(self.seq)
+                    self._advance_seq()
+                if not pending:
+                    break
+                self.ser.flush()
+                
+                expected = pending.pop(0)
+                frame_type, rseq, rpayload = read_ucp_frame(self.ser, timeout_s=read_timeout, buf=rx)
+                if frame_type != UCP_TYPE_RESPONSE or rseq != expected:
+                    raise RuntimeError(
+                        f"收到不匹配响应: type=0x{frame_type:02X} seq={rseq} "
+                        f"(期望 type=0x{UCP_TYPE_RESPONSE:02X} seq={expected})"
+                    )
+                responses.append(self._parse_response(rpayload))
+        
+        return responses
+
+    @staticmethod
+    def _build_frame(seq: int, motor_id: int, opcode: int, args: Union[bytes, bytearray, memoryview],
+                     timeout_ms: int, driver: int) -> bytearray:
+        """
+        构建完整请求帧（与 build_ucp_request(seq, TLV 载荷) 逐字节一致）
+
+        一次分配 bytearray：定长前缀 pack_into，args 拷入尾部，CRC 直接在帧内计算后写回。
+        """
+        n_args = len(args)
+        prefix_len = _REQ_PREFIX.size
+        frame = bytearray(prefix_len + n_args + 2)
+        _REQ_PREFIX.pack_into(
+            frame, 0,
+            b"\x55\xAA", UCP_VERSION, UCP_TYPE_REQUEST, seq, _REQ_FIXED_TLV_LEN + n_args,
+            TlvTags.MOTOR_ID, 1, motor_id,
+            TlvTags.DRIVER, 1, driver,
+            TlvTags.OPCODE, 1, opcode,
+            TlvTags.TIMEOUT_MS, 2, timeout_ms,
+            TlvTags.ARGS, n_args,
+        )
+        frame[prefix_len:prefix_len + n_args] = args
+        with memoryview(frame) as mv:
+            _U16.pack_into(frame, prefix_len + n_args, crc16_ibm(mv[2:prefix_len + n_args]))
+        return frame
+
+    @staticmethod
+    def _parse_response(rpayload: bytes) -> UcpResponse:
+        """解析响应 TLV 载荷"""
         tlvs = parse_tlvs(rpayload)
         status = tlvs.get(TlvTags.STATUS, b"\xFF")[0]
         err_bytes = tlvs.get(TlvTags.ERR_CODE, b"\x00\x00")
-        err_code = err_bytes[0] | (err_bytes[1] << 8) if len(err_bytes) == 2 else 0
-        data = tlvs.get(TlvTags.DATA, b"")
-        diag = tlvs.get(TlvTags.DIAG, b"")
-        
-        # 更新请求序号
+        err_code = _U16.unpack_from(err_bytes)[0] if len(err_bytes) == 2 else 0
+        data = bytes(tlvs.get(TlvTags.DATA, b""))
+        diag = bytes(tlvs.get(TlvTags.DIAG, b""))
+        return UcpResponse(status=status, err_code=err_code, data=data, diag=diag)
+
+    def _advance_seq(self) -> None:
+        """更新请求序号（跳过 0）"""
         self.seq = (self.seq + 1) & 0xFFFF
         if self.seq == 0:
             self.seq = 1
-        
-        return UcpResponse(status=status, err_code=err_code, data=data, diag=diag)
     
     @staticmethod
     def list_ports() -> list:
@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+"""
+Y42 批量合帧测试（无需硬件：用假 client 记录下发的 UCP 请求）
+
+运行：
+    python test_y42_batch.py
+"""
+
+import os
+import sys
+import unittest
+
+# 确保导入路径
+sys.path.insert(0, os.path.dirname(__file__))
+
+from Control_Core import ZDTMotorController
+from Control_Core.ucp_sdk import UcpResponse, opcodes
+
+
+class FakeClient:
+    """记录所有请求并返回成功响应的假 UCP client"""
+
+    def __init__(self):
+        self.sent = []
+
+    def request(self, motor_id, opcode, args=b"", timeout_ms=1000, driver_type=None):
+        self.sent.append((motor_id, opcode, bytes(args)))
+        return UcpResponse(status=0, err_code=0, data=b"", diag=b"")
+
+
+def make_controllers(client, motor_ids=(1, 2, 3)):
+    """构造共用同一个假 client 的控制器字典"""
+    ctrls = {}
+    for motor_id in motor_ids:
+        ctrl = ZDTMotorController(motor_id=motor_id, port="FAKE", auto_connect=False, shared_interface=False)
+        ctrl.client = client
+        ctrls[motor_id] = ctrl
+    return ctrls
+
+
+class Y42BatchTest(unittest.TestCase):
+
+    def setUp(self):
+        ZDTMotorController.y42_batch_discard()
+        self.client = FakeClient()
+        self.ctrls = make_controllers(self.client)
+
+    def tearDown(self):
+        ZDTMotorController.y42_batch_discard()
+
+    def test_staging_merges_into_one_frame(self):
+        ZDTMotorController.y42_batch_begin()
+        resp = self.ctrls[1].y42_request_batch([(1, 1.0, 100.0), (2, 2.0, 100.0)])
+        self.assertIsNone(resp)
+        ZDTMotorController.y42_sync_enable(self.ctrls, True)
+        self.assertEqual(self.client.sent, [])
+
+        resp = ZDTMotorController.y42_batch_flush()
+        self.assertEqual(resp.status, 0)
+        self.assertEqual(len(self.client.sent), 1)
+        motor_id, opcode, args = self.client.sent[0]
+        self.assertEqual((motor_id, opcode), (0, opcodes.Y42_MULTI_MOTOR))
+        # 2 条位置子命令(12B) + 3 条使能子命令(5B)
+        self.assertEqual(len(args), 4 + 2 * 12 + 3 * 5 + 1)
+        self.assertFalse(ZDTMotorController._y42_batch_active())
+
+    def test_context_manager_flushes_on_success(self):
+        with ZDTMotorController.y42_batch():
+            ZDTMotorController.y42_sync_position(self.ctrls, {1: 1.0, 2: 2.0}, speed=100)
+            ZDTMotorController.y42_sync_enable(self.ctrls, True)
+        self.assertEqual(len(self.client.sent), 1)
+        self.assertFalse(ZDTMotorController._y42_batch_active())
+
+    def test_context_manager_discards_on_exception(self):
+        with self.assertRaises(KeyError):
+            with ZDTMotorController.y42_batch():
+                ZDTMotorController.y42_sync_position(self.ctrls, {1: 1.0}, speed=100)
+                raise KeyError("boom")
+        self.assertEqual(self.client.sent, [])
+        self.assertFalse(ZDTMotorController._y42_batch_active())
+
+        # 之后的安全命令必须立即下发，而不是继续被暂存
+        ZDTMotorController.y42_sync_enable(self.ctrls, False)
+        self.assertEqual(len(self.client.sent), 1)
+
+    @unittest.skipIf(ZDTMotorController._load_joint_limits() is None, "未找到关节限位配置")
+    def test_limit_error_inside_batch_discards(self):
+        with self.assertRaises(RuntimeError):
+            with ZDTMotorController.y42_batch():
+                ZDTMotorController.y42_sync_enable(self.ctrls, True)
+                ZDTMotorController.y42_sync_position(self.ctrls, {1: 99999.0}, speed=100)
+        self.assertEqual(self.client.sent, [])
+        self.assertFalse(ZDTMotorController._y42_batch_active())
+
+    def test_discard_returns_staged_count(self):
+        ZDTMotorController.y42_batch_begin()
+        ZDTMotorController.y42_sync_enable(self.ctrls, True)
+        ZDTMotorController.y42_sync_position(self.ctrls, {1: 1.0}, speed=100)
+        self.assertEqual(ZDTMotorController.y42_batch_discard(), 2)
+        self.assertEqual(ZDTMotorController.y42_batch_discard(), 0)
+        self.assertIsNone(ZDTMotorController.y42_batch_flush())
+        self.assertEqual(self.client.sent, [])
+
+    def test_begin_twice_raises(self):
+        ZDTMotorController.y42_batch_begin()
+        with self.assertRaises(RuntimeError):
+            ZDTMotorController.y42_batch_begin()
+
+    def test_frame_size_cap(self):
+        targets = {1: 1.0, 2: 2.0, 3: 3.0}
+        with self.assertRaises(ValueError):
+            with ZDTMotorController.y42_batch():
+                # 每次 3 条 12B 子命令：第 14 次时合帧 args 超过 492B
+                for _ in range(14):
+                    ZDTMotorController.y42_sync_position(self.ctrls, targets, speed=100)
+        self.assertEqual(self.client.sent, [])
+        self.assertFalse(ZDTMotorController._y42_batch_active())
+
+        # 上限以内正常合帧：4 + 13*36 + 1 = 473B
+        with ZDTMotorController.y42_batch():
+            for _ in range(13):
+                ZDTMotorController.y42_sync_position(self.ctrls, targets, speed=100)
+        self.assertEqual(len(self.client.sent), 1)
+        self.assertEqual(len(self.client.sent[0][2]), 473)
+
+    def test_multi_controller_same_client(self):
+        # 同一串口上的多个控制器（不同电机）可以合进同一帧
+        with ZDTMotorController.y42_batch():
+            ZDTMotorController.y42_sync_position({1: self.ctrls[1]}, {1: 1.0}, speed=100)
+            ZDTMotorController.y42_sync_position({2: self.ctrls[2]}, {2: 2.0}, speed=100)
+        self.assertEqual(len(self.client.sent), 1)
+        self.assertEqual(len(self.client.sent[0][2]), 4 + 2 * 12 + 1)
+
+    def test_multi_controller_other_port_rejected(self):
+        other_client = FakeClient()
+        other = make_controllers(other_client, motor_ids=(1,))
+        with self.assertRaises(ValueError):
+            with ZDTMotorController.y42_batch():
+                ZDTMotorController.y42_sync_position({1: self.ctrls[1]}, {1: 1.0}, speed=100)
+                ZDTMotorController.y42_sync_position(other, {1: 2.0}, speed=100)
+        self.assertEqual(self.client.sent, [])
+        self.assertEqual(other_client.sent, [])
+        self.assertFalse(ZDTMotorController._y42_batch_active())
+
+
+if __name__ == "__main__":
+    unittest.main()